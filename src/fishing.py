@@ -1,3 +1,4 @@
+import re
 import threading
 import time
 import mss
@@ -6,6 +7,47 @@ import win32api
 import win32con
 import keyboard
 
+try:
+    from src.spawn_watcher import SpawnWatcher
+    from src.telemetry import CastTracker
+except ImportError:
+    from spawn_watcher import SpawnWatcher
+    from telemetry import CastTracker
+
+PITY_COUNTER_PATTERN = re.compile(r'\b(\d{1,3})\s*/\s*(\d{1,3})\b')
+MAX_PITY = 100
+
+def classify_pity(drop_text):
+    """
+    Classify a drop banner using a single precompiled pity counter regex
+    Legendary drops show a reset counter (0/37, 0/40, 0/92, 0/100)
+    
+    Returns:
+        Dict with is_legendary, has_legendary_keyword and pity_counters [(current, maximum), ...]
+    """
+    pity_counters = []
+    for current, maximum in PITY_COUNTER_PATTERN.findall(drop_text or ''):
+        current, maximum = int(current), int(maximum)
+        if 1 <= maximum <= MAX_PITY and current <= maximum:
+            pity_counters.append((current, maximum))
+    
+    has_legendary_keyword = 'legendary' in (drop_text or '').lower()
+    has_legendary_pity = any(current == 0 for current, _ in pity_counters)
+    
+    return {
+        'is_legendary': has_legendary_keyword or has_legendary_pity,
+        'has_legendary_keyword': has_legendary_keyword,
+        'has_legendary_pity': has_legendary_pity,
+        'pity_counters': pity_counters
+    }
+
+def format_pity(pity_counters, is_legendary=False):
+    """'0/40, 3/92 (LEGENDARY)' style summary of pity counters ('' when there are none)"""
+    if not pity_counters:
+        return ''
+    counters = ', '.join(f"{current}/{maximum}" for current, maximum in pity_counters)
+    return f"{counters}{' (LEGENDARY)' if is_legendary else ''}"
+
 class FishingBot:
     def __init__(self, app):
         self.app = app
@@ -16,6 +58,9 @@ class FishingBot:
         self.force_stop_flag = False
         self.last_fruit_spawn_time = 0                                            
         self.fruit_spawn_cooldown = 15 * 60                                             
+        self.spawn_watcher = SpawnWatcher()
+        self.spawn_stats_interval = 10 * 60
+        self.last_spawn_stats_time = time.time()
     
     def check_recovery_needed(self):
         """Smart recovery check - detects genuinely stuck states"""
@@ -127,6 +172,7 @@ class FishingBot:
         self.app.last_recovery_time = current_time
         
         self.app.log(f'🔄 RESTARTING LOOP #{self.app.recovery_count}/5 - Fishing got stuck', "important")
+        self.app.record_event('recovery', detail=f'loop_restart #{self.app.recovery_count}')
         
                                           
         try:
@@ -177,6 +223,7 @@ class FishingBot:
         self.app.last_recovery_time = current_time
         
         self.app.log(f'💥 FORCE RECOVERY #{self.app.recovery_count}/3 - NUKING EVERYTHING', "error")
+        self.app.record_event('recovery', detail=f'force_recovery #{self.app.recovery_count}')
         
                       
         if hasattr(self.app, 'webhook_manager'):
@@ -257,6 +304,12 @@ class FishingBot:
         print("Casting line...")
         self.app.cast_line()
     
+    def _finish_cast(self, tracker, outcome):
+        """Send a cast's timings and PD statistics to the telemetry writer"""
+        telemetry = getattr(self.app, 'telemetry', None)
+        if telemetry is not None:
+            telemetry.record('cast', **tracker.to_record(outcome, self.app.kp, self.app.kd))
+    
     def store_fruit(self):
         """Complete fruit storage and rod switching workflow with reliable delays - stores 2 fruits"""
         fruit_storage_enabled = getattr(self.app, 'fruit_storage_enabled', False)
@@ -462,7 +515,7 @@ class FishingBot:
     
     def check_and_purchase(self):
         """Check if auto-purchase is needed"""
-        if getattr(self.app, 'auto_purchase_var', None) and self.app.auto_purchase_var.get():
+        if self.app.settings_model.get('auto_purchase_enabled'):
             self.app.purchase_counter += 1
             loops_needed = int(getattr(self.app, 'loops_per_purchase', 1)) if getattr(self.app, 'loops_per_purchase', None) is not None else 1
             print(f'🛒 Purchase counter: {self.app.purchase_counter}/{loops_needed}')
@@ -591,10 +644,11 @@ class FishingBot:
         
                                   
         try:
-            self.app.root.after(0, lambda: self.app.update_stats_display())
+            self.app.ui_bus.post('stats')
         except:
             pass
         
+        self.app.record_event('purchase', detail=str(amount))
         print(f"✅ Auto-purchase sequence completed for {amount} items")
         
                                                        
@@ -772,6 +826,8 @@ class FishingBot:
                         self.app.set_recovery_state("casting", {"action": "initial_cast"})
                         self.cast_line()
                         cast_time = time.time()
+                        tracker = CastTracker(cast_time)
+                        self.app.record_event('cast')
                         
                                                                     
                         time.sleep(0.5)
@@ -783,8 +839,6 @@ class FishingBot:
                         print('Scanning for blue fishing bar...')
                         
                         detection_start_time = time.time()
-                        last_spawn_check = time.time()
-                        spawn_check_interval = 4.0                                                  
                         
                         while self.app.main_loop_active and not self.force_stop_flag:
                                                                           
@@ -796,18 +850,21 @@ class FishingBot:
                             time_since_last_spawn = current_time - self.last_fruit_spawn_time
                             
                                                                                                              
-                            if not detected and current_time - last_spawn_check > spawn_check_interval and time_since_last_spawn > self.fruit_spawn_cooldown:
+                            if not detected and self.spawn_watcher.due(current_time) and time_since_last_spawn > self.fruit_spawn_cooldown:
                                 try:
                                                                     
                                     if hasattr(self.app, 'ocr_manager') and self.app.ocr_manager.is_available():
-                                                                                           
-                                        original_cooldown = self.app.ocr_manager.capture_cooldown
-                                        self.app.ocr_manager.capture_cooldown = 0.1                                           
-                                        
-                                        spawn_text = self.app.ocr_manager.extract_text()
-                                        
-                                                                   
-                                        self.app.ocr_manager.capture_cooldown = original_cooldown
+                                        spawn_frame = self.app.ocr_manager.capture_drop_area(sct, quiet=True)
+                                        spawn_text = None
+                                        if spawn_frame is not None and self.spawn_watcher.observe(spawn_frame, current_time):
+                                                                                                        
+                                            spawn_text = self.app.ocr_manager.extract_text(spawn_frame, purpose='spawn')
+                                        if current_time - self.last_spawn_stats_time >= self.spawn_stats_interval:
+                                            self.last_spawn_stats_time = current_time
+                                            watch_stats = self.spawn_watcher.get_stats()
+                                            print(f"👁️ Spawn watcher: {watch_stats['ocr_requests']} OCR checks, "
+                                                  f"{watch_stats['ocr_per_hour']:.0f}/h vs {watch_stats['fixed_poll_per_hour']:.0f}/h fixed poll "
+                                                  f"({watch_stats['reduction']*100:.0f}% fewer)")
                                         
                                         if spawn_text:
                                             print(f"🔍 Spawn check OCR result: {spawn_text}")
@@ -819,9 +876,7 @@ class FishingBot:
                                                 print(f"⏰ Fruit spawn cooldown activated - won't check again for 15 minutes")
                                                               
                                                 if hasattr(self.app, 'webhook_manager') and getattr(self.app, 'fruit_spawn_webhook_enabled', True):
-                                                    self.app.webhook_manager.send_fruit_spawn(fruit_name)
-                                    
-                                    last_spawn_check = current_time
+                                                    self.app.webhook_manager.send_fruit_spawn(fruit_name, spawn_frame)
                                 except Exception as spawn_error:
                                     print(f"⚠️ Spawn check error: {spawn_error}")
                             elif time_since_last_spawn <= self.fruit_spawn_cooldown:
@@ -845,6 +900,8 @@ class FishingBot:
                             if current_time - detection_start_time > adaptive_timeout:
                                 if not detected:
                                     print(f'⏰ No fish detected after {adaptive_timeout:.1f}s (adaptive), recasting...')
+                                    self.app.record_event('timeout', current_time - cast_time, 'no_bite')
+                                    self._finish_cast(tracker, 'no_bite')
                                                           
                                     self.recent_catches.append(False)
                                     if len(self.recent_catches) > 10:
@@ -853,6 +910,8 @@ class FishingBot:
                                     break
                                 elif current_time - detection_start_time > adaptive_timeout + 15:
                                     print(f'⏰ Fish control timeout after {adaptive_timeout + 15:.1f}s, recasting...')
+                                    self.app.record_event('timeout', current_time - cast_time, 'fish_control')
+                                    self._finish_cast(tracker, 'fish_control')
                                                                            
                                     if self.app.is_clicking:
                                         win32api.mouse_event(win32con.MOUSEEVENTF_LEFTUP, 0, 0, 0, 0)
@@ -905,10 +964,13 @@ class FishingBot:
                             
                             if found_first:
                                 detected = True
+                                tracker.bar_frame()
                             else:
                                                    
                                 if not detected and time.time() - cast_time > self.app.scan_timeout:
                                     print(f'Cast timeout after {self.app.scan_timeout}s, recasting...')
+                                    self.app.record_event('timeout', time.time() - cast_time, 'no_bar')
+                                    self._finish_cast(tracker, 'no_bar')
                                                                                          
                                     if hasattr(self.app, 'bait_manager') and self.app.bait_manager.is_enabled():
                                         print("🔄 Reselecting bait (may have run out)")
@@ -931,6 +993,8 @@ class FishingBot:
                                     
                                                                                          
                                     self.app.increment_fish_counter()
+                                    self.app.record_event('catch', time.time() - cast_time)
+                                    self._finish_cast(tracker, 'catch')
                                     
                                                                   
                                     self.process_post_catch_workflow()
@@ -1078,6 +1142,7 @@ class FishingBot:
                                 derivative = normalized_error - self.app.previous_error
                                 self.app.previous_error = normalized_error
                                 pd_output = self.app.kp * normalized_error + self.app.kd * derivative
+                                tracker.pd_step(normalized_error, pd_output)
                                 
                                 print(f'Error: {raw_error}px, PD: {pd_output:.2f}')
                                 
@@ -1135,11 +1200,8 @@ class FishingBot:
         
                                              
         auto_zoom_enabled = getattr(self.app, 'auto_zoom_enabled', False)
-        if not auto_zoom_enabled and hasattr(self.app, 'auto_zoom_var'):
-            try:
-                auto_zoom_enabled = self.app.auto_zoom_var.get()
-            except Exception:
-                pass
+        if not auto_zoom_enabled:
+            auto_zoom_enabled = self.app.settings_model.snapshot().zoom_settings.get('auto_zoom_enabled', False)
         
         if auto_zoom_enabled:
             if hasattr(self.app, 'zoom_controller'):
@@ -1166,7 +1228,7 @@ class FishingBot:
             print("🔍 Auto zoom disabled - skipping zoom sequence")
         
                                           
-        if getattr(self.app, 'auto_purchase_var', None) and self.app.auto_purchase_var.get():
+        if self.app.settings_model.get('auto_purchase_enabled'):
             print("🛒 Step 3: Auto purchase...")
             self.app.set_recovery_state("purchasing", {"sequence": "initial_auto_purchase"})
             self.perform_auto_purchase()
@@ -1231,10 +1293,13 @@ class FishingBot:
             print("📍 Switching to drop layout for text recognition...")
             self.app.layout_manager.toggle_layout()
             if hasattr(self.app, 'overlay_manager'):
-                self.app.overlay_manager.update_layout()
+                self.app.ui_bus.post('layout')
         
                                                    
         drop_info = self.search_for_drops()
+        if drop_info and drop_info.get('drop_text'):
+            pity = format_pity(drop_info['pity_counters'], drop_info['is_legendary'])
+            self.app.record_event('drop', detail=f"{drop_info['drop_text']} | pity {pity}" if pity else drop_info['drop_text'])
         
                                                                        
         if drop_info and drop_info.get('has_fruit', False):
@@ -1244,10 +1309,11 @@ class FishingBot:
             if not hasattr(self.app, 'devil_fruits_caught'):
                 self.app.devil_fruits_caught = []
             self.app.devil_fruits_caught.append(drop_info.get('drop_text', 'Unknown Fruit'))
+            self.app.record_event('fruit', detail=drop_info.get('drop_text', 'Unknown Fruit'))
             
                                   
             try:
-                self.app.root.after(0, lambda: self.app.update_stats_display())
+                self.app.ui_bus.post('stats')
             except:
                 pass
             
@@ -1267,48 +1333,13 @@ class FishingBot:
             print("📍 Switching back to bar layout...")
             self.app.layout_manager.toggle_layout()
             if hasattr(self.app, 'overlay_manager'):
-                self.app.overlay_manager.update_layout()
+                self.app.ui_bus.post('layout')
         
         print("✅ Post-catch workflow complete")
     
-    def check_legendary_pity(self, drop_text):
-        """
-        Check if devil fruit drop is legendary by detecting pity counters
-        Legendary drops show: 0/37, 0/40, 0/92, 0/100
-        Non-legendary show: 1/37, 2/40, etc.
-        """
-        import re
-        
-                                                                            
-        pity_patterns = []
-                                                 
-        for i in range(1, 101):
-            pity_patterns.append(f'0/{i}')
-        
-                                   
-        pity_patterns = [re.escape(pattern) for pattern in pity_patterns]
-        
-        text_lower = drop_text.lower()
-        
-                                                                               
-        legendary_keywords = ['legendary']
-        has_legendary_keyword = any(keyword in text_lower for keyword in legendary_keywords)
-        
-                                                                    
-        has_legendary_pity = any(re.search(pattern, drop_text) for pattern in pity_patterns)
-        
-                                                                            
-        is_legendary = has_legendary_keyword or has_legendary_pity
-        
-        if is_legendary:
-            print(f"🔍 Legendary detection: keyword={has_legendary_keyword}, pity={has_legendary_pity}")
-            print(f"📝 Drop text: {drop_text}")
-        
-        return is_legendary
-
     def search_for_drops(self):
         """Search for drops in the drop layout area and extract text"""
-        drop_info = {'has_fruit': False, 'drop_text': '', 'is_legendary': False}
+        drop_info = {'has_fruit': False, 'drop_text': '', 'is_legendary': False, 'pity_counters': [], 'captured_at': time.time()}
         
         try:
                                               
@@ -1324,82 +1355,90 @@ class FishingBot:
             
             print("🔍 Searching for drops in drop area...")
             
-                                             
-            import mss
-            with mss.mss() as sct:
-                monitor = {
-                    'left': drop_area['x'],
-                    'top': drop_area['y'],
-                    'width': drop_area['width'],
-                    'height': drop_area['height']
-                }
-                screenshot = sct.grab(monitor)
-                img = np.array(screenshot)
+            ocr_manager = self.app.ocr_manager
+            if ocr_manager.burst_frames > 1:
+                frames = ocr_manager.capture_drop_burst()
+            else:
+                img = ocr_manager.capture_drop_area()
+                frames = [img] if img is not None else []
+            if not frames:
+                print("📝 Drop area capture failed, skipping drop search")
+                return drop_info
             
-                                                          
-            if hasattr(self.app, 'ocr_manager'):
-                drop_text = self.app.ocr_manager.extract_text()                                                
-                if drop_text:
-                    drop_info['drop_text'] = drop_text
+            drop_text, drop_info['frame'] = ocr_manager.extract_text_burst(frames)                                                
+            if drop_text:
+                drop_info['drop_text'] = drop_text
+                
+                if drop_text == "TEXT_DETECTED_NO_OCR":
+                    print("📝 Text-like content detected in drop area (install Tesseract OCR for full text recognition)")
+                                                                       
+                    drop_info['has_fruit'] = True
+                else:
+                    print(f"📝 Drop detected: {drop_text}")
+                    
+                    pity = classify_pity(drop_text)
+                    drop_info['is_legendary'] = pity['is_legendary']
+                    drop_info['pity_counters'] = pity['pity_counters']
+                    if pity['pity_counters']:
+                        print(f"🎲 Pity counters: {format_pity(pity['pity_counters'], pity['is_legendary'])}")
                     
-                    if drop_text == "TEXT_DETECTED_NO_OCR":
-                        print("📝 Text-like content detected in drop area (install Tesseract OCR for full text recognition)")
                                                                            
-                        drop_info['has_fruit'] = True
-                    else:
-                        print(f"📝 Drop detected: {drop_text}")
-                        
-                                                                               
-                        devil_fruit_keywords = ['devil', 'fruit', 'backpack', 'drop', 'got', 'fished up']
-                        drop_text_lower = drop_text.lower()
-                        
-                                                              
-                        devil_fruit_phrases = [
-                            'devil fruit',
-                            'fished up a devil',
-                            'got a devil fruit',
-                            'devil fruit drop',
-                            'check your backpack'
-                        ]
-                        
+                    devil_fruit_keywords = ['devil', 'fruit', 'backpack', 'drop', 'got', 'fished up']
+                    drop_text_lower = drop_text.lower()
+                    
                                                           
-                        for phrase in devil_fruit_phrases:
-                            if phrase in drop_text_lower:
-                                drop_info['has_fruit'] = True
-                                print(f"🍎 Devil fruit detected in drop: '{phrase}'")
-                                break
-                        
-                                                                                             
-                        if not drop_info['has_fruit']:
-                            keyword_matches = sum(1 for keyword in devil_fruit_keywords if keyword in drop_text_lower)
-                            if keyword_matches >= 2:
-                                drop_info['has_fruit'] = True
-                                print(f"🍎 Devil fruit detected (keyword match count: {keyword_matches})")
-                        
-                                                     
-                        if 'devil fruit' in drop_text_lower:
+                    devil_fruit_phrases = [
+                        'devil fruit',
+                        'fished up a devil',
+                        'got a devil fruit',
+                        'devil fruit drop',
+                        'check your backpack'
+                    ]
+                    
+                                                      
+                    for phrase in devil_fruit_phrases:
+                        if phrase in drop_text_lower:
                             drop_info['has_fruit'] = True
-                            print(f"🍎 Devil fruit detected!")
-                        
-                                                                   
-                        fruit_name = self.app.ocr_manager.detect_fruit_spawn(drop_text)
-                        if fruit_name:
-                            print(f"🌟 Devil fruit spawn detected: {fruit_name}")
-                                                       
-                            if hasattr(self.app, 'webhook_manager'):
-                                self.app.webhook_manager.send_fruit_spawn(fruit_name)
-                        
+                            print(f"🍎 Devil fruit detected in drop: '{phrase}'")
+                            break
+                    
+                                                                                         
+                    if not drop_info['has_fruit']:
+                        keyword_matches = sum(1 for keyword in devil_fruit_keywords if keyword in drop_text_lower)
+                        if keyword_matches >= 2:
+                            drop_info['has_fruit'] = True
+                            print(f"🍎 Devil fruit detected (keyword match count: {keyword_matches})")
+                    
                                                  
-                        if hasattr(self.app, 'overlay_manager_drop') and self.app.overlay_manager_drop.window:
-                            self.app.overlay_manager_drop.display_captured_text(drop_text)
-                        
+                    if 'devil fruit' in drop_text_lower:
+                        drop_info['has_fruit'] = True
+                        print(f"🍎 Devil fruit detected!")
+                    
+                                                               
+                    fruit_name = self.app.ocr_manager.detect_fruit_spawn(drop_text)
+                    if fruit_name:
+                        print(f"🌟 Devil fruit spawn detected: {fruit_name}")
                                                    
-                        if getattr(self.app, 'dev_mode', False):
-                            print(f"🔧 [DEV MODE] Drop details: {drop_text}")
-                        
-                else:
-                    print("📝 No text found in drop area")
-                        
+                        if hasattr(self.app, 'webhook_manager'):
+                            self.app.webhook_manager.send_fruit_spawn(fruit_name, drop_info['frame'])
+                    
+                                             
+                    if hasattr(self.app, 'overlay_manager_drop') and self.app.overlay_manager_drop.window:
+                        self.app.ui_bus.post('drop_text', drop_text)
+                    
+                                               
+                    if getattr(self.app, 'dev_mode', False):
+                        print(f"🔧 [DEV MODE] Drop details: {drop_text}")
+                        try:
+                            from src.ocr_benchmark import record_corpus_sample
+                        except ImportError:
+                            from ocr_benchmark import record_corpus_sample
+                        kind = 'spawn' if fruit_name else 'drop'
+                        record_corpus_sample(drop_info['frame'], drop_text, kind)
+                    
+            else:
+                print("📝 No text found in drop area")
+                    
         except Exception as e:
             print(f"❌ Drop search error: {e}")
         
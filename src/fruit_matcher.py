@@ -0,0 +1,234 @@
+"""
+Fruit Matcher for fuzzy devil fruit name lookup in OCR text
+Uses a bigram index and bounded edit distance so lookups stay cheap
+"""
+
+import random
+import re
+import time
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+DEVIL_FRUITS = [
+    'Tori', 'Mochi', 'Ope', 'Venom', 'Buddha', 'Pteranodon',
+    'Smoke', 'Goru', 'Yuki', 'Yami', 'Pika', 'Magu',
+    'Kage', 'Mera', 'Paw', 'Goro', 'Ito', 'Hie',
+    'Suna', 'Gura', 'Zushi', 'Kira', 'Spring', 'Yomi',
+    'Bomb', 'Gomu', 'Horo', 'Mero', 'Bari', 'Heal',
+    'Spin', 'Suke', 'Kilo'
+]
+
+BANNER_WORDS = {'has', 'spawned', 'spavned', 'spawn', 'spavn', 'somewhere', 'the', 'devil', 'fruit'}
+
+
+def bounded_edit_distance(a: str, b: str, max_distance: int) -> int:
+    """
+    Levenshtein distance with early cutoff
+
+    Args:
+        a: First string
+        b: Second string
+        max_distance: Largest distance worth computing
+
+    Returns:
+        Edit distance, or max_distance + 1 if it exceeds the cutoff
+    """
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+    if len(a) < len(b):
+        a, b = b, a
+
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        row_min = i
+        for j, char_b in enumerate(b, 1):
+            cost = 0 if char_a == char_b else 1
+            value = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            current.append(value)
+            if value < row_min:
+                row_min = value
+        if row_min > max_distance:
+            return max_distance + 1
+        previous = current
+
+    return previous[-1] if previous[-1] <= max_distance else max_distance + 1
+
+
+class FruitMatcher:
+    """Matches OCR words against known fruit names using a precomputed bigram index"""
+
+    def __init__(self, names: Iterable[str], min_similarity: float = 0.7,
+                 max_tokens: int = 64, max_candidates: int = 8):
+        self.names = list(names)
+        self.names_lower = [name.lower() for name in self.names]
+        self.min_similarity = min_similarity
+        self.max_tokens = max_tokens
+        self.max_candidates = max_candidates
+
+        self.direct_pattern = re.compile(
+            r'\b(' + '|'.join(re.escape(name) for name in sorted(self.names_lower, key=len, reverse=True)) + r')\b'
+        )
+        self.token_pattern = re.compile(r'[a-z0-9]{3,}')
+        self.digit_fixes = str.maketrans('01569', 'oisbg')
+
+        self.bigram_index: Dict[str, Set[int]] = {}
+        for idx, name in enumerate(self.names_lower):
+            for gram in self._bigrams(name):
+                self.bigram_index.setdefault(gram, set()).add(idx)
+
+    @staticmethod
+    def _bigrams(word: str) -> Set[str]:
+        padded = f"^{word}$"
+        return {padded[i:i + 2] for i in range(len(padded) - 1)}
+
+    def _candidates(self, word: str) -> List[int]:
+        """Return fruit indices sharing the most bigrams with word"""
+        counts: Dict[int, int] = {}
+        for gram in self._bigrams(word):
+            for idx in self.bigram_index.get(gram, ()):
+                counts[idx] = counts.get(idx, 0) + 1
+        ranked = sorted(counts, key=counts.get, reverse=True)
+        return ranked[:self.max_candidates]
+
+    def match(self, text: str) -> Optional[Tuple[str, float]]:
+        """
+        Find the best fruit name in text
+
+        Args:
+            text: OCR extracted text
+
+        Returns:
+            Tuple of (fruit name, similarity score) or None if nothing is close enough
+        """
+        if not text:
+            return None
+
+        text_lower = text.lower()
+
+        direct = self.direct_pattern.search(text_lower)
+        if direct:
+            return self.names[self.names_lower.index(direct.group(0))], 1.0
+
+        best_fruit = None
+        best_similarity = 0.0
+
+        tokens = (w.translate(self.digit_fixes) for w in self.token_pattern.findall(text_lower))
+        words = [w for w in tokens if w not in BANNER_WORDS]
+        for word in words[:self.max_tokens]:
+            for idx in self._candidates(word):
+                fruit = self.names_lower[idx]
+                longest = max(len(fruit), len(word))
+                max_distance = int(longest * (1.0 - self.min_similarity))
+                distance = bounded_edit_distance(fruit, word, max_distance)
+                if distance > max_distance:
+                    continue
+                similarity = 1.0 - distance / longest
+                if similarity > best_similarity:
+                    best_similarity = similarity
+                    best_fruit = self.names[idx]
+
+        if best_fruit and best_similarity >= self.min_similarity:
+            return best_fruit, best_similarity
+        return None
+
+
+OCR_CONFUSIONS = {
+    'o': ['0', 'c'], 'i': ['l', '1'], 'l': ['i', '1'], 'a': ['o', 'e'],
+    'e': ['c', 'a'], 'u': ['v', 'o'], 'm': ['rn', 'n'], 'n': ['m', 'h'],
+    'r': ['n'], 'k': ['x'], 'g': ['q', '9'], 'b': ['h', '6'], 's': ['5'],
+}
+
+
+def add_ocr_noise(word: str, rng: random.Random, edits: int = 1) -> str:
+    """Apply insertions, deletions and confusable substitutions to a word"""
+    chars = list(word)
+    for _ in range(edits):
+        if not chars:
+            break
+        pos = rng.randrange(len(chars))
+        op = rng.choice(('insert', 'delete', 'substitute'))
+        if op == 'insert':
+            chars.insert(pos, rng.choice('ilnrc'))
+        elif op == 'delete' and len(chars) > 3:
+            del chars[pos]
+        else:
+            options = OCR_CONFUSIONS.get(chars[pos].lower(), ['x'])
+            chars[pos] = rng.choice(options)
+    return ''.join(chars)
+
+
+def build_noise_corpus(names: Iterable[str], samples_per_name: int = 20,
+                       seed: int = 1) -> List[Tuple[str, Optional[str]]]:
+    """
+    Build a labelled OCR-noise corpus of spawn banners
+
+    Returns:
+        List of (text, expected fruit or None) pairs
+    """
+    rng = random.Random(seed)
+    corpus = []
+    for name in names:
+        for _ in range(samples_per_name):
+            noisy = add_ocr_noise(name, rng, edits=1 if len(name) < 6 else rng.choice((1, 2)))
+            corpus.append((f"{noisy} has spawned somewhere!", name))
+    for text in ("Fish caught", "Safe zone reached", "Candy Corn x3",
+                 "Inventory full", "Loading", "Max capacity reached"):
+        corpus.append((f"{text} has spawned", None))
+    return corpus
+
+
+def evaluate_matcher(matcher: FruitMatcher, corpus: List[Tuple[str, Optional[str]]]) -> dict:
+    """
+    Measure recall, false positives and latency of a matcher on a labelled corpus
+
+    Returns:
+        Dict with recall, precision, false_positives and latency percentiles in ms
+    """
+    latencies = []
+    hits = misses = false_positives = wrong = 0
+    for text, expected in corpus:
+        start = time.perf_counter()
+        result = matcher.match(text)
+        latencies.append((time.perf_counter() - start) * 1000)
+        found = result[0] if result else None
+        if expected is None:
+            if found:
+                false_positives += 1
+        elif found == expected:
+            hits += 1
+        elif found:
+            wrong += 1
+        else:
+            misses += 1
+
+    latencies.sort()
+    positives = hits + misses + wrong
+    predicted = hits + wrong + false_positives
+    return {
+        'samples': len(corpus),
+        'recall': hits / positives if positives else 0.0,
+        'precision': hits / predicted if predicted else 0.0,
+        'false_positives': false_positives,
+        'wrong_fruit': wrong,
+        'p50_ms': latencies[len(latencies) // 2] if latencies else 0.0,
+        'p95_ms': latencies[int(len(latencies) * 0.95)] if latencies else 0.0,
+        'max_ms': latencies[-1] if latencies else 0.0,
+    }
+
+
+if __name__ == '__main__':
+    import json
+    import sys
+
+    if len(sys.argv) > 1:
+        with open(sys.argv[1], 'r', encoding='utf-8') as f:
+            corpus = [(item['text'], item.get('label')) for item in json.load(f)]
+        print(f"📂 Loaded {len(corpus)} labelled samples from {sys.argv[1]}")
+    else:
+        corpus = build_noise_corpus(DEVIL_FRUITS)
+        print(f"🧪 Generated {len(corpus)} synthetic OCR-noise samples")
+
+    stats = evaluate_matcher(FruitMatcher(DEVIL_FRUITS), corpus)
+    print(f"✅ Recall: {stats['recall']*100:.1f}% | Precision: {stats['precision']*100:.1f}% | "
+          f"False positives: {stats['false_positives']} | Wrong fruit: {stats['wrong_fruit']}")
+    print(f"⏱️ Latency p50: {stats['p50_ms']:.3f}ms | p95: {stats['p95_ms']:.3f}ms | max: {stats['max_ms']:.3f}ms")
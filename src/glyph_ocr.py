@@ -0,0 +1,275 @@
+"""
+Glyph OCR - lightweight template matcher for GPO's fixed-font banners
+Binarizes the frame, splits it into connected components and matches each glyph
+against an atlas extracted from labelled captures. Needs only numpy and OpenCV.
+
+Usage:
+    python src/glyph_ocr.py build [--corpus ocr_corpus] [--out glyph_atlas.npz]
+    python src/glyph_ocr.py read image.png [--atlas glyph_atlas.npz]
+"""
+
+import argparse
+import sys
+import time
+from typing import List, Tuple
+
+import numpy as np
+
+try:
+    from src.lazy_import import lazy_module
+except ImportError:
+    from lazy_import import lazy_module
+
+cv2 = lazy_module('cv2')
+
+DEFAULT_ATLAS_FILE = "glyph_atlas.npz"
+GLYPH_SIZE = 20
+MAX_TEMPLATES_PER_CHAR = 8
+
+
+def binarize(img) -> np.ndarray:
+    """
+    Convert a frame to a binary text mask (text pixels = 255)
+    Polarity is picked so that text is the minority class
+
+    Args:
+        img: BGR/BGRA/RGB/gray numpy array
+
+    Returns:
+        uint8 binary mask
+    """
+    if len(img.shape) == 3:
+        code = cv2.COLOR_BGRA2GRAY if img.shape[2] == 4 else cv2.COLOR_BGR2GRAY
+        gray = cv2.cvtColor(img, code)
+    else:
+        gray = img
+    _, mask = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+    if cv2.countNonZero(mask) > mask.size // 2:
+        mask = cv2.bitwise_not(mask)
+    return mask
+
+
+def segment_glyphs(mask: np.ndarray, min_area: int = 6) -> List[List[Tuple[int, int, int, int]]]:
+    """
+    Split a binary mask into glyph boxes grouped into text lines
+
+    Returns:
+        List of lines, each a left-to-right list of (x, y, w, h) boxes
+    """
+    count, _, stats, _ = cv2.connectedComponentsWithStats(mask, connectivity=8)
+    if count <= 1:
+        return []
+
+    boxes = stats[1:, :4]
+    areas = stats[1:, cv2.CC_STAT_AREA]
+    height_limit = mask.shape[0] * 0.8
+    keep = (areas >= min_area) & (boxes[:, 3] < height_limit)
+    boxes = [tuple(int(v) for v in box) for box in boxes[keep]]
+    if not boxes:
+        return []
+
+    boxes.sort(key=lambda b: b[0])
+    merged = []
+    for box in boxes:
+        if merged:
+            px, py, pw, ph = merged[-1]
+            overlap = min(px + pw, box[0] + box[2]) - max(px, box[0])
+            if overlap > 0.5 * min(pw, box[2]):
+                x0, y0 = min(px, box[0]), min(py, box[1])
+                x1, y1 = max(px + pw, box[0] + box[2]), max(py + ph, box[1] + box[3])
+                merged[-1] = (x0, y0, x1 - x0, y1 - y0)
+                continue
+        merged.append(box)
+
+    median_height = float(np.median([b[3] for b in merged]))
+    lines: List[List[Tuple[int, int, int, int]]] = []
+    centers: List[float] = []
+    for box in sorted(merged, key=lambda b: b[1] + b[3] / 2):
+        center = box[1] + box[3] / 2
+        for idx, line_center in enumerate(centers):
+            if abs(center - line_center) < median_height * 0.6:
+                lines[idx].append(box)
+                break
+        else:
+            lines.append([box])
+            centers.append(center)
+
+    ordered = sorted(zip(centers, lines), key=lambda item: item[0])
+    return [sorted(line, key=lambda b: b[0]) for _, line in ordered]
+
+
+def normalize_glyph(mask: np.ndarray, box: Tuple[int, int, int, int]) -> np.ndarray:
+    """Crop a glyph, pad it to a square and resize to GLYPH_SIZE x GLYPH_SIZE float32"""
+    x, y, w, h = box
+    crop = mask[y:y + h, x:x + w]
+    side = max(w, h)
+    square = np.zeros((side, side), dtype=np.uint8)
+    square[(side - h) // 2:(side - h) // 2 + h, (side - w) // 2:(side - w) // 2 + w] = crop
+    return cv2.resize(square, (GLYPH_SIZE, GLYPH_SIZE), interpolation=cv2.INTER_AREA).astype(np.float32) / 255.0
+
+
+def glyph_features(line: List[Tuple[int, int, int, int]]) -> np.ndarray:
+    """Aspect ratio and height relative to the line's median height for each box"""
+    line_height = max(1.0, float(np.median([box[3] for box in line])))
+    return np.array([(box[2] / max(1, box[3]), box[3] / line_height) for box in line], dtype=np.float32)
+
+
+def _unit_vectors(glyphs: np.ndarray) -> np.ndarray:
+    flat = glyphs.reshape(len(glyphs), -1)
+    flat = flat - flat.mean(axis=1, keepdims=True)
+    norms = np.linalg.norm(flat, axis=1, keepdims=True)
+    return flat / np.maximum(norms, 1e-6)
+
+
+class GlyphAtlas:
+    """Glyph templates with their characters and shape features (aspect, relative height)"""
+
+    def __init__(self, chars: List[str], templates: np.ndarray, features: np.ndarray):
+        self.chars = list(chars)
+        self.templates = templates.astype(np.float32)
+        self.features = features.astype(np.float32).reshape(-1, 2)
+        self.vectors = _unit_vectors(self.templates) if len(self.templates) else np.zeros((0, GLYPH_SIZE * GLYPH_SIZE), np.float32)
+
+    @classmethod
+    def load(cls, path: str = DEFAULT_ATLAS_FILE) -> 'GlyphAtlas':
+        data = np.load(path)
+        return cls([str(c) for c in data['chars']], data['templates'], data['features'])
+
+    def save(self, path: str = DEFAULT_ATLAS_FILE):
+        np.savez_compressed(path, chars=np.array(self.chars), templates=self.templates, features=self.features)
+
+    def __len__(self):
+        return len(self.chars)
+
+
+def build_atlas(samples: List[dict]) -> Tuple[GlyphAtlas, dict]:
+    """
+    Extract a glyph atlas from labelled captures
+    A sample is used only when its glyph count matches its label's non-space characters
+
+    Args:
+        samples: Dicts with 'image' (numpy array) and 'text' (label)
+
+    Returns:
+        Tuple of (atlas, stats dict)
+    """
+    per_char = {}
+    used = skipped = 0
+    for sample in samples:
+        chars = [c for c in sample['text'].replace('\n', ' ') if not c.isspace()]
+        mask = binarize(sample['image'])
+        lines = segment_glyphs(mask)
+        boxes = [box for line in lines for box in line]
+        if not chars or len(boxes) != len(chars):
+            skipped += 1
+            continue
+        used += 1
+        features = np.concatenate([glyph_features(line) for line in lines])
+        for char, box, feature in zip(chars, boxes, features):
+            glyph = normalize_glyph(mask, box)
+            existing = per_char.setdefault(char, [])
+            if len(existing) >= MAX_TEMPLATES_PER_CHAR:
+                continue
+            if existing:
+                scores = _unit_vectors(np.array([g for g, _ in existing])) @ _unit_vectors(glyph[None])[0]
+                if scores.max() > 0.97:
+                    continue
+            existing.append((glyph, feature))
+
+    chars, templates, features = [], [], []
+    for char, entries in sorted(per_char.items()):
+        for glyph, feature in entries:
+            chars.append(char)
+            templates.append(glyph)
+            features.append(feature)
+
+    atlas = GlyphAtlas(chars, np.array(templates).reshape(-1, GLYPH_SIZE, GLYPH_SIZE), np.array(features))
+    return atlas, {'samples_used': used, 'samples_skipped': skipped, 'characters': len(per_char), 'templates': len(chars)}
+
+
+class GlyphRecognizer:
+    """Recognizes banner text by matching glyphs against a GlyphAtlas"""
+
+    def __init__(self, atlas: GlyphAtlas, space_factor: float = 0.45, min_score: float = 0.35):
+        self.atlas = atlas
+        self.space_factor = space_factor
+        self.min_score = min_score
+
+    def recognize(self, img) -> List[Tuple[str, float]]:
+        """
+        Recognize each text line in a frame
+
+        Returns:
+            List of (line text, mean glyph score) pairs, top to bottom
+        """
+        if not len(self.atlas):
+            return []
+
+        mask = binarize(img)
+        results = []
+        for line in segment_glyphs(mask):
+            glyphs = np.array([normalize_glyph(mask, box) for box in line])
+            scores = _unit_vectors(glyphs) @ self.atlas.vectors.T
+            shape_gap = np.abs(glyph_features(line)[:, None, :] - self.atlas.features[None, :, :])
+            scores -= 0.15 * shape_gap[:, :, 0] + 0.5 * shape_gap[:, :, 1]
+            best = scores.argmax(axis=1)
+            best_scores = scores[np.arange(len(line)), best]
+
+            heights = [box[3] for box in line]
+            space_gap = self.space_factor * float(np.median(heights))
+            text = []
+            kept_scores = []
+            for i, box in enumerate(line):
+                if best_scores[i] < self.min_score:
+                    continue
+                if text and box[0] - (line[i - 1][0] + line[i - 1][2]) > space_gap:
+                    text.append(' ')
+                text.append(self.atlas.chars[best[i]])
+                kept_scores.append(float(best_scores[i]))
+            if kept_scores:
+                results.append((''.join(text), float(np.clip(np.mean(kept_scores), 0.0, 1.0))))
+        return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Glyph template OCR for GPO banners")
+    sub = parser.add_subparsers(dest='command', required=True)
+    build = sub.add_parser('build', help="extract a glyph atlas from a labelled corpus")
+    build.add_argument('--corpus', default="ocr_corpus")
+    build.add_argument('--out', default=DEFAULT_ATLAS_FILE)
+    read = sub.add_parser('read', help="recognize text in an image")
+    read.add_argument('image')
+    read.add_argument('--atlas', default=DEFAULT_ATLAS_FILE)
+    args = parser.parse_args(argv)
+
+    if args.command == 'build':
+        try:
+            from src.ocr_benchmark import load_corpus
+        except ImportError:
+            from ocr_benchmark import load_corpus
+        samples = load_corpus(args.corpus)
+        if not samples:
+            print(f"❌ No labelled samples found in {args.corpus}")
+            return 1
+        atlas, stats = build_atlas(samples)
+        atlas.save(args.out)
+        print(f"✅ Atlas saved to {args.out}: {stats['templates']} templates for {stats['characters']} characters "
+              f"({stats['samples_used']} samples used, {stats['samples_skipped']} skipped)")
+        return 0
+
+    image = cv2.imread(args.image, cv2.IMREAD_UNCHANGED)
+    if image is None:
+        print(f"❌ Could not read {args.image}")
+        return 1
+    recognizer = GlyphRecognizer(GlyphAtlas.load(args.atlas))
+    start = time.perf_counter()
+    lines = recognizer.recognize(image)
+    elapsed = (time.perf_counter() - start) * 1000
+    for text, score in lines:
+        print(f"📝 {text} ({score:.2f})")
+    print(f"⏱️ Recognized in {elapsed:.2f}ms")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
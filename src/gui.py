@@ -18,20 +18,36 @@ from datetime import datetime
                                                           
 
 try:
-    from PIL import Image, ImageDraw, ImageTk
-    PIL_AVAILABLE = True
+    from src.lazy_import import module_available
 except ImportError:
-    PIL_AVAILABLE = False
+    from lazy_import import module_available
+
+                                                                                  
+PIL_AVAILABLE = module_available('PIL')
 
                           
 try:
     from src.themes import ThemeManager
     from src.fishing import FishingBot
     from src.layout_manager import LayoutManager
+    from src.settings_model import PRESET_FIELDS, Settings, SettingsModel
+    from src.settings_store import SettingsStore
+    from src.ui_bus import UIBus
+    from src.stats_view import StatsView, StatsViewModel
+    from src.session_db import SessionDatabase
+    from src.telemetry import TelemetryWriter
+    from src.startup_profiler import StartupProfiler
 except ImportError:
     from themes import ThemeManager
     from fishing import FishingBot
     from layout_manager import LayoutManager
+    from settings_model import PRESET_FIELDS, Settings, SettingsModel
+    from settings_store import SettingsStore
+    from ui_bus import UIBus
+    from stats_view import StatsView, StatsViewModel
+    from session_db import SessionDatabase
+    from telemetry import TelemetryWriter
+    from startup_profiler import StartupProfiler
 
 class ToolTip:
     """Simple tooltip class for hover explanations"""
@@ -119,21 +135,16 @@ class CollapsibleFrame:
         return self.content_frame
 
 class HotkeyGUI:
-    def __init__(self, root):
+    def __init__(self, root, profiler=None):
         self.root = root
+        self.profiler = profiler or StartupProfiler()
         self.root.title('GPO Autofish v3.0')
+        self.ui_bus = UIBus(root)
+        self.stats_view_model = StatsViewModel(self)
+        self.stats_view = StatsView()
+        self.register_ui_events()
         self.root.attributes('-topmost', True)
         
-                         
-        try:
-            if PIL_AVAILABLE and os.path.exists("images/icon.webp"):
-                icon_image = Image.open("images/icon.webp")
-                icon_image = icon_image.resize((32, 32), Image.Resampling.LANCZOS)
-                icon_photo = ImageTk.PhotoImage(icon_image)
-                self.root.iconphoto(True, icon_photo)
-        except Exception as e:
-            print(f"Could not set window icon: {e}")
-        
         try:
             ctypes.windll.shcore.SetProcessDpiAwareness(1)
         except:
@@ -177,6 +188,11 @@ class HotkeyGUI:
         self.purchase_webhook_enabled = True
         self.recovery_webhook_enabled = True
         self.bait_webhook_enabled = True
+        self.webhook_digest_enabled = False
+        self.webhook_digest_minutes = 5
+        self.webhook_attachments_enabled = False
+        self.webhook_attachment_max_kb = 256
+        self.webhook_attachment_quality = 80
         
                                          
         self.auto_bait_enabled = False
@@ -256,31 +272,50 @@ class HotkeyGUI:
         self.loops_per_purchase = 1
         
                                   
-        self.theme_manager = ThemeManager(self)
+        with self.profiler.section('themes'):
+            self.theme_manager = ThemeManager(self)
         
                                    
-        self.layout_manager = LayoutManager(self)
+        with self.profiler.section('layouts'):
+            self.layout_manager = LayoutManager(self)
         
                                     
-        try:
-            from src.webhook import WebhookManager
-        except ImportError:
-            from webhook import WebhookManager
-        self.webhook_manager = WebhookManager(self)
+        with self.profiler.section('webhook'):
+            try:
+                from src.webhook import WebhookManager
+            except ImportError:
+                from webhook import WebhookManager
+            self.webhook_manager = WebhookManager(self)
+        
+        self.settings_model = SettingsModel()
+        self.settings_store = SettingsStore()
+        
+        with self.profiler.section('session_db'):
+            try:
+                self.session_db = SessionDatabase()
+            except Exception as e:
+                print(f"⚠️ Catch history disabled: {e}")
+                self.session_db = None
+        self.history_window = None
+        self.telemetry = TelemetryWriter()
+        if not self.telemetry.enabled:
+            print("⚠️ Telemetry disabled (install pyarrow or numpy)")
         
                                     
-        try:
-            from src.overlay import OverlayManager
-        except ImportError:
-            from overlay import OverlayManager
-        self.overlay_manager = OverlayManager(self)
+        with self.profiler.section('overlay'):
+            try:
+                from src.overlay import OverlayManager
+            except ImportError:
+                from overlay import OverlayManager
+            self.overlay_manager = OverlayManager(self)
         
                                 
-        try:
-            from src.ocr_manager import OCRManager
-        except ImportError:
-            from ocr_manager import OCRManager
-        self.ocr_manager = OCRManager(self)                      
+        with self.profiler.section('ocr'):
+            try:
+                from src.ocr_manager import OCRManager
+            except ImportError:
+                from ocr_manager import OCRManager
+            self.ocr_manager = OCRManager(self)                      
         
                                                                                  
         self.ocr_performance_mode = "fast"
@@ -288,21 +323,24 @@ class HotkeyGUI:
             self.ocr_manager.set_performance_mode(self.ocr_performance_mode)
         
                                     
-        try:
-            from src.zoom_controller import ZoomController
-        except ImportError:
-            from zoom_controller import ZoomController
-        self.zoom_controller = ZoomController(self)
+        with self.profiler.section('zoom'):
+            try:
+                from src.zoom_controller import ZoomController
+            except ImportError:
+                from zoom_controller import ZoomController
+            self.zoom_controller = ZoomController(self)
         
                                  
-        try:
-            from src.bait_manager import BaitManager
-        except ImportError:
-            from bait_manager import BaitManager
-        self.bait_manager = BaitManager(self)
+        with self.profiler.section('bait'):
+            try:
+                from src.bait_manager import BaitManager
+            except ImportError:
+                from bait_manager import BaitManager
+            self.bait_manager = BaitManager(self)
         
                                 
-        self.fishing_bot = FishingBot(self)
+        with self.profiler.section('fishing bot'):
+            self.fishing_bot = FishingBot(self)
         
                            
         self.presets_dir = "presets"
@@ -310,12 +348,15 @@ class HotkeyGUI:
             os.makedirs(self.presets_dir)
         
                                                      
-        self.load_basic_settings()
+        with self.profiler.section('load settings'):
+            self.load_basic_settings()
         
-        self.create_widgets()
+        with self.profiler.section('widgets'):
+            self.create_widgets()
         
                                                              
-        self.load_ui_settings()
+        with self.profiler.section('apply settings'):
+            self.load_ui_settings()
         
                                                               
         self.refresh_button_labels()
@@ -323,11 +364,14 @@ class HotkeyGUI:
                                                
         self.setup_console_redirect()
         
-        self.apply_theme()
-        self.register_hotkeys()
+        with self.profiler.section('theme'):
+            self.apply_theme()
+        with self.profiler.section('hotkeys'):
+            self.register_hotkeys()
         
                                                    
         self.schedule_periodic_update()
+        self.ui_bus.start()
         
                                                        
         window_width = getattr(self, 'window_width', 800)
@@ -348,11 +392,39 @@ class HotkeyGUI:
                 from src.updater import UpdateManager
             except ImportError:
                 from updater import UpdateManager
-            self.update_manager = UpdateManager(self)
+            with self.profiler.section('updater'):
+                self.update_manager = UpdateManager(self)
             print("✅ Simple UpdateManager initialized")
         except Exception as e:
             print(f"❌ Failed to initialize UpdateManager: {e}")
             self.update_manager = None
+        
+        self.root.after_idle(self._on_first_idle)
+    
+    def _on_first_idle(self):
+        """Runs once Tk has drawn the window and is waiting for input"""
+        self.profiler.mark('interactive')
+        self.profiler.report()
+        if self.profiler.exit_after_paint:
+            self.root.after(0, self.exit_app)
+            return
+        self.root.after(1, self.load_window_images)
+        if hasattr(self, 'ocr_manager') and hasattr(self.ocr_manager, 'warm_up'):
+            self.ocr_manager.warm_up()
+    
+    def load_window_images(self):
+        """Load the window icon and header logo (PIL is imported here, after first paint)"""
+        if not PIL_AVAILABLE:
+            return
+        icon_photo = self.theme_manager.load_logo_for_theme(self.current_theme, 32)
+        if icon_photo:
+            self.root.iconphoto(True, icon_photo)
+        
+        logo_photo = self.theme_manager.load_logo_for_theme(self.current_theme, 48)
+        if logo_photo:
+            logo_label = ttk.Label(self.header_frame, image=logo_photo)
+            logo_label.image = logo_photo
+            logo_label.grid(row=0, column=0, pady=(0, 8))
     
     def create_scrollable_frame(self):
         """Create a modern scrollable frame using tkinter Canvas and Scrollbar"""
@@ -452,17 +524,8 @@ class HotkeyGUI:
         header_frame.grid(row=current_row, column=0, sticky='ew', pady=(0, 15))
         header_frame.columnconfigure(0, weight=1)
         
-                         
-        try:
-            if PIL_AVAILABLE and os.path.exists("images/icon.webp"):
-                logo_image = Image.open("images/icon.webp")
-                logo_image = logo_image.resize((48, 48), Image.Resampling.LANCZOS)
-                logo_photo = ImageTk.PhotoImage(logo_image)
-                logo_label = ttk.Label(header_frame, image=logo_photo)
-                logo_label.image = logo_photo
-                logo_label.grid(row=0, column=0, pady=(0, 8))
-        except Exception as e:
-            print(f"Could not load header logo: {e}")
+                                                                      
+        self.header_frame = header_frame
         
                                  
         title_container = ttk.Frame(header_frame)
@@ -500,6 +563,11 @@ class HotkeyGUI:
         self.themes_btn.pack(side=tk.LEFT, padx=5)
         ToolTip(self.themes_btn, "Customize appearance themes")
         
+        self.history_btn = ttk.Button(toolbar, text='📜 History', 
+                                      command=self.open_history_window, style='TButton')
+        self.history_btn.pack(side=tk.LEFT, padx=5)
+        ToolTip(self.history_btn, "Browse recorded casts, catches and drops")
+        
         current_row += 1
         
                                                        
@@ -569,16 +637,35 @@ class HotkeyGUI:
             btn.grid(row=0, column=i, sticky='ew', padx=1, pady=1)
             self.tab_buttons[name] = btn
         
-                       
-        self.create_overview_tab()
-        self.create_setup_tab()
-        self.create_features_tab()
+                                                                          
+        self.tab_builders = {
+            'Overview': self.create_overview_tab,
+            'Setup': self.create_setup_tab,
+            'Features': self.create_features_tab
+        }
+        self.built_tabs = set()
         
                         
         self.switch_tab(self.overview_tab, 'Overview')
     
+    def build_tab(self, name):
+        """Build a tab's widgets on first view and fill them from the settings model"""
+        if name in self.built_tabs:
+            return
+        self.built_tabs.add(name)
+        with self.profiler.section(f'{name} tab'):
+            self.tab_builders[name]()
+        
+                                                                                  
+        if hasattr(self, 'status_msg'):
+            self._loading_settings = True
+            self.load_ui_settings()
+            self.refresh_button_labels()
+    
     def switch_tab(self, frame, name):
         """Switch to a different tab"""
+        self.build_tab(name)
+        
                        
         for tab in [self.overview_tab, self.setup_tab, self.features_tab]:
             tab.grid_remove()
@@ -674,6 +761,10 @@ class HotkeyGUI:
                                        style='StatCard.TLabel', anchor='center')
         self.bait_used_stat.grid(row=1, column=1, sticky='ew', padx=5, pady=5)
         
+        for key, label in (('fish', self.total_fish_stat), ('fruits', self.fruits_caught_stat),
+                           ('session', self.session_time_stat), ('bait', self.bait_used_stat)):
+            self.stats_view.bind(key, label, label.cget('text'))
+        
                        
         activity_section = ttk.LabelFrame(content, text="�️ Developer Log", padding=15)
         activity_section.grid(row=2, column=0, sticky='ew', pady=(0, 15))
@@ -2053,7 +2144,7 @@ Sequence (per user spec):
     def start_fishing(self):
         """Start fishing from scratch"""
                                                
-        if getattr(self, 'auto_purchase_var', None) and self.auto_purchase_var.get():
+        if self.settings_model.get('auto_purchase_enabled'):
             pts = getattr(self, 'point_coords', {})
             missing = [i for i in [1, 2, 3] if not pts.get(i)]
             if missing:
@@ -2066,6 +2157,8 @@ Sequence (per user spec):
         self.start_time = time.time()
         self.total_paused_time = 0
         self.reset_fish_counter()
+        session_id = self.session_db.start_session() if self.session_db else None
+        self.telemetry.start_session(session_id)
         
                    
         self.loop_status.config(text='● Main Loop: ACTIVE', style='StatusOn.TLabel')
@@ -2078,7 +2171,7 @@ Sequence (per user spec):
         self.main_loop_thread.start()
         
                              
-        self.update_runtime_timer()
+        self.update_stats_display()
         
         self.log('🎣 Started fishing!', "important")
     
@@ -2121,7 +2214,7 @@ Sequence (per user spec):
         self.main_loop_thread.start()
         
                               
-        self.update_runtime_timer()
+        self.update_stats_display()
         
         self.log('▶️ Fishing resumed with smart detection', "important")
     
@@ -2175,17 +2268,14 @@ Sequence (per user spec):
         self.last_fish_time = time.time()
         self.last_activity_time = time.time()
         
-        try:
-            self.root.after(0, lambda: self.fish_counter_label.config(text=f'🐟 Fish: {self.fish_count}'))
-        except Exception:
-            pass
+        self.ui_bus.post('fish_count', self.fish_count)
         self.log(f'🐟 Fish caught: {self.fish_count}', "important")
         
                                     
         self.update_bait_status_display()
         
                           
-        self.root.after(0, lambda: self.update_stats_display())
+        self.ui_bus.post('stats')
         
                                          
         if self.webhook_enabled and self.webhook_counter >= self.webhook_interval:
@@ -2193,55 +2283,53 @@ Sequence (per user spec):
                 self.webhook_manager.send_fishing_progress()
             self.webhook_counter = 0
 
+    def record_event(self, kind, duration=None, detail=None):
+        """Queue a history event (cast, catch, timeout, drop, fruit, purchase, recovery)"""
+        if self.session_db:
+            self.session_db.record(kind, duration, detail)
+
+    def open_history_window(self):
+        """Open the paged catch history window"""
+        if not self.session_db:
+            messagebox.showinfo('Catch History', 'Catch history is unavailable (database could not be opened).')
+            return
+        if self.history_window is None:
+            try:
+                from src.history_view import HistoryWindow
+            except ImportError:
+                from history_view import HistoryWindow
+            self.history_window = HistoryWindow(self, self.session_db)
+        self.history_window.show()
+
     def reset_fish_counter(self):
         """Reset fish counter when main loop starts"""
         self.fish_count = 0
         self.webhook_counter = 0
-        try:
-            self.root.after(0, lambda: self.fish_counter_label.config(text=f'🐟 Fish: {self.fish_count}'))
-        except Exception:
-            pass
+        self.ui_bus.post('fish_count', self.fish_count)
     
 
 
 
 
     def update_stats_display(self):
-        """Update the stats display labels with current values"""
+        """Repaint the stat labels whose text changed since the last refresh"""
         try:
-            if not hasattr(self, 'total_fish_stat'):
-                return
-                
-                                    
-            self.total_fish_stat.config(text=f'Total Fish Caught\n{self.fish_count}')
-            
-                                        
-            devil_fruits = len(getattr(self, 'devil_fruits_caught', []))
-            self.fruits_caught_stat.config(text=f'Devil Fruits Found\n{devil_fruits}')
-            
-                                   
-            if self.start_time:
-                if self.is_paused:
-                    elapsed = (self.pause_time - self.start_time) - self.total_paused_time
-                else:
-                    current_time = time.time()
-                    elapsed = (current_time - self.start_time) - self.total_paused_time
-                
-                hours = int(elapsed) // 3600
-                minutes = (int(elapsed) % 3600) // 60
-                seconds = int(elapsed) % 60
-                time_str = f'{hours:02d}:{minutes:02d}:{seconds:02d}'
-            else:
-                time_str = '00:00:00'
-            
-            self.session_time_stat.config(text=f'Session Time\n{time_str}')
-            
-                                       
-            bait_purchased = getattr(self, 'bait_purchased', 0)
-            self.bait_used_stat.config(text=f'Bait Purchased\n{bait_purchased}')
+            self.stats_view.render(self.stats_view_model.texts())
         except Exception as e:
             pass
 
+    def register_ui_events(self):
+        """Register the Tk-thread handlers for updates posted by worker threads"""
+        self.ui_bus.register('stats', self.update_stats_display)
+        self.ui_bus.register('fish_count', self._show_fish_count)
+        self.ui_bus.register('layout', lambda: self.overlay_manager.update_layout())
+        self.ui_bus.register('drop_text', lambda text: self.overlay_manager_drop.display_captured_text(text))
+        self.ui_bus.register('activity', self.add_activity, coalesce=False)
+
+    def _show_fish_count(self, count):
+        if hasattr(self, 'fish_counter_label'):
+            self.fish_counter_label.config(text=f'🐟 Fish: {count}')
+
     def schedule_periodic_update(self):
         """Schedule the periodic stats update to run every second"""
         try:
@@ -2250,10 +2338,9 @@ Sequence (per user spec):
             pass
     
     def periodic_update(self):
-        """Update stats every second to keep session time fresh"""
+        """Single once-a-second stats tick; unchanged labels are skipped, so idle ticks cost no redraws"""
         try:
-            if self.main_loop_active and self.start_time:
-                self.update_stats_display()
+            self.update_stats_display()
         except Exception as e:
             pass
         finally:
@@ -2267,7 +2354,7 @@ Sequence (per user spec):
 
     def check_and_purchase(self):
         """Check if we need to auto-purchase and run sequence if needed"""            
-        if getattr(self, 'auto_purchase_var', None) and self.auto_purchase_var.get():
+        if self.settings_model.get('auto_purchase_enabled'):
             self.purchase_counter += 1
             loops_needed = int(getattr(self, 'loops_per_purchase', 1)) if getattr(self, 'loops_per_purchase', None) is not None else 1
             print(f'🔄 Purchase counter: {self.purchase_counter}/{loops_needed}')
@@ -2311,48 +2398,28 @@ Sequence (per user spec):
     
 
     
-    def update_runtime_timer(self):
-        """Update the runtime display"""
-        if not self.main_loop_active and not self.is_paused:
-            return
-            
-        if self.start_time:
-            current_time = time.time()
-            if self.is_paused and self.pause_time:
-                                                           
-                elapsed = (self.pause_time - self.start_time) - self.total_paused_time
-            else:
-                                                                   
-                elapsed = (current_time - self.start_time) - self.total_paused_time
-            
-            hours = int(elapsed // 3600)
-            minutes = int((elapsed % 3600) // 60)
-            seconds = int(elapsed % 60)
-            
-            runtime_text = f'⏱️ Runtime: {hours:02d}:{minutes:02d}:{seconds:02d}'
-            
-            try:
-                self.root.after(0, lambda: self.runtime_label.config(text=runtime_text))
-            except Exception:
-                pass
-        
-                                              
-        if self.main_loop_active or self.is_paused:
-            self.root.after(1000, self.update_runtime_timer)
-
-
-
-
     def exit_app(self):
         """Exit the application"""
         print('Exiting application...')
         self.main_loop_active = False
+        self.ui_bus.stop()
         
                                         
         try:
             self.auto_save_settings()
+            self.settings_store.close()
         except Exception as e:
             print(f"Error saving settings: {e}")
+        
+        if self.session_db:
+            try:
+                self.session_db.close()
+            except Exception as e:
+                print(f"Error closing history database: {e}")
+        try:
+            self.telemetry.close()
+        except Exception as e:
+            print(f"Error writing telemetry: {e}")
 
 
 
@@ -2368,6 +2435,18 @@ Sequence (per user spec):
             except Exception:
                 pass
 
+        if hasattr(self, 'ocr_manager'):
+            try:
+                self.ocr_manager.shutdown()
+            except Exception:
+                pass
+
+        if hasattr(self, 'webhook_manager'):
+            try:
+                self.webhook_manager.close()
+            except Exception:
+                pass
+
                                     
         try:
             keyboard.unhook_all()
@@ -2703,6 +2782,54 @@ Sequence (per user spec):
         self.webhook_interval_var.trace_add('write', lambda *args: (setattr(self, 'webhook_interval', self.webhook_interval_var.get()), self.auto_save_settings()))
         row += 1
         
+        self.webhook_digest_var = tk.BooleanVar(value=self.webhook_digest_enabled)
+        digest_check = ttk.Checkbutton(frame, text='📊 Digest Mode', variable=self.webhook_digest_var)
+        digest_check.grid(row=row, column=0, columnspan=2, pady=2, sticky='w')
+        help_btn = ttk.Button(frame, text='?', width=3)
+        help_btn.grid(row=row, column=2, padx=(10, 0), pady=2)
+        ToolTip(help_btn, "Batch notifications into one summary message per window. Fruit spawns, legendary fruits and repeated recoveries are still sent immediately")
+        self.webhook_digest_var.trace_add('write', lambda *args: (setattr(self, 'webhook_digest_enabled', self.webhook_digest_var.get()), self.auto_save_settings()))
+        row += 1
+        
+        ttk.Label(frame, text='Digest Every (min):').grid(row=row, column=0, sticky='e', pady=5, padx=(0, 10))
+        self.webhook_digest_minutes_var = tk.IntVar(value=self.webhook_digest_minutes)
+        digest_spinbox = ttk.Spinbox(frame, from_=1, to=60, textvariable=self.webhook_digest_minutes_var, width=10)
+        digest_spinbox.grid(row=row, column=1, pady=5, sticky='w')
+        help_btn = ttk.Button(frame, text='?', width=3)
+        help_btn.grid(row=row, column=2, padx=(10, 0), pady=5)
+        ToolTip(help_btn, "Minutes between digest messages when Digest Mode is on")
+        self.webhook_digest_minutes_var.trace_add('write', lambda *args: (setattr(self, 'webhook_digest_minutes', self.webhook_digest_minutes_var.get()), self.auto_save_settings()))
+        row += 1
+        
+        self.webhook_attachments_var = tk.BooleanVar(value=self.webhook_attachments_enabled)
+        attachments_check = ttk.Checkbutton(frame, text='🖼️ Attach Fruit Screenshots', variable=self.webhook_attachments_var)
+        attachments_check.grid(row=row, column=0, columnspan=2, pady=2, sticky='w')
+        help_btn = ttk.Button(frame, text='?', width=3)
+        help_btn.grid(row=row, column=2, padx=(10, 0), pady=2)
+        ToolTip(help_btn, "Attach a screenshot of the drop area to fruit catch and spawn alerts so OCR misreads can be checked")
+        self.webhook_attachments_var.trace_add('write', lambda *args: (setattr(self, 'webhook_attachments_enabled', self.webhook_attachments_var.get()), self.auto_save_settings()))
+        row += 1
+        
+        ttk.Label(frame, text='Screenshot Max (KB):').grid(row=row, column=0, sticky='e', pady=5, padx=(0, 10))
+        self.webhook_attachment_max_kb_var = tk.IntVar(value=self.webhook_attachment_max_kb)
+        max_kb_spinbox = ttk.Spinbox(frame, from_=32, to=8000, increment=32, textvariable=self.webhook_attachment_max_kb_var, width=10)
+        max_kb_spinbox.grid(row=row, column=1, pady=5, sticky='w')
+        help_btn = ttk.Button(frame, text='?', width=3)
+        help_btn.grid(row=row, column=2, padx=(10, 0), pady=5)
+        ToolTip(help_btn, "Size budget per screenshot. Quality and resolution are lowered until the image fits")
+        self.webhook_attachment_max_kb_var.trace_add('write', lambda *args: (setattr(self, 'webhook_attachment_max_kb', self.webhook_attachment_max_kb_var.get()), self.auto_save_settings()))
+        row += 1
+        
+        ttk.Label(frame, text='Screenshot Quality:').grid(row=row, column=0, sticky='e', pady=5, padx=(0, 10))
+        self.webhook_attachment_quality_var = tk.IntVar(value=self.webhook_attachment_quality)
+        quality_spinbox = ttk.Spinbox(frame, from_=10, to=100, increment=5, textvariable=self.webhook_attachment_quality_var, width=10)
+        quality_spinbox.grid(row=row, column=1, pady=5, sticky='w')
+        help_btn = ttk.Button(frame, text='?', width=3)
+        help_btn.grid(row=row, column=2, padx=(10, 0), pady=5)
+        ToolTip(help_btn, "Starting WebP quality for screenshots (lower = smaller files)")
+        self.webhook_attachment_quality_var.trace_add('write', lambda *args: (setattr(self, 'webhook_attachment_quality', self.webhook_attachment_quality_var.get()), self.auto_save_settings()))
+        row += 1
+        
                                            
         ttk.Label(frame, text='Notification Types:', font=('TkDefaultFont', 9, 'bold')).grid(row=row, column=0, columnspan=3, pady=(10, 5), sticky='w')
         row += 1
@@ -3518,337 +3645,39 @@ Sequence (per user spec):
             print(f"🔧 Zoom settings updated: Out={self.zoom_out_var.get()}, In={self.zoom_in_var.get()}")
 
     def apply_theme(self):
-        """Apply the current theme to the application"""
-        style = ttk.Style()
-        
-                                             
+        """
+        Apply the current theme to the application
+        Styles come from the theme's cached style table; only options that differ
+        from the previously applied theme are pushed to ttk.
+        """
+        start = time.perf_counter()
         theme_colors = self.theme_manager.themes[self.current_theme]["colors"]
-        is_dark = theme_colors["bg"] == "#0d1117"
-        
-        if is_dark:
-                                                                  
-            self.root.configure(bg=theme_colors["bg"])
-            style.theme_use('clam')
-            
-                                
-            style.configure('TFrame', 
-                          background=theme_colors["bg"],
-                          relief='flat',
-                          borderwidth=0)
-            
-            style.configure('TLabel', 
-                          background=theme_colors["bg"], 
-                          foreground=theme_colors["fg"],
-                          font=('Segoe UI', 9))
-            
-                                   
-            style.configure('TButton',
-                          background=theme_colors["button_bg"],
-                          foreground=theme_colors["fg"],
-                          borderwidth=1,
-                          focuscolor='none',
-                          font=('Segoe UI', 9),
-                          relief='flat')
-            style.map('TButton',
-                     background=[('active', theme_colors["button_hover"]), ('pressed', theme_colors["button_hover"])],
-                     bordercolor=[('active', theme_colors["accent"]), ('pressed', theme_colors["accent"])])
-            
-                                               
-            style.configure('Accent.TButton',
-                          background='#238636',
-                          foreground='#ffffff',
-                          borderwidth=0,
-                          font=('Segoe UI', 9, 'bold'))
-            style.map('Accent.TButton',
-                     background=[('active', '#2ea043'), ('pressed', '#1a7f37')])
-            
-                            
-            style.configure('Status.TButton',
-                          background='#1f6feb',
-                          foreground='#ffffff',
-                          borderwidth=0,
-                          font=('Segoe UI', 9))
-            style.map('Status.TButton',
-                     background=[('active', '#388bfd'), ('pressed', '#0969da')])
-            
-            style.configure('TCheckbutton',
-                          background=theme_colors["bg"],
-                          foreground=theme_colors["fg"],
-                          focuscolor='none',
-                          font=('Segoe UI', 9))
-            style.map('TCheckbutton',
-                     background=[('active', theme_colors["bg"]),
-                               ('selected', theme_colors["bg"])])
-            
-            style.configure('TSpinbox',
-                          fieldbackground=theme_colors["button_bg"],
-                          background=theme_colors["button_bg"],
-                          foreground=theme_colors["fg"],
-                          bordercolor=theme_colors["accent"],
-                          arrowcolor=theme_colors["fg"],
-                          insertcolor=theme_colors["fg"],
-                          selectbackground=theme_colors["accent"],
-                          selectforeground=theme_colors["bg"],
-                          font=('Segoe UI', 9))
-            style.map('TSpinbox',
-                     fieldbackground=[('focus', theme_colors["button_hover"])],
-                     bordercolor=[('focus', theme_colors["accent"])])
-            
-                                                  
-            style.configure('Vertical.TScrollbar',
-                          background=theme_colors["scrollbar_bg"],
-                          troughcolor=theme_colors["scrollbar_trough"],
-                          bordercolor=theme_colors["scrollbar_active"],
-                          arrowcolor=theme_colors["fg"],
-                          darkcolor=theme_colors["scrollbar_bg"],
-                          lightcolor=theme_colors["scrollbar_active"])
-            style.map('Vertical.TScrollbar',
-                     background=[('active', theme_colors["scrollbar_active"]), ('pressed', theme_colors["scrollbar_pressed"])])
-            
-                            
-            style.configure('Title.TLabel',
-                          background=theme_colors["bg"],
-                          foreground=theme_colors["accent"],
-                          font=('Segoe UI', 18, 'bold'))
-            
-            style.configure('Subtitle.TLabel',
-                          background=theme_colors["bg"],
-                          foreground=theme_colors["fg"],
-                          font=('Segoe UI', 8))
-            
-                                   
-            style.configure('SectionTitle.TLabel',
-                          background=theme_colors["bg"],
-                          foreground=theme_colors["accent"],
-                          font=('Segoe UI', 11, 'bold'))
-            
-                           
-            style.configure('StatusOn.TLabel',
-                          background=theme_colors["bg"],
-                          foreground=theme_colors["success"],
-                          font=('Segoe UI', 10, 'bold'))
-            
-            style.configure('StatusOff.TLabel',
-                          background=theme_colors["bg"],
-                          foreground=theme_colors["error"],
-                          font=('Segoe UI', 10))
-            
-            style.configure('StatusInfo.TLabel',
-                          background=theme_colors["bg"],
-                          foreground=theme_colors["accent"],
-                          font=('Segoe UI', 10, 'bold'))
-            
-            style.configure('Counter.TLabel',
-                          background=theme_colors["bg"],
-                          foreground=theme_colors["fg"],
-                          font=('Segoe UI', 11, 'bold'))
-            
-                                                    
-            if hasattr(self, 'canvas'):
-                self.canvas.configure(bg=theme_colors["bg"])
-            
-                                                    
-            self.update_fishing_location_colors()
-        else:
-                                                   
-            self.root.configure(bg=theme_colors["bg"])
-            style.theme_use('clam')
-            
-                                
-            style.configure('TFrame', 
-                          background=theme_colors["bg"],
-                          relief='flat',
-                          borderwidth=0)
-            
-            style.configure('TLabel', 
-                          background=theme_colors["bg"], 
-                          foreground=theme_colors["fg"],
-                          font=('Segoe UI', 9))
-            
-                                                  
-            style.configure('TButton',
-                          background=theme_colors["button_bg"],
-                          foreground=theme_colors["fg"],
-                          borderwidth=1,
-                          focuscolor='none',
-                          font=('Segoe UI', 9),
-                          relief='flat')
-            style.map('TButton',
-                     background=[('active', theme_colors["button_hover"]), ('pressed', theme_colors["button_hover"])],
-                     bordercolor=[('active', theme_colors["accent"]), ('pressed', theme_colors["accent"])])
-            
-                                               
-            style.configure('Accent.TButton',
-                          background='#2da44e',
-                          foreground='#ffffff',
-                          borderwidth=0,
-                          font=('Segoe UI', 9, 'bold'))
-            style.map('Accent.TButton',
-                     background=[('active', '#2c974b'), ('pressed', '#298e46')])
-            
-                            
-            style.configure('Status.TButton',
-                          background='#0969da',
-                          foreground='#ffffff',
-                          borderwidth=0,
-                          font=('Segoe UI', 9))
-            style.map('Status.TButton',
-                     background=[('active', '#0860ca'), ('pressed', '#0757ba')])
-            
-            style.configure('TCheckbutton',
-                          background=theme_colors["bg"],
-                          foreground=theme_colors["fg"],
-                          focuscolor='none',
-                          font=('Segoe UI', 9))
-            style.map('TCheckbutton',
-                     background=[('active', theme_colors["bg"]),
-                               ('selected', theme_colors["bg"])])
-            
-            style.configure('TSpinbox',
-                          fieldbackground=theme_colors["button_bg"],
-                          background=theme_colors["button_bg"],
-                          foreground=theme_colors["fg"],
-                          bordercolor=theme_colors["accent"],
-                          arrowcolor=theme_colors["fg"],
-                          insertcolor=theme_colors["fg"],
-                          selectbackground=theme_colors["accent"],
-                          selectforeground=theme_colors["bg"],
-                          font=('Segoe UI', 9))
-            style.map('TSpinbox',
-                     fieldbackground=[('focus', theme_colors["button_hover"])],
-                     bordercolor=[('focus', theme_colors["accent"])])
-            
-                                                   
-            style.configure('TEntry',
-                          fieldbackground='#f6f8fa',
-                          background='#e1e4e8',
-                          foreground='#24292f',
-                          bordercolor='#d0d7de',
-                          font=('Segoe UI', 9))
-            
-                                                  
-            style.configure('Vertical.TScrollbar',
-                          background=theme_colors["scrollbar_bg"],
-                          troughcolor=theme_colors["scrollbar_trough"],
-                          bordercolor=theme_colors["scrollbar_active"],
-                          arrowcolor=theme_colors["fg"],
-                          darkcolor=theme_colors["scrollbar_bg"],
-                          lightcolor=theme_colors["scrollbar_active"])
-            style.map('Vertical.TScrollbar',
-                     background=[('active', theme_colors["scrollbar_active"]), ('pressed', theme_colors["scrollbar_pressed"])])
-            
-                            
-            style.configure('Title.TLabel',
-                          background=theme_colors["bg"],
-                          foreground=theme_colors["accent"],
-                          font=('Segoe UI', 18, 'bold'))
-            
-            style.configure('Subtitle.TLabel',
-                          background=theme_colors["bg"],
-                          foreground=theme_colors["fg"],
-                          font=('Segoe UI', 8))
-            
-                                   
-            style.configure('SectionTitle.TLabel',
-                          background=theme_colors["bg"],
-                          foreground=theme_colors["accent"],
-                          font=('Segoe UI', 11, 'bold'))
-            
-                           
-            style.configure('StatusOn.TLabel',
-                          background=theme_colors["bg"],
-                          foreground=theme_colors["success"],
-                          font=('Segoe UI', 10, 'bold'))
-            
-            style.configure('StatusOff.TLabel',
-                          background=theme_colors["bg"],
-                          foreground=theme_colors["error"],
-                          font=('Segoe UI', 10))
-            
-            style.configure('StatusInfo.TLabel',
-                          background=theme_colors["bg"],
-                          foreground=theme_colors["accent"],
-                          font=('Segoe UI', 10, 'bold'))
-            
-            style.configure('Counter.TLabel',
-                          background=theme_colors["bg"],
-                          foreground=theme_colors["fg"],
-                          font=('Segoe UI', 11, 'bold'))
-            
-                                                     
-            if hasattr(self, 'canvas'):
-                self.canvas.configure(bg=theme_colors["bg"])
-            
-                                                    
-            self.update_fishing_location_colors()
         
-                                                      
-                                          
-        style.configure('Badge.TLabel',
-                      background='#238636',
-                      foreground='#ffffff',
-                      font=('Segoe UI', 9, 'bold'),
-                      padding=(8, 2))
-        
-                                                                             
-        style.configure('StatCard.TLabel',
-                      background=theme_colors["button_bg"],
-                      foreground=theme_colors["fg"],
-                      font=('Segoe UI', 11),
-                      padding=15,
-                      relief='flat')
-        
-                                
-        style.configure('Description.TLabel',
-                      background=theme_colors["bg"],
-                      foreground=theme_colors["fg"],
-                      font=('Segoe UI', 9))
-        
-                            
-        style.configure('Status.TLabel',
-                      background=theme_colors["bg"],
-                      foreground=theme_colors["accent"],
-                      font=('Segoe UI', 9, 'italic'))
+        self.root.configure(bg=theme_colors["bg"])
+        changed = self.theme_manager.apply_styles(self.current_theme)
         
-                                                     
-        style.configure('TLabelframe',
-                      background=theme_colors["bg"],
-                      foreground=theme_colors["fg"],
-                      borderwidth=1,
-                      bordercolor=theme_colors["button_bg"],
-                      relief='solid')
-        
-        style.configure('TLabelframe.Label',
-                      background=theme_colors["bg"],
-                      foreground=theme_colors["accent"],
-                      font=('Segoe UI', 10, 'bold'))
+                                                
+        if hasattr(self, 'canvas'):
+            self.canvas.configure(bg=theme_colors["bg"])
         
-                                                 
-        style.configure('Tab.TButton',
-                      background=theme_colors["button_bg"],
-                      foreground=theme_colors["fg"],
-                      borderwidth=0,
-                      relief='flat',
-                      padding=[10, 15],
-                      font=('Segoe UI', 11))
-        style.map('Tab.TButton',
-                 background=[('active', theme_colors["button_hover"])],
-                 foreground=[('active', theme_colors["fg"])])
+                                                
+        self.update_fishing_location_colors()
         
-                                 
-        style.configure('TabActive.TButton',
-                      background=theme_colors["accent"],
-                      foreground='#ffffff',
-                      borderwidth=0,
-                      relief='flat',
-                      padding=[10, 15],
-                      font=('Segoe UI', 11, 'bold'))
-        style.map('TabActive.TButton',
-                 background=[('active', theme_colors["accent"])],
-                 foreground=[('active', '#ffffff')])
-
-
-
+        apply_ms = (time.perf_counter() - start) * 1000
+        self.root.after_idle(lambda: self._record_theme_switch(start, apply_ms, changed))
+    
+    def _record_theme_switch(self, start, apply_ms, changed):
+        """Log theme switch latency once Tk has finished redrawing"""
+        total_ms = (time.perf_counter() - start) * 1000
+        self.theme_switch_stats = {
+            'theme': self.current_theme,
+            'apply_ms': apply_ms,
+            'total_ms': total_ms,
+            'options_changed': changed,
+            'options_total': self.theme_manager.style_applier.stats['last_total_options']
+        }
+        self.log(f"🎨 Theme '{self.current_theme}' applied in {apply_ms:.1f}ms, redrawn in {total_ms:.1f}ms "
+                 f"({changed}/{self.theme_switch_stats['options_total']} style options changed)", "verbose")
 
     def on_window_resize(self, event):
         """Handle window resize events and save window size"""
@@ -3882,103 +3711,115 @@ Sequence (per user spec):
             print(f"Error saving window size: {e}")
 
     def auto_save_settings(self):
-        """Auto-save current settings to default.json"""
-        loading_flag = getattr(self, '_loading_settings', False)
-        print(f"💾 auto_save_settings() called, _loading_settings={loading_flag}")
-        
-        if loading_flag:
-            print("⏸️ Skipping auto-save during initialization")
+        """
+        Push the current UI values into the settings model and persist them if anything changed
+        SettingsStore debounces the save and writes on its own thread
+        """
+        if getattr(self, '_loading_settings', False):
             return
             
         try:
-            print("💾 Auto-saving settings...")
-            
             if not hasattr(self, 'auto_purchase_var'):
-                print("⚠️ Skipping save - GUI not fully initialized")
                 return                                 
             
-            preset_data = {
-                                        
-                'auto_purchase_enabled': self.auto_purchase_var.get() if hasattr(self, 'auto_purchase_var') else False,
-                'auto_purchase_amount': self._safe_get_int(self.amount_var, getattr(self, 'auto_purchase_amount', 100)) if hasattr(self, 'amount_var') else 100,
-                'loops_per_purchase': self._safe_get_int(self.loops_var, getattr(self, 'loops_per_purchase', 1)) if hasattr(self, 'loops_var') else 1,
-                'purchase_interval': self.purchase_interval.get() if hasattr(self, 'purchase_interval') else 0,
-                'point_coords': getattr(self, 'point_coords', {}),
-                
-                                        
-                'fruit_coords': getattr(self, 'fruit_coords', {}),
-                'fishing_location': getattr(self, 'fishing_location', None),
-                'fruit_storage_enabled': self.fruit_storage_var.get() if hasattr(self, 'fruit_storage_var') else False,
-                'fruit_storage_key': getattr(self, 'fruit_storage_key', '2'),
-                'fruit_storage_key_2': getattr(self, 'fruit_storage_key_2', '3'),
-                'rod_key': getattr(self, 'rod_key', '1'),
-                
-                                    
-                'auto_bait_enabled': self.auto_bait_var.get() if hasattr(self, 'auto_bait_var') else False,
-                'top_bait_coords': getattr(self, 'top_bait_coords', None),
-                'top_bait_coords_2': getattr(self, 'top_bait_coords_2', None),
-                
-                                        
-                'kp': getattr(self, 'kp', 0.1),
-                'kd': getattr(self, 'kd', 0.5),
-                'scan_timeout': getattr(self, 'scan_timeout', 15.0),
-                'wait_after_loss': getattr(self, 'wait_after_loss', 1.0),
-                'smart_check_interval': getattr(self, 'smart_check_interval', 15.0),
-                
-                                  
-                'webhook_url': getattr(self, 'webhook_url', ''),
-                'webhook_enabled': self.webhook_var.get() if hasattr(self, 'webhook_var') else False,
-                'webhook_interval': getattr(self, 'webhook_interval', 10),
-                'fish_progress_webhook_enabled': getattr(self, 'fish_progress_webhook_enabled', True),
-                'devil_fruit_webhook_enabled': getattr(self, 'devil_fruit_webhook_enabled', True),
-                'fruit_spawn_webhook_enabled': getattr(self, 'fruit_spawn_webhook_enabled', True),
-                'purchase_webhook_enabled': getattr(self, 'purchase_webhook_enabled', True),
-                'recovery_webhook_enabled': getattr(self, 'recovery_webhook_enabled', True),
-                'bait_webhook_enabled': getattr(self, 'bait_webhook_enabled', True),
-                
-                              
-                'ocr_performance_mode': getattr(self, 'ocr_performance_mode', 'fast'),
-                
-                                      
-                'window_width': getattr(self, 'window_width', 420),
-                'window_height': getattr(self, 'window_height', 650),
+            self.settings_model.update(self.collect_settings())
+            if self.settings_model.take_dirty():
+                self.settings_store.save(self.settings_model.to_dict())
+            
+        except Exception as e:
+            print(f'❌ ERROR auto-saving settings: {e}')
+            import traceback
+            traceback.print_exc()
 
-                                
-                'dark_theme': getattr(self, 'dark_theme', True),
-                'current_theme': getattr(self, 'current_theme', 'default'),
-                'layout_settings': getattr(self.layout_manager, 'layouts', {}) if hasattr(self, 'layout_manager') else {},
+    def _var_or_setting(self, var_name, key):
+        """Value of a Tk variable, or the model's value while its tab has not been built yet"""
+        var = getattr(self, var_name, None)
+        if var is not None:
+            try:
+                return var.get()
+            except (tk.TclError, ValueError, AttributeError):
+                pass
+        return self.settings_model.get(key)
 
-                               
-                'zoom_settings': {
-                    'auto_zoom_enabled': getattr(self, 'auto_zoom_enabled', False),
-                    'auto_mouse_position_enabled': getattr(self, 'auto_mouse_position_enabled', False),
-                    'zoom_out_steps': self.zoom_out_var.get() if hasattr(self, 'zoom_out_var') else 5,
-                    'zoom_in_steps': self.zoom_in_var.get() if hasattr(self, 'zoom_in_var') else 8,
-                    'step_delay': 0.1,
-                    'sequence_delay': 0.5,
-                    'zoom_cooldown': 2.0
-                },
-                'last_saved': datetime.now().isoformat()
-            }
+    def collect_settings(self):
+        """Read every persisted setting from the Tk variables and app attributes (Tk thread only)"""
+        return {
+                                    
+            'auto_purchase_enabled': self._var_or_setting('auto_purchase_var', 'auto_purchase_enabled'),
+            'auto_purchase_amount': self._safe_get_int(self.amount_var, getattr(self, 'auto_purchase_amount', 100)) if hasattr(self, 'amount_var') else 100,
+            'loops_per_purchase': self._safe_get_int(self.loops_var, getattr(self, 'loops_per_purchase', 1)) if hasattr(self, 'loops_var') else 1,
+            'purchase_interval': self._var_or_setting('purchase_interval', 'purchase_interval'),
+            'point_coords': getattr(self, 'point_coords', {}),
             
-            print(f"💾 Zoom settings to save: auto_zoom_enabled={preset_data['zoom_settings']['auto_zoom_enabled']}, auto_mouse_position_enabled={preset_data['zoom_settings']['auto_mouse_position_enabled']}")
+                                    
+            'fruit_coords': getattr(self, 'fruit_coords', {}),
+            'fishing_location': getattr(self, 'fishing_location', None),
+            'fruit_storage_enabled': self._var_or_setting('fruit_storage_var', 'fruit_storage_enabled'),
+            'fruit_storage_key': getattr(self, 'fruit_storage_key', '2'),
+            'fruit_storage_key_2': getattr(self, 'fruit_storage_key_2', '3'),
+            'rod_key': getattr(self, 'rod_key', '1'),
             
-            settings_file = "default_settings.json"
-            with open(settings_file, 'w') as f:
-                json.dump(preset_data, f, indent=2)
+                                
+            'auto_bait_enabled': self._var_or_setting('auto_bait_var', 'auto_bait_enabled'),
+            'top_bait_coords': getattr(self, 'top_bait_coords', None),
+            'top_bait_coords_2': getattr(self, 'top_bait_coords_2', None),
             
-            print(f"✅ Settings saved to {settings_file}")
-            print(f"   - Auto Purchase: {preset_data['auto_purchase_enabled']}")
-            print(f"   - Fruit Storage: {preset_data['fruit_storage_enabled']}")
-            print(f"   - Auto Bait: {preset_data['auto_bait_enabled']}")
-            print(f"   - Webhook: {preset_data['webhook_enabled']}")
-            print(f"   - Point Coords: {len(preset_data['point_coords'])} points")
-            print(f"   - Fruit Coords: {len(preset_data['fruit_coords'])} points")
+                                    
+            'kp': getattr(self, 'kp', 0.1),
+            'kd': getattr(self, 'kd', 0.5),
+            'scan_timeout': getattr(self, 'scan_timeout', 15.0),
+            'wait_after_loss': getattr(self, 'wait_after_loss', 1.0),
+            'smart_check_interval': getattr(self, 'smart_check_interval', 15.0),
+            'recovery_enabled': getattr(self, 'recovery_enabled', True),
+            'purchase_delay_after_key': getattr(self, 'purchase_delay_after_key', 2.0),
+            'purchase_click_delay': getattr(self, 'purchase_click_delay', 1.0),
+            'purchase_after_type_delay': getattr(self, 'purchase_after_type_delay', 1.0),
+            'silent_mode': getattr(self, 'silent_mode', False),
+            'verbose_logging': getattr(self, 'verbose_logging', False),
             
-        except Exception as e:
-            print(f'❌ ERROR auto-saving settings: {e}')
-            import traceback
-            traceback.print_exc()
+                              
+            'webhook_url': getattr(self, 'webhook_url', ''),
+            'webhook_enabled': self._var_or_setting('webhook_var', 'webhook_enabled'),
+            'webhook_interval': getattr(self, 'webhook_interval', 10),
+            'fish_progress_webhook_enabled': getattr(self, 'fish_progress_webhook_enabled', True),
+            'devil_fruit_webhook_enabled': getattr(self, 'devil_fruit_webhook_enabled', True),
+            'fruit_spawn_webhook_enabled': getattr(self, 'fruit_spawn_webhook_enabled', True),
+            'purchase_webhook_enabled': getattr(self, 'purchase_webhook_enabled', True),
+            'recovery_webhook_enabled': getattr(self, 'recovery_webhook_enabled', True),
+            'bait_webhook_enabled': getattr(self, 'bait_webhook_enabled', True),
+            'webhook_digest_enabled': getattr(self, 'webhook_digest_enabled', False),
+            'webhook_digest_minutes': getattr(self, 'webhook_digest_minutes', 5),
+            'webhook_attachments_enabled': getattr(self, 'webhook_attachments_enabled', False),
+            'webhook_attachment_max_kb': getattr(self, 'webhook_attachment_max_kb', 256),
+            'webhook_attachment_quality': getattr(self, 'webhook_attachment_quality', 80),
+            
+                          
+            'ocr_performance_mode': getattr(self, 'ocr_performance_mode', 'fast'),
+            'ocr_burst_frames': getattr(self, 'ocr_burst_frames', 3),
+            'ocr_burst_window': getattr(self, 'ocr_burst_window', 0.4),
+            'ocr_vote_confidence': getattr(self, 'ocr_vote_confidence', 0.6),
+            'ocr_pool_size': getattr(self, 'ocr_pool_size', 0),
+            
+                                  
+            'window_width': getattr(self, 'window_width', 420),
+            'window_height': getattr(self, 'window_height', 650),
+
+                            
+            'dark_theme': getattr(self, 'dark_theme', True),
+            'current_theme': getattr(self, 'current_theme', 'default'),
+            'layout_settings': getattr(self.layout_manager, 'layouts', {}) if hasattr(self, 'layout_manager') else {},
+
+                           
+            'zoom_settings': {
+                'auto_zoom_enabled': getattr(self, 'auto_zoom_enabled', False),
+                'auto_mouse_position_enabled': getattr(self, 'auto_mouse_position_enabled', False),
+                'zoom_out_steps': self.zoom_out_var.get() if hasattr(self, 'zoom_out_var') else 5,
+                'zoom_in_steps': self.zoom_in_var.get() if hasattr(self, 'zoom_in_var') else 8,
+                'step_delay': 0.1,
+                'sequence_delay': 0.5,
+                'zoom_cooldown': 2.0
+            }
+        }
 
     def save_preset(self):
         """Save current settings to a preset file (excluding webhooks and keybinds)"""
@@ -3993,40 +3834,8 @@ Sequence (per user spec):
             preset_name = re.sub(r'[<>:"/\\|?*]', '_', preset_name)
             
                                                                
-            preset_data = {
-                                        
-                'auto_purchase_enabled': getattr(self, 'auto_purchase_var', None) and self.auto_purchase_var.get() if hasattr(self, 'auto_purchase_var') else False,
-                'auto_purchase_amount': getattr(self, 'auto_purchase_amount', 100),
-                'loops_per_purchase': getattr(self, 'loops_per_purchase', 1),
-                'point_coords': getattr(self, 'point_coords', {}),
-                
-                                        
-                'kp': getattr(self, 'kp', 0.1),
-                'kd': getattr(self, 'kd', 0.5),
-                
-                                 
-                'scan_timeout': getattr(self, 'scan_timeout', 15.0),
-                'wait_after_loss': getattr(self, 'wait_after_loss', 1.0),
-                'purchase_delay_after_key': getattr(self, 'purchase_delay_after_key', 2.0),
-                'purchase_click_delay': getattr(self, 'purchase_click_delay', 1.0),
-                'purchase_after_type_delay': getattr(self, 'purchase_after_type_delay', 1.0),
-                
-
-                
-                                    
-                'auto_bait_enabled': getattr(self, 'auto_bait_enabled', False),
-
-                
-                                   
-                'recovery_enabled': getattr(self, 'recovery_enabled', True),
-                
-                                      
-                'silent_mode': getattr(self, 'silent_mode', False),
-                'verbose_logging': getattr(self, 'verbose_logging', False),
-                
-                                
-                'dark_theme': getattr(self, 'dark_theme', True),
-            }
+            self.settings_model.update(self.collect_settings())
+            preset_data = self.settings_model.to_dict(PRESET_FIELDS)
             
                                     
             preset_file = os.path.join(self.presets_dir, f"{preset_name}.json")
@@ -4056,6 +3865,7 @@ Sequence (per user spec):
                               
             with open(preset_file, 'r') as f:
                 preset_data = json.load(f)
+            preset_data = Settings.from_dict(preset_data).to_dict()
             
                                                               
             
@@ -4227,7 +4037,7 @@ Sequence (per user spec):
                 # Also mirror into the activity log, if it exists
                 if hasattr(self.gui, 'activity_log') and message.strip():
                     try:
-                        self.gui.root.after(0, lambda msg=message: self.gui.add_activity(msg.strip()))
+                        self.gui.ui_bus.post('activity', message.strip())
                     except Exception:
                         pass
             
@@ -4249,22 +4059,12 @@ Sequence (per user spec):
         if not os.path.exists(settings_file):
             print("⚠️ No settings file found - using defaults")
                                               
-            self.settings = {
-                'zoom_settings': {
-                    'auto_zoom_enabled': False,
-                    'zoom_out_steps': 5,
-                    'zoom_in_steps': 8,
-                    'step_delay': 0.1,
-                    'sequence_delay': 0.5,
-                    'zoom_cooldown': 2.0
-                },
-                'layout_settings': {}
-            }
+            self.settings = self.settings_model.to_dict()
             return                                   
             
         try:
             with open(settings_file, 'r') as f:
-                preset_data = json.load(f)
+                preset_data = self.settings_model.load(json.load(f))
             
             print(f"✅ Settings file loaded successfully")
             print(f"   - Auto Purchase: {preset_data.get('auto_purchase_enabled', False)}")
@@ -4299,6 +4099,10 @@ Sequence (per user spec):
             self.scan_timeout = preset_data.get('scan_timeout', 15.0)
             self.wait_after_loss = preset_data.get('wait_after_loss', 1.0)
             self.smart_check_interval = preset_data.get('smart_check_interval', 15.0)
+            self.recovery_enabled = preset_data.get('recovery_enabled', True)
+            self.purchase_delay_after_key = preset_data.get('purchase_delay_after_key', 2.0)
+            self.purchase_click_delay = preset_data.get('purchase_click_delay', 1.0)
+            self.purchase_after_type_delay = preset_data.get('purchase_after_type_delay', 1.0)
             self.webhook_url = preset_data.get('webhook_url', '')
             self.webhook_enabled = preset_data.get('webhook_enabled', False)
             self.webhook_interval = preset_data.get('webhook_interval', 10)
@@ -4310,12 +4114,27 @@ Sequence (per user spec):
             self.purchase_webhook_enabled = preset_data.get('purchase_webhook_enabled', True)
             self.recovery_webhook_enabled = preset_data.get('recovery_webhook_enabled', True)
             self.bait_webhook_enabled = preset_data.get('bait_webhook_enabled', True)
+            self.webhook_digest_enabled = preset_data.get('webhook_digest_enabled', False)
+            self.webhook_digest_minutes = preset_data.get('webhook_digest_minutes', 5)
+            self.webhook_attachments_enabled = preset_data.get('webhook_attachments_enabled', False)
+            self.webhook_attachment_max_kb = preset_data.get('webhook_attachment_max_kb', 256)
+            self.webhook_attachment_quality = preset_data.get('webhook_attachment_quality', 80)
             
                                        
             self.ocr_performance_mode = preset_data.get('ocr_performance_mode', 'fast')
             if hasattr(self, 'ocr_manager') and hasattr(self.ocr_manager, 'set_performance_mode'):
                 self.ocr_manager.set_performance_mode(self.ocr_performance_mode)
             
+            self.ocr_burst_frames = preset_data.get('ocr_burst_frames', 3)
+            self.ocr_burst_window = preset_data.get('ocr_burst_window', 0.4)
+            self.ocr_vote_confidence = preset_data.get('ocr_vote_confidence', 0.6)
+            if hasattr(self, 'ocr_manager') and hasattr(self.ocr_manager, 'configure_burst'):
+                self.ocr_manager.configure_burst(self.ocr_burst_frames, self.ocr_burst_window, self.ocr_vote_confidence)
+            
+            self.ocr_pool_size = preset_data.get('ocr_pool_size', 0)
+            if hasattr(self, 'ocr_manager') and hasattr(self.ocr_manager, 'configure_pool'):
+                self.ocr_manager.configure_pool(self.ocr_pool_size)
+            
                                                   
             self.auto_bait_enabled = preset_data.get('auto_bait_enabled', False)
             self.top_bait_coords = preset_data.get('top_bait_coords', None)
@@ -4343,17 +4162,7 @@ Sequence (per user spec):
         except Exception as e:
             print(f'Error loading basic settings: {e}')
                                                        
-            self.settings = {
-                'zoom_settings': {
-                    'auto_zoom_enabled': False,
-                    'zoom_out_steps': 5,
-                    'zoom_in_steps': 8,
-                    'step_delay': 0.1,
-                    'sequence_delay': 0.5,
-                    'zoom_cooldown': 2.0
-                },
-                'layout_settings': {}
-            }
+            self.settings = self.settings_model.to_dict()
 
     def load_ui_settings(self):
         """Load UI-specific settings after widgets are created"""
@@ -4364,8 +4173,7 @@ Sequence (per user spec):
             return                                   
             
         try:
-            with open(settings_file, 'r') as f:
-                preset_data = json.load(f)
+            preset_data = self.settings_model.to_dict()
             
             print(f"\n📋 Applying settings to UI...")
             
@@ -4414,6 +4222,16 @@ Sequence (per user spec):
                 self.recovery_webhook_var.set(self.recovery_webhook_enabled)
             if hasattr(self, 'bait_webhook_var') and self.bait_webhook_var:
                 self.bait_webhook_var.set(self.bait_webhook_enabled)
+            if hasattr(self, 'webhook_digest_var') and self.webhook_digest_var:
+                self.webhook_digest_var.set(self.webhook_digest_enabled)
+            if hasattr(self, 'webhook_digest_minutes_var') and self.webhook_digest_minutes_var:
+                self.webhook_digest_minutes_var.set(self.webhook_digest_minutes)
+            if hasattr(self, 'webhook_attachments_var') and self.webhook_attachments_var:
+                self.webhook_attachments_var.set(self.webhook_attachments_enabled)
+            if hasattr(self, 'webhook_attachment_max_kb_var') and self.webhook_attachment_max_kb_var:
+                self.webhook_attachment_max_kb_var.set(self.webhook_attachment_max_kb)
+            if hasattr(self, 'webhook_attachment_quality_var') and self.webhook_attachment_quality_var:
+                self.webhook_attachment_quality_var.set(self.webhook_attachment_quality)
             
                                                      
             if hasattr(self, 'auto_bait_var') and self.auto_bait_var:
@@ -4586,8 +4404,10 @@ Sequence (per user spec):
 
 
 def main():
-    root = tk.Tk()
-    app = HotkeyGUI(root)
+    profiler = StartupProfiler()
+    with profiler.section('Tk root'):
+        root = tk.Tk()
+    app = HotkeyGUI(root, profiler)
     root.protocol('WM_DELETE_WINDOW', app.exit_app)
     root.mainloop()
 
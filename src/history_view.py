@@ -0,0 +1,140 @@
+"""
+History View - paged catch/session history window
+Reads one page of events at a time from the SessionDatabase (keyset paging on
+the event id), so opening the window stays instant however large the history is.
+"""
+
+import datetime
+import tkinter as tk
+from tkinter import ttk
+
+try:
+    from src.session_db import EVENT_KINDS
+except ImportError:
+    from session_db import EVENT_KINDS
+
+PAGE_SIZE = 50
+ALL_KINDS = 'all'
+
+
+class HistoryWindow:
+    """Toplevel listing recorded events newest first, PAGE_SIZE rows at a time"""
+
+    def __init__(self, app, db):
+        self.app = app
+        self.db = db
+        self.window = None
+        self.tree = None
+        self.page_starts = [None]
+        self.next_before_id = None
+
+    def show(self):
+        if self.window is not None and self.window.winfo_exists():
+            self.window.lift()
+            self.reload()
+            return
+
+        theme_colors = self.app.theme_manager.themes[self.app.current_theme]["colors"]
+        self.window = tk.Toplevel(self.app.root)
+        self.window.title('📜 Catch History')
+        self.window.geometry('720x560')
+        self.window.attributes('-topmost', True)
+        self.window.configure(bg=theme_colors["bg"])
+
+        container = ttk.Frame(self.window, padding=15)
+        container.pack(fill='both', expand=True)
+        container.columnconfigure(0, weight=1)
+        container.rowconfigure(1, weight=1)
+
+        filters = ttk.Frame(container)
+        filters.grid(row=0, column=0, sticky='ew', pady=(0, 10))
+
+        self.scope_var = tk.StringVar(value='session')
+        ttk.Radiobutton(filters, text='This session', value='session', variable=self.scope_var,
+                        command=self.reload).pack(side=tk.LEFT)
+        ttk.Radiobutton(filters, text='All sessions', value='all', variable=self.scope_var,
+                        command=self.reload).pack(side=tk.LEFT, padx=(10, 20))
+
+        ttk.Label(filters, text='Event:').pack(side=tk.LEFT)
+        self.kind_var = tk.StringVar(value=ALL_KINDS)
+        kind_box = ttk.Combobox(filters, textvariable=self.kind_var, values=(ALL_KINDS,) + EVENT_KINDS,
+                                state='readonly', width=10)
+        kind_box.pack(side=tk.LEFT, padx=5)
+        kind_box.bind('<<ComboboxSelected>>', lambda e: self.reload())
+
+        self.summary_label = ttk.Label(filters, text='')
+        self.summary_label.pack(side=tk.RIGHT)
+
+        columns = ('time', 'kind', 'duration', 'detail')
+        self.tree = ttk.Treeview(container, columns=columns, show='headings', height=PAGE_SIZE)
+        for column, title, width in (('time', 'Time', 140), ('kind', 'Event', 80),
+                                     ('duration', 'Duration', 80), ('detail', 'Detail', 360)):
+            self.tree.heading(column, text=title)
+            self.tree.column(column, width=width, anchor='w')
+        scrollbar = ttk.Scrollbar(container, orient='vertical', command=self.tree.yview)
+        self.tree.configure(yscrollcommand=scrollbar.set)
+        self.tree.grid(row=1, column=0, sticky='nsew')
+        scrollbar.grid(row=1, column=1, sticky='ns')
+
+        pager = ttk.Frame(container)
+        pager.grid(row=2, column=0, sticky='ew', pady=(10, 0))
+        self.newer_btn = ttk.Button(pager, text='◀ Newer', command=self.newer_page)
+        self.newer_btn.pack(side=tk.LEFT)
+        self.page_label = ttk.Label(pager, text='')
+        self.page_label.pack(side=tk.LEFT, padx=10)
+        self.older_btn = ttk.Button(pager, text='Older ▶', command=self.older_page)
+        self.older_btn.pack(side=tk.LEFT)
+        ttk.Button(pager, text='🔄 Refresh', command=self.reload).pack(side=tk.RIGHT)
+
+        self.reload()
+
+    def _filters(self):
+        session_id = self.db.session_id if self.scope_var.get() == 'session' else None
+        if self.scope_var.get() == 'session' and session_id is None:
+            session_id = -1
+        kind = self.kind_var.get()
+        return session_id, (None if kind == ALL_KINDS else kind)
+
+    def reload(self):
+        """Back to the newest page with the current filters"""
+        self.page_starts = [None]
+        self._load_page()
+
+    def older_page(self):
+        if self.next_before_id is not None:
+            self.page_starts.append(self.next_before_id)
+            self._load_page()
+
+    def newer_page(self):
+        if len(self.page_starts) > 1:
+            self.page_starts.pop()
+            self._load_page()
+
+    def _load_page(self):
+        session_id, kind = self._filters()
+        try:
+            rows = self.db.fetch_events(session_id=session_id, kind=kind,
+                                        before_id=self.page_starts[-1], limit=PAGE_SIZE + 1)
+        except Exception as e:
+            self.summary_label.config(text=f'❌ {e}')
+            return
+
+        has_more = len(rows) > PAGE_SIZE
+        rows = rows[:PAGE_SIZE]
+        self.next_before_id = rows[-1]['id'] if has_more else None
+
+        self.tree.delete(*self.tree.get_children())
+        for row in rows:
+            timestamp = datetime.datetime.fromtimestamp(row['ts']).strftime('%Y-%m-%d %H:%M:%S')
+            duration = f"{row['duration']:.1f}s" if row['duration'] is not None else ''
+            self.tree.insert('', tk.END, values=(timestamp, row['kind'], duration, row['detail'] or ''))
+
+        self.page_label.config(text=f'Page {len(self.page_starts)}')
+        self.newer_btn.state(['!disabled'] if len(self.page_starts) > 1 else ['disabled'])
+        self.older_btn.state(['!disabled'] if has_more else ['disabled'])
+        if session_id is not None and session_id >= 0:
+            catches = self.db.count_events(session_id=session_id, kind='catch')
+            fruits = self.db.count_events(session_id=session_id, kind='fruit')
+            self.summary_label.config(text=f'🐟 {catches}  🍎 {fruits}')
+        else:
+            self.summary_label.config(text='')
@@ -0,0 +1,168 @@
+"""
+Lazy Import helpers for keeping heavy dependencies off the startup path
+lazy_module() returns a stand-in that imports the real module on first attribute
+access, so cv2, requests and PIL load when their feature is first used instead
+of when gui.py is imported. ImportProfiler records per-module import times in
+the same shape as python -X importtime.
+"""
+
+import importlib
+import importlib.util
+import sys
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+LOAD_TIMES: Dict[str, float] = {}
+
+
+def module_available(*names: str) -> bool:
+    """Check that every top-level module can be imported, without importing it"""
+    try:
+        return all(importlib.util.find_spec(name) is not None for name in names)
+    except (ImportError, ValueError):
+        return False
+
+
+class LazyModule:
+    """Module proxy that performs the import the first time an attribute is used"""
+
+    def __init__(self, name: str):
+        object.__setattr__(self, '_lazy_name', name)
+        object.__setattr__(self, '_lazy_module', None)
+        object.__setattr__(self, '_lazy_lock', threading.Lock())
+
+    def _load(self):
+        module = self._lazy_module
+        if module is None:
+            with self._lazy_lock:
+                module = self._lazy_module
+                if module is None:
+                    already_loaded = self._lazy_name in sys.modules
+                    start = time.perf_counter()
+                    module = importlib.import_module(self._lazy_name)
+                    if not already_loaded:
+                        LOAD_TIMES[self._lazy_name] = (time.perf_counter() - start) * 1000
+                    object.__setattr__(self, '_lazy_module', module)
+        return module
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._lazy_module is not None
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __setattr__(self, attr, value):
+        setattr(self._load(), attr, value)
+
+    def __repr__(self):
+        state = "loaded" if self._lazy_module is not None else "not loaded"
+        return f"<lazy module '{self._lazy_name}' ({state})>"
+
+
+def lazy_module(name: str):
+    """The module itself if it is already imported, otherwise a LazyModule for it"""
+    return sys.modules.get(name) or LazyModule(name)
+
+
+class _TimedLoader:
+    """Wraps a loader so module creation and execution are timed"""
+
+    def __init__(self, loader, profiler: 'ImportProfiler', name: str):
+        self._loader = loader
+        self._profiler = profiler
+        self._name = name
+
+    def create_module(self, spec):
+        self._profiler._enter(self._name)
+        create = getattr(self._loader, 'create_module', None)
+        try:
+            return create(spec) if create else None
+        except BaseException:
+            self._profiler._exit(self._name)
+            raise
+
+    def exec_module(self, module):
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._profiler._exit(self._name)
+            # Hand the real loader back so nothing downstream sees the wrapper
+            spec = getattr(module, '__spec__', None)
+            if spec is not None and spec.loader is self:
+                spec.loader = self._loader
+            if getattr(module, '__loader__', None) is self:
+                module.__loader__ = self._loader
+
+    def __getattr__(self, attr):
+        return getattr(self._loader, attr)
+
+
+class ImportProfiler:
+    """
+    sys.meta_path hook recording self and cumulative import time per module,
+    like python -X importtime (nested imports are indented by depth)
+    """
+
+    def __init__(self):
+        self.records: List[Tuple[str, float, float, int]] = []
+        self._stack: List[list] = []
+        self._local = threading.local()
+        self._thread = threading.get_ident()
+
+    def install(self) -> 'ImportProfiler':
+        if self not in sys.meta_path:
+            sys.meta_path.insert(0, self)
+        return self
+
+    def uninstall(self):
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    def find_spec(self, fullname, path=None, target=None):
+        # Only time the main thread and never recurse into our own lookup
+        if threading.get_ident() != self._thread or getattr(self._local, 'busy', False):
+            return None
+        self._local.busy = True
+        try:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, 'find_spec'):
+                    continue
+                spec = finder.find_spec(fullname, path, target)
+                if spec is not None:
+                    break
+            else:
+                return None
+        finally:
+            self._local.busy = False
+        if spec.loader is None or not hasattr(spec.loader, 'exec_module'):
+            return spec
+        spec.loader = _TimedLoader(spec.loader, self, fullname)
+        return spec
+
+    def _enter(self, name: str):
+        self._stack.append([name, time.perf_counter(), 0.0])
+
+    def _exit(self, name: str):
+        if not self._stack or self._stack[-1][0] != name:
+            return
+        _, start, children = self._stack.pop()
+        cumulative = (time.perf_counter() - start) * 1000
+        if self._stack:
+            self._stack[-1][2] += cumulative
+        self.records.append((name, cumulative - children, cumulative, len(self._stack)))
+
+    def top(self, count: int = 15, max_depth: Optional[int] = None) -> List[Tuple[str, float, float, int]]:
+        """Slowest imports by cumulative time (optionally only those at max_depth or shallower)"""
+        records = self.records if max_depth is None else [r for r in self.records if r[3] <= max_depth]
+        return sorted(records, key=lambda r: r[2], reverse=True)[:count]
+
+    def total_ms(self) -> float:
+        return sum(r[2] for r in self.records if r[3] == 0)
+
+    def format_report(self, count: int = 15) -> List[str]:
+        lines = [f"📦 Imports: {len(self.records)} modules, {self.total_ms():.1f}ms  (self | cumulative | module)"]
+        for name, self_ms, cumulative_ms, depth in self.top(count):
+            lines.append(f"   {self_ms:8.1f} | {cumulative_ms:8.1f} | {'  ' * depth}{name}")
+        return lines
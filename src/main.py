@@ -18,11 +18,16 @@ else:
                        
     sys.path.insert(0, os.path.dirname(__file__))
 
-from gui import HotkeyGUI
+from startup_profiler import StartupProfiler
+
+profiler = StartupProfiler()
+with profiler.section('import gui'):
+    from gui import HotkeyGUI
 
 def main():
     print("Starting GPO Autofish...")
-    root = tk.Tk()
+    with profiler.section('Tk root'):
+        root = tk.Tk()
     print(f"Tk root created: {root}")
     
     try:
@@ -30,32 +35,10 @@ def main():
     except:
         pass
     
-                     
-    try:
-        from PIL import Image, ImageTk
-        import os
-        
-                                                                      
-        if hasattr(sys, '_MEIPASS'):
-                                           
-            icon_path = os.path.join(sys._MEIPASS, "images", "icon.webp")
-        else:
-                               
-            icon_path = os.path.join(os.path.dirname(__file__), "..", "images", "icon.webp")
-            
-        if os.path.exists(icon_path):
-            icon_image = Image.open(icon_path)
-                                               
-            photo = ImageTk.PhotoImage(icon_image)
-            root.iconphoto(True, photo)
-        else:
-            print(f"Icon not found at: {icon_path}")
-    except Exception as e:
-        print(f"Could not load icon: {e}")
-    
     print("Creating GUI...")
     try:
-        app = HotkeyGUI(root)
+        with profiler.section('HotkeyGUI'):
+            app = HotkeyGUI(root, profiler)
         print(f"GUI created: {app}")
         root.protocol('WM_DELETE_WINDOW', app.exit_app)
                                     
@@ -76,6 +59,8 @@ def main():
         raise
 
 if __name__ == '__main__':
+    import multiprocessing
+    multiprocessing.freeze_support()
     try:
         main()
     except Exception as e:
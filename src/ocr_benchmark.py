@@ -0,0 +1,340 @@
+"""
+OCR Benchmark for comparing recognition engines on stored banner captures
+Runs every installed engine over a labelled corpus, reports latency percentiles,
+peak memory and accuracy, and saves the fastest accurate engine for this machine.
+With --sweep it instead tunes the preprocessing pipeline for one engine.
+
+Usage:
+    python src/ocr_benchmark.py --corpus ocr_corpus [--floor 0.85] [--repeats 3] [--no-save]
+    python src/ocr_benchmark.py --sweep [--engines easy] [--repeats 1]
+
+Corpus layout:
+    ocr_corpus/labels.json  - [{"file": "drop_0001.png", "text": "...", "kind": "drop"}, ...]
+    ocr_corpus/*.png        - raw BGRA/BGR captures of the drop area
+"""
+
+import argparse
+import difflib
+import itertools
+import json
+import multiprocessing
+import os
+import sys
+import time
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+try:
+    from src.ocr_engines import available_engines, engine_display_name, save_preferred_engine, update_machine_profile
+    from src.profiling import peak_rss_mb, percentile
+except ImportError:
+    from ocr_engines import available_engines, engine_display_name, save_preferred_engine, update_machine_profile
+    from profiling import peak_rss_mb, percentile
+
+DEFAULT_CORPUS_DIR = "ocr_corpus"
+LABELS_FILE = "labels.json"
+
+SWEEP_GRID = {
+    'target_text_height': [0, 32, 24, 18],
+    'crop': [False, True],
+    'binarize': [False, True],
+    'grayscale': [False, True]
+}
+SWEEP_ACCURACY_TOLERANCE = 0.02
+
+
+def load_corpus(corpus_dir: str = DEFAULT_CORPUS_DIR, load_images: bool = True) -> List[dict]:
+    """
+    Load labelled samples from a corpus directory
+
+    Returns:
+        List of sample dicts (file, text, kind and, if requested, image)
+    """
+    labels_path = os.path.join(corpus_dir, LABELS_FILE)
+    if not os.path.exists(labels_path):
+        return []
+
+    with open(labels_path, 'r', encoding='utf-8') as f:
+        samples = json.load(f)
+
+    if load_images:
+        import cv2
+        loaded = []
+        for sample in samples:
+            image = cv2.imread(os.path.join(corpus_dir, sample['file']), cv2.IMREAD_UNCHANGED)
+            if image is None:
+                print(f"⚠️ Skipping unreadable corpus image: {sample['file']}")
+                continue
+            loaded.append(dict(sample, image=image))
+        samples = loaded
+
+    return samples
+
+
+def record_corpus_sample(frame, text: str, kind: str, corpus_dir: str = DEFAULT_CORPUS_DIR) -> Optional[str]:
+    """
+    Save a capture into the corpus with its OCR text as a provisional label
+    Labels are marked unverified so they can be corrected by hand before benchmarking
+
+    Returns:
+        Saved file name, or None on failure
+    """
+    try:
+        import cv2
+        os.makedirs(corpus_dir, exist_ok=True)
+        samples = load_corpus(corpus_dir, load_images=False)
+        file_name = f"{kind}_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}.png"
+        cv2.imwrite(os.path.join(corpus_dir, file_name), frame)
+        samples.append({'file': file_name, 'text': text or '', 'kind': kind, 'verified': False})
+        with open(os.path.join(corpus_dir, LABELS_FILE), 'w', encoding='utf-8') as f:
+            json.dump(samples, f, indent=2)
+        return file_name
+    except Exception as e:
+        print(f"⚠️ Could not record corpus sample: {e}")
+        return None
+
+
+def normalize_text(text: str) -> str:
+    """Lowercase and collapse whitespace/punctuation for accuracy comparison"""
+    return ' '.join(''.join(c if c.isalnum() else ' ' for c in (text or '').lower()).split())
+
+
+def text_accuracy(predicted: str, expected: str) -> float:
+    """Character-level similarity between predicted and labelled text (0.0 to 1.0)"""
+    predicted = normalize_text(predicted)
+    expected = normalize_text(expected)
+    if not expected:
+        return 1.0 if not predicted else 0.0
+    return difflib.SequenceMatcher(None, predicted, expected).ratio()
+
+
+def _benchmark_engine(engine_name: str, corpus_dir: str, repeats: int, results_queue):
+    """Benchmark one engine (runs in its own process so peak memory is per-engine)"""
+    try:
+        start = time.perf_counter()
+        try:
+            from src.ocr_manager import OCRManager
+        except ImportError:
+            from ocr_manager import OCRManager
+
+        manager = OCRManager()
+        if not manager.init_engine(engine_name):
+            results_queue.put({'engine': engine_name, 'error': 'engine failed to initialize'})
+            return
+        cold_start = time.perf_counter() - start
+
+        result = score_manager(manager, load_corpus(corpus_dir), repeats)
+        result.update({'engine': engine_name, 'cold_start_s': cold_start, 'peak_rss_mb': peak_rss_mb()})
+        results_queue.put(result)
+    except Exception as e:
+        results_queue.put({'engine': engine_name, 'error': str(e)})
+
+
+def score_manager(manager, samples: List[dict], repeats: int) -> dict:
+    """
+    Time and score an initialized OCRManager (preprocessing + recognition) on loaded samples
+
+    Returns:
+        Dict with sample count, latency percentiles, accuracy, exact match rate and mean input pixels
+    """
+    latencies = []
+    scores = []
+    per_kind = {}
+    pixels = []
+    exact = 0
+
+    for sample in samples:
+        raw_text = ''
+        for _ in range(max(1, repeats)):
+            t0 = time.perf_counter()
+            raw_text, _ = manager._read_frame(sample['image'])
+            latencies.append((time.perf_counter() - t0) * 1000)
+        prepared = manager._prepare_frame(sample['image'])
+        pixels.append(prepared.shape[0] * prepared.shape[1])
+
+        text = manager.correct_item_names(manager.filter_and_clean_text(raw_text))
+        score = text_accuracy(text, sample['text'])
+        scores.append(score)
+        per_kind.setdefault(sample.get('kind', 'other'), []).append(score)
+        if normalize_text(text) == normalize_text(sample['text']):
+            exact += 1
+
+    return {
+        'samples': len(samples),
+        'p50_ms': percentile(latencies, 50),
+        'p90_ms': percentile(latencies, 90),
+        'p99_ms': percentile(latencies, 99),
+        'accuracy': sum(scores) / len(scores) if scores else 0.0,
+        'exact_match': exact / len(samples) if samples else 0.0,
+        'accuracy_by_kind': {kind: sum(v) / len(v) for kind, v in per_kind.items()},
+        'mean_pixels': sum(pixels) / len(pixels) if pixels else 0.0
+    }
+
+
+def sweep_preprocessing(corpus_dir: str = DEFAULT_CORPUS_DIR, engine_name: Optional[str] = None,
+                        repeats: int = 1, grid: Optional[dict] = None) -> Tuple[Optional[str], List[dict]]:
+    """
+    Run every preprocessing combination in the grid through one engine
+
+    Returns:
+        Tuple of (engine name, list of result dicts each carrying its 'params')
+    """
+    try:
+        from src.ocr_manager import OCRManager
+    except ImportError:
+        from ocr_manager import OCRManager
+
+    manager = OCRManager()
+    if not manager.init_engine(engine_name):
+        return None, []
+
+    samples = load_corpus(corpus_dir)
+    grid = grid or SWEEP_GRID
+    keys = list(grid)
+    results = []
+    for values in itertools.product(*(grid[key] for key in keys)):
+        params = dict(zip(keys, values))
+        manager.configure_preprocessing(**params)
+        result = score_manager(manager, samples, repeats)
+        result['params'] = params
+        results.append(result)
+        print(f"   {_format_params(params):<48} {result['p50_ms']:>8.1f}ms {result['accuracy']*100:>6.1f}% "
+              f"{result['mean_pixels']/1000:>7.1f}k px")
+    return manager.engine_name, results
+
+
+def pick_preprocessing(results: List[dict], accuracy_floor: float) -> Optional[dict]:
+    """Fastest combination whose accuracy is within tolerance of the best one and above the floor"""
+    if not results:
+        return None
+    best_accuracy = max(r['accuracy'] for r in results)
+    threshold = max(accuracy_floor, best_accuracy - SWEEP_ACCURACY_TOLERANCE)
+    qualified = [r for r in results if r['samples'] and r['accuracy'] >= threshold]
+    return min(qualified, key=lambda r: r['p50_ms']) if qualified else None
+
+
+def _format_params(params: dict) -> str:
+    height = params['target_text_height'] or 'native'
+    flags = [name for name in ('crop', 'binarize', 'grayscale') if params.get(name)]
+    return f"height={height} " + (','.join(flags) or 'plain')
+
+
+def run_benchmark(corpus_dir: str = DEFAULT_CORPUS_DIR, engines: Optional[List[str]] = None,
+                  repeats: int = 3, timeout: float = 900.0) -> List[dict]:
+    """
+    Benchmark engines one at a time, each in a fresh process
+
+    Returns:
+        List of result dicts, one per engine
+    """
+    engines = engines or available_engines()
+    context = multiprocessing.get_context('spawn')
+    results = []
+
+    for engine_name in engines:
+        print(f"⏱️ Benchmarking {engine_display_name(engine_name)}...")
+        results_queue = context.Queue()
+        process = context.Process(target=_benchmark_engine, args=(engine_name, corpus_dir, repeats, results_queue))
+        process.start()
+        try:
+            result = results_queue.get(timeout=timeout)
+        except Exception:
+            result = {'engine': engine_name, 'error': f'timed out after {timeout:.0f}s'}
+        process.join(timeout=10)
+        if process.is_alive():
+            process.terminate()
+        results.append(result)
+
+    return results
+
+
+def pick_engine(results: List[dict], accuracy_floor: float) -> Optional[dict]:
+    """Fastest (median latency) engine meeting the accuracy floor"""
+    qualified = [r for r in results if 'error' not in r and r['samples'] and r['accuracy'] >= accuracy_floor]
+    return min(qualified, key=lambda r: r['p50_ms']) if qualified else None
+
+
+def print_report(results: List[dict], accuracy_floor: float):
+    print()
+    print(f"{'Engine':<12} {'Cold(s)':>8} {'p50(ms)':>9} {'p90(ms)':>9} {'p99(ms)':>9} {'PeakMB':>8} {'Acc':>6} {'Exact':>6}")
+    for r in results:
+        if 'error' in r:
+            print(f"{engine_display_name(r['engine']):<12} ❌ {r['error']}")
+            continue
+        rss = f"{r['peak_rss_mb']:.0f}" if r['peak_rss_mb'] is not None else "n/a"
+        flag = '' if r['accuracy'] >= accuracy_floor else ' (below floor)'
+        print(f"{engine_display_name(r['engine']):<12} {r['cold_start_s']:>8.2f} {r['p50_ms']:>9.1f} {r['p90_ms']:>9.1f} "
+              f"{r['p99_ms']:>9.1f} {rss:>8} {r['accuracy']*100:>5.1f}% {r['exact_match']*100:>5.1f}%{flag}")
+    print()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark OCR engines on stored GPO banner captures")
+    parser.add_argument('--corpus', default=DEFAULT_CORPUS_DIR, help="corpus directory containing labels.json")
+    parser.add_argument('--engines', nargs='*', help="engines to run (default: all installed)")
+    parser.add_argument('--floor', type=float, default=0.85, help="minimum mean accuracy for auto-selection")
+    parser.add_argument('--repeats', type=int, default=3, help="timed runs per sample")
+    parser.add_argument('--no-save', action='store_true', help="do not persist the selected engine")
+    parser.add_argument('--sweep', action='store_true', help="tune preprocessing for one engine instead")
+    args = parser.parse_args(argv)
+
+    samples = load_corpus(args.corpus, load_images=False)
+    if not samples:
+        print(f"❌ No labelled samples found in {args.corpus}/{LABELS_FILE}")
+        return 1
+    unverified = sum(1 for s in samples if s.get('verified') is False)
+    print(f"📂 Corpus: {len(samples)} samples ({unverified} unverified labels)")
+
+    engines = args.engines or available_engines()
+    if not engines:
+        print("❌ No OCR engines installed")
+        return 1
+
+    if args.sweep:
+        return run_sweep(args)
+
+    results = run_benchmark(args.corpus, engines, args.repeats)
+    print_report(results, args.floor)
+
+    best = pick_engine(results, args.floor)
+    if not best:
+        print(f"⚠️ No engine reached the {args.floor*100:.0f}% accuracy floor - keeping current default")
+        return 1
+
+    print(f"🏆 Fastest engine above floor: {engine_display_name(best['engine'])} ({best['p50_ms']:.1f}ms p50, {best['accuracy']*100:.1f}% accuracy)")
+    if not args.no_save:
+        save_preferred_engine(best['engine'], {r['engine']: r for r in results})
+    return 0
+
+
+def run_sweep(args) -> int:
+    engine_name = args.engines[0] if args.engines else None
+    print(f"🧪 Sweeping preprocessing ({engine_display_name(engine_name) if engine_name else 'default engine'})...")
+    engine_name, results = sweep_preprocessing(args.corpus, engine_name, args.repeats)
+    if not results:
+        print("❌ Engine failed to initialize")
+        return 1
+
+    baseline = next((r for r in results if not r['params']['crop'] and not r['params']['target_text_height']
+                     and not r['params']['binarize'] and not r['params']['grayscale']), results[0])
+    best = pick_preprocessing(results, args.floor)
+    if not best:
+        print(f"⚠️ No preprocessing combination reached the {args.floor*100:.0f}% accuracy floor")
+        return 1
+
+    speedup = baseline['p50_ms'] / best['p50_ms'] if best['p50_ms'] else 0.0
+    print(f"🏆 {_format_params(best['params'])}: {best['p50_ms']:.1f}ms p50 ({speedup:.2f}x vs unprocessed), "
+          f"{best['accuracy']*100:.1f}% accuracy, {best['mean_pixels']/1000:.1f}k px per frame")
+    if not args.no_save:
+        update_machine_profile({
+            'preprocess': best['params'],
+            'preprocess_engine': engine_name,
+            'preprocess_results': results
+        })
+        print("💾 Saved preprocessing parameters to this machine's OCR profile")
+    return 0
+
+
+if __name__ == '__main__':
+    multiprocessing.freeze_support()
+    sys.exit(main())
@@ -0,0 +1,204 @@
+"""
+OCR Engine registry for text recognition backends
+Every engine exposes recognize(img) -> [(text, confidence), ...] so OCRManager,
+the benchmark and worker processes can swap backends freely
+"""
+
+import importlib.util
+import json
+import logging
+import os
+import platform
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+ENGINE_PREFERENCE_FILE = "ocr_benchmark.json"
+
+ENGINES: Dict[str, type] = {}
+
+
+def register_engine(engine_cls):
+    """Register an engine class under its name (usable as a class decorator)"""
+    ENGINES[engine_cls.name] = engine_cls
+    return engine_cls
+
+
+class OCREngine:
+    """Base class for OCR backends"""
+    name = None
+    display_name = None
+    required_modules: Tuple[str, ...] = ()
+
+    @classmethod
+    def is_installed(cls) -> bool:
+        """Check whether the engine's dependencies can be imported, without importing them"""
+        return all(importlib.util.find_spec(module) is not None for module in cls.required_modules)
+
+    def recognize(self, img) -> List[Tuple[str, float]]:
+        """
+        Recognize text in a preprocessed image
+
+        Args:
+            img: numpy array (RGB or grayscale)
+
+        Returns:
+            List of (text, confidence) pairs in reading order
+        """
+        raise NotImplementedError
+
+
+@register_engine
+class EasyOCREngine(OCREngine):
+    name = "easy"
+    display_name = "EasyOCR"
+    required_modules = ("easyocr",)
+
+    def __init__(self):
+        import easyocr
+        print("🔧 Initializing EasyOCR with CPU optimization...")
+        self.reader = easyocr.Reader(['en'], gpu=False, verbose=False, download_enabled=True)
+        print("✅ EasyOCR ready with CPU optimization - text recognition available!")
+
+    def recognize(self, img) -> List[Tuple[str, float]]:
+        results = self.reader.readtext(img, detail=1, paragraph=False)
+        return [(item[1], float(item[2])) for item in results] if results else []
+
+
+@register_engine
+class PaddleOCREngine(OCREngine):
+    name = "paddle"
+    display_name = "PaddleOCR"
+    required_modules = ("paddleocr",)
+
+    def __init__(self):
+        import paddleocr
+        print("🔧 Initializing PaddleOCR (lightweight engine)...")
+        self.reader = paddleocr.PaddleOCR(use_angle_cls=True, lang='en', show_log=False)
+        print("✅ PaddleOCR ready - lightweight text recognition!")
+
+    def recognize(self, img) -> List[Tuple[str, float]]:
+        results = self.reader.ocr(img, cls=True)
+        if not results or not results[0]:
+            return []
+        return [(item[1][0], float(item[1][1])) for item in results[0] if item[1][1] > 0.5]
+
+
+@register_engine
+class TemplateOCREngine(OCREngine):
+    name = "template"
+    display_name = "GlyphOCR"
+    required_modules = ("cv2", "numpy")
+
+    @classmethod
+    def is_installed(cls) -> bool:
+        if not super().is_installed():
+            return False
+        try:
+            from src.glyph_ocr import DEFAULT_ATLAS_FILE
+        except ImportError:
+            from glyph_ocr import DEFAULT_ATLAS_FILE
+        return os.path.exists(DEFAULT_ATLAS_FILE)
+
+    def __init__(self):
+        try:
+            from src.glyph_ocr import GlyphAtlas, GlyphRecognizer
+        except ImportError:
+            from glyph_ocr import GlyphAtlas, GlyphRecognizer
+        atlas = GlyphAtlas.load()
+        self.recognizer = GlyphRecognizer(atlas)
+        print(f"✅ GlyphOCR ready - {len(atlas)} glyph templates loaded")
+
+    def recognize(self, img) -> List[Tuple[str, float]]:
+        return self.recognizer.recognize(img)
+
+
+@register_engine
+class OnnxOCREngine(OCREngine):
+    name = "onnx"
+    display_name = "ONNX int8"
+    required_modules = ("onnxruntime", "cv2", "numpy")
+
+    @classmethod
+    def is_installed(cls) -> bool:
+        if not super().is_installed():
+            return False
+        try:
+            from src.onnx_ocr import models_exist
+        except ImportError:
+            from onnx_ocr import models_exist
+        return models_exist()
+
+    def __init__(self):
+        try:
+            from src.onnx_ocr import OnnxOCR
+        except ImportError:
+            from onnx_ocr import OnnxOCR
+        print("🔧 Initializing ONNX Runtime int8 OCR...")
+        self.reader = OnnxOCR()
+        print("✅ ONNX int8 OCR ready - torch-free text recognition!")
+
+    def recognize(self, img) -> List[Tuple[str, float]]:
+        return self.reader.readtext(img)
+
+
+def available_engines() -> List[str]:
+    """List registered engines whose dependencies are installed, in registration order"""
+    return [name for name, engine_cls in ENGINES.items() if engine_cls.is_installed()]
+
+
+def create_engine(name: str) -> OCREngine:
+    """
+    Instantiate a registered engine
+
+    Raises:
+        ValueError: If the engine name is unknown
+    """
+    if name not in ENGINES:
+        raise ValueError(f"Unknown OCR engine: {name}")
+    return ENGINES[name]()
+
+
+def engine_display_name(name: Optional[str]) -> str:
+    """Human readable name for log messages"""
+    if name in ENGINES:
+        return ENGINES[name].display_name
+    return "OCR"
+
+
+def load_machine_profile() -> dict:
+    """Load benchmark results saved for this machine (empty if missing or from another machine)"""
+    try:
+        if not os.path.exists(ENGINE_PREFERENCE_FILE):
+            return {}
+        with open(ENGINE_PREFERENCE_FILE, 'r') as f:
+            data = json.load(f)
+        if data.get('machine') not in (None, platform.node()):
+            return {}
+        return data
+    except Exception as e:
+        logging.error(f"Could not read OCR machine profile: {e}")
+        return {}
+
+
+def update_machine_profile(updates: dict):
+    """Merge benchmark results into this machine's profile file"""
+    data = load_machine_profile()
+    data.update(updates)
+    data['machine'] = platform.node()
+    data['updated_at'] = datetime.now().isoformat()
+    try:
+        with open(ENGINE_PREFERENCE_FILE, 'w') as f:
+            json.dump(data, f, indent=2)
+    except Exception as e:
+        print(f"⚠️ Could not save OCR machine profile: {e}")
+
+
+def load_preferred_engine() -> Optional[str]:
+    """Return the engine chosen by the last benchmark on this machine, if any"""
+    return load_machine_profile().get('engine')
+
+
+def save_preferred_engine(name: str, results: Optional[dict] = None):
+    """Persist the benchmark winner as this machine's default engine"""
+    update_machine_profile({'engine': name, 'engine_results': results or {}})
+    print(f"💾 Saved {engine_display_name(name)} as this machine's OCR engine ({ENGINE_PREFERENCE_FILE})")
@@ -4,10 +4,22 @@ Supports multiple OCR engines with graceful fallbacks
 """
 
 import logging
+import threading
 from typing import Optional, Tuple
 import time
 import warnings
 
+try:
+    from src.fruit_matcher import FruitMatcher, DEVIL_FRUITS
+    from src.ocr_engines import (available_engines, create_engine, engine_display_name,
+                                 load_machine_profile, load_preferred_engine)
+    from src.lazy_import import lazy_module, module_available
+except ImportError:
+    from fruit_matcher import FruitMatcher, DEVIL_FRUITS
+    from ocr_engines import (available_engines, create_engine, engine_display_name,
+                             load_machine_profile, load_preferred_engine)
+    from lazy_import import lazy_module, module_available
+
                                                   
 warnings.filterwarnings("ignore", message=".*pin_memory.*")
 warnings.filterwarnings("ignore", category=UserWarning, module="torch.*")
@@ -15,57 +27,92 @@ warnings.filterwarnings("ignore", category=UserWarning, module="torch.*")
                                                     
 try:
     import numpy as np
-    import cv2
-    FALLBACK_AVAILABLE = True
+    FALLBACK_AVAILABLE = module_available('cv2')
 except ImportError:
     FALLBACK_AVAILABLE = False
+if not FALLBACK_AVAILABLE:
     print("⚠️ NumPy/OpenCV not available - text detection disabled")
+cv2 = lazy_module('cv2')
 
                                                                          
-try:
-                       
-    import easyocr
-    from PIL import Image, ImageEnhance
-    OCR_AVAILABLE = True
-    OCR_ENGINE = "easy"
-    print("✅ EasyOCR loaded successfully - text recognition available!")
-except ImportError as e:
-    print(f"🔍 EasyOCR import failed: {e}")
-    try:
-                               
-        import paddleocr
-        from PIL import Image, ImageEnhance
-        OCR_AVAILABLE = True
-        OCR_ENGINE = "paddle"
-        print("✅ PaddleOCR loaded successfully - lightweight text recognition!")
-    except ImportError as e2:
-        print(f"🔍 PaddleOCR import failed: {e2}")
-        OCR_AVAILABLE = False
-        OCR_ENGINE = None
-                                                                    
-        class DummyImage:
-            Image = object
-            LANCZOS = 1
-        class DummyEnhance:
-            pass
-        
-        Image = DummyImage()
-        ImageEnhance = DummyEnhance()
-        if FALLBACK_AVAILABLE:
-            print("⚠️ No OCR engine available - using fallback text detection")
-        else:
-            print("❌ No text detection available - install numpy and opencv-python")
+INSTALLED_ENGINES = available_engines()
+OCR_AVAILABLE = bool(INSTALLED_ENGINES)
+if OCR_AVAILABLE:
+    print(f"✅ OCR engines installed: {', '.join(engine_display_name(name) for name in INSTALLED_ENGINES)} - loaded on first use")
+elif FALLBACK_AVAILABLE:
+    print("⚠️ No OCR engine available - using fallback text detection")
+else:
+    print("❌ No text detection available - install numpy and opencv-python")
+
+DEFAULT_PREPROCESS = {
+    'target_text_height': 0,
+    'crop': False,
+    'binarize': False,
+    'grayscale': False
+}
+
+
+class OCRRateLimiter:
+    """Cooldown, duplicate suppression and in-flight guard for one kind of OCR request"""
+    
+    def __init__(self, cooldown: float = 0.0):
+        self.cooldown = cooldown
+        self.last_time = 0
+        self.last_text = ""
+        self.in_flight = False
+        self.requests = 0
+        self.throttled = 0
+    
+    def begin(self, now: float) -> bool:
+        """Claim a request slot - False while cooling down or while another request of this kind runs"""
+        self.requests += 1
+        if self.in_flight or now - self.last_time < self.cooldown:
+            self.throttled += 1
+            return False
+        self.in_flight = True
+        return True
+    
+    def end(self):
+        self.in_flight = False
+    
+    def accept(self, text: str, now: float) -> bool:
+        """Record a new result, returning False if it repeats the previous one"""
+        if not text or text == self.last_text:
+            return False
+        self.last_text = text
+        self.last_time = now
+        return True
+    
+    def get_stats(self) -> dict:
+        return {
+            "cooldown": self.cooldown,
+            "last_time": self.last_time,
+            "last_text": self.last_text,
+            "requests": self.requests,
+            "throttled": self.throttled
+        }
+
 
 class OCRManager:
     """Manages text recognition from screenshot areas using EasyOCR"""
     
+    PURPOSES = ('spawn', 'drop', 'test')
+    
     def __init__(self, app=None):
         self.app = app                                                      
         self.ocr_available = OCR_AVAILABLE
-        self.last_text = ""
-        self.last_capture_time = 0
+        
+                                                                                   
+        self._state_lock = threading.RLock()
+        self._engine_lock = threading.RLock()
+        self.limiters = {purpose: OCRRateLimiter() for purpose in self.PURPOSES}
         self.capture_cooldown = 2.0                                         
         self.reader = None
+        self.engine_name = None
+        self.pool = None
+        self.pool_size = 0
+        self._pool_generation = 0
+        self._pool_pending = False
         
                                                                                           
         self.performance_mode = "fast"                        
@@ -76,18 +123,25 @@ class OCRManager:
         self.cache_max_size = 10
         self.cache_similarity_threshold = 0.95
         
+        self.preprocess = dict(DEFAULT_PREPROCESS)
+        self.configure_preprocessing(**load_machine_profile().get('preprocess', {}))
+        
                                                
-        self.devil_fruits = [
-            'Tori', 'Mochi', 'Ope', 'Venom', 'Buddha', 'Pteranodon',
-            'Smoke', 'Goru', 'Yuki', 'Yami', 'Pika', 'Magu',
-            'Kage', 'Mera', 'Paw', 'Goro', 'Ito', 'Hie',
-            'Suna', 'Gura', 'Zushi', 'Kira', 'Spring', 'Yomi',
-            'Bomb', 'Gomu', 'Horo', 'Mero', 'Bari', 'Heal',
-            'Spin', 'Suke', 'Kilo'
-        ]
+        self.devil_fruits = list(DEVIL_FRUITS)
         
-                                                     
         self.devil_fruits_lower = [f.lower() for f in self.devil_fruits]
+        self.fruit_matcher = FruitMatcher(self.devil_fruits)
+        
+        self.gpo_items = {
+            'candycorn': 'Candy Corn',
+            'candy corn': 'Candy Corn',
+            'devilfruit': 'Devil Fruit',
+            'devil fruit': 'Devil Fruit',
+        }
+        
+        self.configure_burst()
+        self.burst_stats = {'catches': 0, 'frames': 0, 'ocr_calls': 0, 'votes': 0,
+                            'agreements': 0, 'readable': 0, 'confidence_sum': 0.0}
     
     def configure_performance_settings(self):
         """Configure OCR performance settings based on performance mode"""
@@ -135,170 +189,607 @@ class OCRManager:
             self.performance_mode = "fast"
             self.configure_performance_settings()
     
+    @property
+    def capture_cooldown(self) -> float:
+        """Cooldown of drop OCR requests (spawn and test requests are rate limited by their callers)"""
+        return self.limiters['drop'].cooldown
+    
+    @capture_cooldown.setter
+    def capture_cooldown(self, value: float):
+        self.limiters['drop'].cooldown = value
+    
+    @property
+    def last_text(self) -> str:
+        return self.limiters['drop'].last_text
+    
+    @property
+    def last_capture_time(self) -> float:
+        return self.limiters['drop'].last_time
+    
+    def _limiter(self, purpose: str) -> OCRRateLimiter:
+        if purpose not in self.limiters:
+            raise ValueError(f"Unknown OCR purpose: {purpose}")
+        return self.limiters[purpose]
+    
     def set_performance_mode(self, mode: str):
         """Set OCR performance mode and reconfigure settings"""
         if mode in ["fast", "balanced", "quality"]:
-            self.performance_mode = mode
-            self.configure_performance_settings()
-                                             
-            self.image_cache.clear()
+            with self._state_lock:
+                self.performance_mode = mode
+                self.configure_performance_settings()
+                                                 
+                self.image_cache.clear()
         else:
             print(f"⚠️ Unknown OCR performance mode: {mode}. Using 'fast' mode.")
+    
+    def ensure_engine(self) -> bool:
+        """
+        Create the in-process engine on first use (importing easyocr/torch is the
+        slowest part of startup, so it is never done before the window is painted)
         
-                                                    
-        self.gpo_items = {
-                                         
-            'candycorn': 'Candy Corn',
-            'candy corn': 'Candy Corn',
+        Returns:
+            True if a reader (engine or pool) is ready
+        """
+        if self.reader is not None:
+            return True
+        if not self.ocr_available or self._pool_pending:
+            return False
+        with self._engine_lock:
+            if self.reader is not None:
+                return True
+            return self.init_engine()
+    
+    def warm_up(self):
+        """Create the OCR engine on a background thread so the first drop doesn't pay for it"""
+        if self.reader is None and self.ocr_available and not self._pool_pending:
+            threading.Thread(target=self.ensure_engine, name="ocr-warm-up", daemon=True).start()
+    
+    def init_engine(self, name: Optional[str] = None) -> bool:
+        """
+        Create the OCR engine - the requested one, else this machine's benchmarked
+        default, else the first installed engine that initializes
+        
+        Args:
+            name: Optional registered engine name to force
             
-                                                          
-            'devilfruit': 'Devil Fruit',
-            'devil fruit': 'Devil Fruit',
-        }
+        Returns:
+            True if an engine is ready
+        """
+        with self._engine_lock:
+            for candidate in self._engine_candidates(name):
+                try:
+                    self.reader = create_engine(candidate)
+                    self.engine_name = candidate
+                    self.ocr_available = True
+                    return True
+                except Exception as e:
+                    logging.error(f"Failed to initialize {engine_display_name(candidate)}: {e}")
+            
+            self.ocr_available = False
+            self.reader = None
+            self.engine_name = None
+            return False
+    
+    def _engine_candidates(self, name: Optional[str] = None) -> list:
+        """Engine names to try in order - the forced one, or the benchmarked default then the rest"""
+        if name:
+            return [name]
+        preferred = load_preferred_engine()
+        return ([preferred] if preferred else []) + [e for e in available_engines() if e != preferred]
+    
+    def configure_pool(self, size: int):
+        """
+        Run OCR in a pool of worker processes, each with its own engine
+        Workers are started on a background thread; the in-process reader (if any) keeps
+        serving until the pool is ready. Size 0 goes back to a single in-process engine.
         
-        if self.ocr_available:
+        Args:
+            size: Number of worker processes (0 disables the pool)
+        """
+        size = max(0, int(size))
+        with self._engine_lock:
+            if size == self.pool_size and (size == 0 or self.pool is not None or self._pool_pending):
+                return
+            
+            self._pool_generation += 1
+            if self.pool is not None:
+                self.pool.close()
+                self.pool = None
+                self.reader = None
+            self.pool_size = size
+            self._pool_pending = size > 0 and FALLBACK_AVAILABLE
+            if self._pool_pending:
+                candidates = [self.engine_name] if self.engine_name else self._engine_candidates()
+                threading.Thread(target=self._start_pool, args=(size, candidates, self._pool_generation),
+                                 name="ocr-pool-start", daemon=True).start()
+    
+    def _start_pool(self, size: int, candidates: list, generation: int):
+        """Start an OCRPool off the Tk thread and swap it in as the reader if still wanted"""
+        pool = None
+        if candidates:
             try:
-                if OCR_ENGINE == "easy":
-                    print("🔧 Initializing EasyOCR with CPU optimization...")
-                                                                        
-                    self.reader = easyocr.Reader(
-                        ['en'], 
-                        gpu=False,                   
-                        verbose=False,
-                        download_enabled=True
-                    )
-                    print("✅ EasyOCR ready with CPU optimization - text recognition available!")
-                elif OCR_ENGINE == "paddle":
-                    print("🔧 Initializing PaddleOCR (lightweight engine)...")
-                                                                
-                    self.reader = paddleocr.PaddleOCR(use_angle_cls=True, lang='en', show_log=False)
-                    print("✅ PaddleOCR ready - lightweight text recognition!")
+                from src.ocr_pool import OCRPool
+            except ImportError:
+                from ocr_pool import OCRPool
+            pool = OCRPool(candidates, size)
+            try:
+                started = pool.start()
             except Exception as e:
-                logging.error(f"Failed to initialize {OCR_ENGINE}OCR: {e}")
-                self.ocr_available = False
+                logging.error(f"OCR pool failed to start: {e}")
+                pool.close()
+                started = False
+            if not started:
+                pool = None
+        
+        with self._engine_lock:
+            if generation != self._pool_generation:
+                if pool is not None:
+                    pool.close()
+                return
+            self._pool_pending = False
+            if pool is not None:
+                self.pool = pool
+                self.reader = pool
+                self.engine_name = pool.engine_name
+                self.ocr_available = True
+                return
+            print("⚠️ OCR pool unavailable - using in-process OCR")
+            self.pool_size = 0
+            if not self.ocr_available and available_engines():
+                self.ocr_available = True
+    
+    def shutdown(self):
+        """Release OCR worker processes"""
+        with self._engine_lock:
+            self._pool_generation += 1
+            self._pool_pending = False
+            if self.pool is not None:
+                self.pool.close()
+                self.pool = None
                 self.reader = None
     
     def is_available(self) -> bool:
         """Check if OCR is available and configured"""
         return self.ocr_available
     
-    def extract_text(self, screenshot_area=None) -> Optional[str]:
+    def extract_text(self, screenshot_area=None, purpose: str = 'drop') -> Optional[str]:
         """
         Extract text from drop layout area using available OCR engine
-        Always uses the configured drop layout area, ignoring screenshot_area parameter
+        Uses the caller's frame when given, otherwise captures the drop layout area.
+        Safe to call from any thread; each purpose has its own cooldown and duplicate filter
         
         Args:
-            screenshot_area: IGNORED - always uses drop layout area
+            screenshot_area: Optional numpy array of an already captured drop area frame
+            purpose: 'drop', 'spawn' or 'test'
             
         Returns:
             Extracted and filtered text, or None if no text found
         """
-                                              
-        screenshot_area = self.capture_drop_area()
+        limiter = self._limiter(purpose)
+        if screenshot_area is None:
+            screenshot_area = self.capture_drop_area()
         if screenshot_area is None:
             print("❌ Could not capture drop layout area")
             return None
         
-        if not self.ocr_available or not self.reader:
+        if not self.ensure_engine():
                                                         
             if FALLBACK_AVAILABLE:
-                return self.detect_text_fallback(screenshot_area)
+                return self.detect_text_fallback(screenshot_area, purpose)
             else:
                 return None
-            
-                                        
+        
         current_time = time.time()
-        if current_time - self.last_capture_time < self.capture_cooldown:
-            return None
+        with self._state_lock:
+            if not limiter.begin(current_time):
+                return None
         
-                                                                    
-        cached_result = self.check_image_cache(screenshot_area)
-        if cached_result is not None:
-            print(f"📋 Using cached OCR result: {cached_result}")
-            return cached_result
-            
         try:
-                                          
-            if len(screenshot_area.shape) == 3:
-                screenshot_area = cv2.cvtColor(screenshot_area, cv2.COLOR_BGR2RGB)
+            cached_result = self.check_image_cache(screenshot_area)
+            if cached_result is not None:
+                print(f"📋 Using cached OCR result: {cached_result}")
+                return cached_result
             
-                                                     
-            processed_img = self.preprocess_for_easyocr(screenshot_area)
-            
-                                        
-            if OCR_ENGINE == "paddle":
-                                                                                                           
-                results = self.reader.ocr(processed_img, cls=True)
-                if results and results[0]:
-                    texts = [item[1][0] for item in results[0] if item[1][1] > 0.5]                    
-                    raw_text = ' '.join(texts)
-                else:
-                    raw_text = ""
-            else:
-                                
-                results = self.reader.readtext(processed_img, detail=0, paragraph=True)
-                raw_text = ' '.join(results) if results else ""
-            
-                                   
-            if raw_text:
-                filtered_text = self.filter_and_clean_text(raw_text)
-                
-                                             
-                if filtered_text:
-                    corrected_text = self.correct_item_names(filtered_text)
-                    
-                    if corrected_text and corrected_text != self.last_text:
-                        self.last_text = corrected_text
-                        self.last_capture_time = current_time
-                        
-                                                                    
-                        self.cache_image_result(screenshot_area, corrected_text)
-                        
-                        print(f"📝 {OCR_ENGINE.title()}OCR extracted: {corrected_text}")
-                        return corrected_text
+            raw_text, _ = self._read_frame(screenshot_area)
+            return self._finalize_text(raw_text, screenshot_area, current_time, limiter)
                 
         except Exception as e:
-            logging.error(f"{OCR_ENGINE.title() if OCR_ENGINE else 'OCR'} extraction failed: {e}")
+            logging.error(f"{engine_display_name(self.engine_name)} extraction failed: {e}")
                                                             
             if FALLBACK_AVAILABLE:
-                return self.detect_text_fallback(screenshot_area)
+                return self.detect_text_fallback(screenshot_area, purpose)
             else:
                 return None
+        finally:
+            with self._state_lock:
+                limiter.end()
+    
+    def _read_frame(self, screenshot_area) -> Tuple[str, float]:
+        """
+        Run the OCR engine on a single frame
+        In-process engines are not thread-safe, so calls are serialized unless the reader is the pool
+        
+        Args:
+            screenshot_area: numpy array of the captured frame
             
-        return None
+        Returns:
+            Tuple of (raw text, mean recognition confidence)
+        """
+        processed_img = self._prepare_frame(screenshot_area)
+        if not self.ensure_engine():
+            raise RuntimeError("OCR engine not initialized")
+        reader = self.reader
+        start = time.perf_counter()
+        if getattr(reader, 'thread_safe', False):
+            items = reader.recognize(processed_img)
+        else:
+            with self._engine_lock:
+                items = reader.recognize(processed_img)
+        return self._recognized(items, start)
+    
+    def _submit_frame(self, pool, screenshot_area) -> Tuple[object, float]:
+        """Queue a frame on the pool, returning (future, submit time) for _pool_result"""
+        return pool.submit(self._prepare_frame(screenshot_area)), time.perf_counter()
+    
+    def _pool_result(self, pool, pending: Tuple[object, float]) -> Tuple[str, float]:
+        """Wait (bounded by the pool's result_timeout) for a frame queued with _submit_frame"""
+        future, start = pending
+        return self._recognized(future.result(timeout=pool.result_timeout), start)
+    
+    def _recognized(self, items: list, start: float) -> Tuple[str, float]:
+        """Join recognized items and record OCR telemetry - every recognition path ends here"""
+        result = self._join_items(items)
+        telemetry = getattr(self.app, 'telemetry', None)
+        if telemetry is not None:
+            telemetry.record('ocr', engine=self.engine_name or '', latency_ms=(time.perf_counter() - start) * 1000,
+                             chars=len(result[0]), confidence=result[1])
+        return result
+    
+    def read_frames(self, frames: list) -> list:
+        """
+        Run the OCR engine on several frames (e.g. extra regions) - concurrently when the pool is enabled
+        
+        Args:
+            frames: List of numpy frames
+            
+        Returns:
+            List of (raw text, mean recognition confidence) tuples in input order
+        """
+        pool = self.pool
+        if pool is not None:
+            pending = [self._submit_frame(pool, frame) for frame in frames]
+            return [self._pool_result(pool, item) for item in pending]
+        return [self._read_frame(frame) for frame in frames]
+    
+    def _prepare_frame(self, screenshot_area):
+        """Convert a captured frame to RGB and apply the configured preprocessing"""
+        if len(screenshot_area.shape) == 3:
+            code = cv2.COLOR_BGRA2RGB if screenshot_area.shape[2] == 4 else cv2.COLOR_BGR2RGB
+            screenshot_area = cv2.cvtColor(screenshot_area, code)
+        return self.preprocess_for_easyocr(screenshot_area)
+    
+    @staticmethod
+    def _join_items(items: list) -> Tuple[str, float]:
+        raw_text = ' '.join(text for text, _ in items)
+        confidence = sum(conf for _, conf in items) / len(items) if items else 0.0
+        return raw_text, confidence
+    
+    def _finalize_text(self, raw_text: str, screenshot_area, current_time: float,
+                       limiter: OCRRateLimiter) -> Optional[str]:
+        """Filter, correct and cache raw OCR text, returning it only when it is new for this purpose"""
+        if not raw_text:
+            return None
+        
+        filtered_text = self.filter_and_clean_text(raw_text)
+        if not filtered_text:
+            return None
+        
+        corrected_text = self.correct_item_names(filtered_text)
+        with self._state_lock:
+            if not limiter.accept(corrected_text, current_time):
+                return None
+            self.cache_image_result(screenshot_area, corrected_text)
+        print(f"📝 {engine_display_name(self.engine_name)} extracted: {corrected_text}")
+        return corrected_text
+    
+    def configure_burst(self, frames: int = 3, window: float = 0.4, vote_confidence: float = 0.6):
+        """
+        Configure multi-frame burst capture for drop banners
+        
+        Args:
+            frames: Number of frames captured per burst (1 disables burst mode)
+            window: Seconds the burst is spread over
+            vote_confidence: Below this confidence a second frame is OCR'd and voted on
+        """
+        self.burst_frames = max(1, int(frames))
+        self.burst_window = max(0.0, float(window))
+        self.vote_confidence = float(vote_confidence)
+    
+    def capture_drop_burst(self, frames: Optional[int] = None, window: Optional[float] = None) -> list:
+        """
+        Capture several drop area frames over a short window using one mss session
+        
+        Returns:
+            List of captured numpy frames (may be empty)
+        """
+        frames = frames or self.burst_frames
+        window = self.burst_window if window is None else window
+        interval = window / (frames - 1) if frames > 1 else 0.0
+        
+        captured = []
+        try:
+            import mss
+            with mss.mss() as sct:
+                for i in range(frames):
+                    frame = self.capture_drop_area(sct)
+                    if frame is not None:
+                        captured.append(frame)
+                    if i < frames - 1 and interval > 0:
+                        time.sleep(interval)
+        except Exception as e:
+            logging.error(f"Drop burst capture failed: {e}")
+        
+        return captured
+    
+    def frame_quality(self, frame) -> float:
+        """
+        Cheap focus and contrast score - fully rendered banners score higher than fading ones
+        
+        Args:
+            frame: numpy array of a captured frame
+            
+        Returns:
+            Quality score (higher is sharper and more complete)
+        """
+        try:
+            if len(frame.shape) == 3:
+                code = cv2.COLOR_BGRA2GRAY if frame.shape[2] == 4 else cv2.COLOR_BGR2GRAY
+                gray = cv2.cvtColor(frame, code)
+            else:
+                gray = frame
+            
+            if gray.shape[1] > 200:
+                gray = cv2.resize(gray, None, fx=0.5, fy=0.5, interpolation=cv2.INTER_AREA)
+            
+            focus = cv2.Laplacian(gray, cv2.CV_32F).var()
+            contrast = float(gray.std())
+            return float(np.sqrt(focus)) * contrast
+        except Exception as e:
+            logging.error(f"Frame quality check failed: {e}")
+            return 0.0
+    
+    def _vote(self, candidates: list) -> Tuple[int, float, bool]:
+        """
+        Pick the best reading out of one or two OCR candidates
+        
+        Agreeing readings are independent evidence, so their confidences are combined.
+        On disagreement a reading that survives filtering and names a known fruit beats
+        one that only survives filtering, which beats noise; confidence breaks ties.
+        
+        Returns:
+            Tuple of (index of the winning candidate, confidence, whether the candidates agreed)
+        """
+        if len(candidates) == 1:
+            return 0, candidates[0][1], False
+        
+        normalized = [' '.join(''.join(c for c in text.lower() if c.isalnum() or c.isspace()).split())
+                      for text, _ in candidates]
+        if normalized[0] and normalized[0] == normalized[1]:
+            best = max(range(len(candidates)), key=lambda i: candidates[i][1])
+            combined = 1.0 - (1.0 - candidates[0][1]) * (1.0 - candidates[1][1])
+            return best, combined, True
+        
+        def score(index):
+            text, confidence = candidates[index]
+            filtered = self.filter_and_clean_text(text) if text else ''
+            known = bool(filtered) and self.fruit_matcher.match(filtered) is not None
+            return bool(filtered) + known, confidence
+        
+        best = max(range(len(candidates)), key=score)
+        return best, candidates[best][1], False
+    
+    def extract_text_burst(self, frames: list, purpose: str = 'drop') -> Tuple[Optional[str], Optional[object]]:
+        """
+        OCR the sharpest frame of a burst, falling back to a two-frame vote when confidence is low
+        
+        Args:
+            frames: List of numpy frames from capture_drop_burst
+            purpose: Rate limiter to use ('drop', 'spawn' or 'test')
+            
+        Returns:
+            Tuple of (extracted and filtered text or None, sharpest frame or None) so callers
+            can reuse the frame without ranking the burst again
+        """
+        frames = [frame for frame in frames if frame is not None]
+        if not frames:
+            print("❌ Could not capture drop layout area")
+            return None, None
+        
+        if len(frames) == 1:
+            return self.extract_text(frames[0], purpose), frames[0]
+        
+        ranked = sorted(frames, key=self.frame_quality, reverse=True)
+        if not self.ensure_engine():
+            return self.extract_text(ranked[0], purpose), ranked[0]
+        return self._read_burst(ranked, purpose), ranked[0]
+    
+    def _read_burst(self, ranked: list, purpose: str) -> Optional[str]:
+        """OCR a burst already sorted sharpest first"""
+        best_frame = ranked[0]
+        limiter = self._limiter(purpose)
+        current_time = time.time()
+        with self._state_lock:
+            if not limiter.begin(current_time):
+                return None
+        
+        try:
+            cached_result = self.check_image_cache(best_frame)
+            if cached_result is not None:
+                print(f"📋 Using cached OCR result: {cached_result}")
+                return cached_result
+            
+            pool = self.pool
+            if pool is not None and pool.size > 1:
+                                                                                     
+                pending = [self._submit_frame(pool, frame) for frame in ranked[:2]]
+                candidates = [self._pool_result(pool, pending[0])]
+                if candidates[0][1] < self.vote_confidence:
+                    candidates.append(self._pool_result(pool, pending[1]))
+            else:
+                candidates = [self._read_frame(best_frame)]
+                if candidates[0][1] < self.vote_confidence:
+                    candidates.append(self._read_frame(ranked[1]))
+            
+            winner, confidence, agreed = self._vote(candidates)
+            raw_text = candidates[winner][0]
+            result = self._finalize_text(raw_text, ranked[winner], current_time, limiter)
+            readable = bool(raw_text and self.filter_and_clean_text(raw_text))
+            
+            with self._state_lock:
+                self.burst_stats['catches'] += 1
+                self.burst_stats['frames'] += len(ranked)
+                self.burst_stats['ocr_calls'] += len(candidates)
+                self.burst_stats['confidence_sum'] += confidence
+                if len(candidates) > 1:
+                    self.burst_stats['votes'] += 1
+                    if agreed:
+                        self.burst_stats['agreements'] += 1
+                if readable:
+                    self.burst_stats['readable'] += 1
+                stats = self.get_burst_stats()
+            print(f"🎞️ Burst OCR: {len(ranked)} frames, {len(candidates)} OCR call(s), confidence {confidence:.2f}"
+                  f"{' (vote agreed)' if agreed else ''} | avg {stats['ocr_calls_per_catch']:.2f} calls/catch, "
+                  f"{stats['readable_rate']*100:.0f}% readable")
+            return result
+        
+        except Exception as e:
+            logging.error(f"{engine_display_name(self.engine_name)} burst extraction failed: {e}")
+            if FALLBACK_AVAILABLE:
+                return self.detect_text_fallback(best_frame, purpose)
+            return None
+        finally:
+            with self._state_lock:
+                limiter.end()
+    
+    def get_burst_stats(self) -> dict:
+        """Get burst OCR accuracy vs cost statistics"""
+        catches = self.burst_stats['catches']
+        votes = self.burst_stats['votes']
+        return {
+            "catches": catches,
+            "ocr_calls_per_catch": self.burst_stats['ocr_calls'] / catches if catches else 0.0,
+            "frames_per_catch": self.burst_stats['frames'] / catches if catches else 0.0,
+            "vote_rate": votes / catches if catches else 0.0,
+            "vote_agreement_rate": self.burst_stats['agreements'] / votes if votes else 0.0,
+            "readable_rate": self.burst_stats['readable'] / catches if catches else 0.0,
+            "avg_confidence": self.burst_stats['confidence_sum'] / catches if catches else 0.0
+        }
+    
+    def configure_preprocessing(self, target_text_height: Optional[int] = None, crop: Optional[bool] = None,
+                                binarize: Optional[bool] = None, grayscale: Optional[bool] = None):
+        """
+        Configure the preprocessing pipeline (unset arguments keep their current value)
+        
+        Args:
+            target_text_height: Downscale so text lines are about this many pixels tall (0 disables)
+            crop: Crop to the detected text block before recognition
+            binarize: Hand the engine an Otsu-thresholded image (dark text on white)
+            grayscale: Hand the engine a grayscale image even in fast mode
+        """
+        with self._state_lock:
+            if target_text_height is not None:
+                self.preprocess['target_text_height'] = max(0, int(target_text_height))
+            if crop is not None:
+                self.preprocess['crop'] = bool(crop)
+            if binarize is not None:
+                self.preprocess['binarize'] = bool(binarize)
+            if grayscale is not None:
+                self.preprocess['grayscale'] = bool(grayscale)
+            self.image_cache.clear()
+    
+    def locate_text(self, gray) -> Optional[Tuple[int, int, int, int, int]]:
+        """
+        Find the text block and its line height from horizontal intensity edges
+        
+        Args:
+            gray: Grayscale numpy array
+            
+        Returns:
+            Tuple of (x0, y0, x1, y1, text line height) or None if no text-like rows are found
+        """
+        if gray.shape[0] < 4 or gray.shape[1] < 4:
+            return None
+        
+        edges = np.abs(np.diff(gray.astype(np.int16), axis=1)) > 40
+        active = edges.sum(axis=1) > max(2, edges.shape[1] * 0.02)
+        if not active.any():
+            return None
+        
+        transitions = np.flatnonzero(np.diff(np.concatenate(([0], active.astype(np.int8), [0]))))
+        starts, ends = transitions[::2], transitions[1::2]
+        keep = (ends - starts) >= 4
+        if not keep.any():
+            return None
+        starts, ends = starts[keep], ends[keep]
+        
+        y0, y1 = int(starts[0]), int(ends[-1])
+        columns = np.flatnonzero(edges[y0:y1].any(axis=0))
+        if not len(columns):
+            return None
+        return int(columns[0]), y0, int(columns[-1]) + 2, y1, int(np.median(ends - starts))
     
     def preprocess_for_easyocr(self, img_array):
         """
-        Lightweight image enhancement for better EasyOCR recognition with minimal CPU impact
+        Preprocessing pipeline: crop to the text block, downscale to the target text
+        height (and max image size), then grayscale/contrast or binarize
         
         Args:
-            img_array: numpy array of image
+            img_array: numpy array of image (RGB or grayscale)
             
         Returns:
             Processed numpy array
         """
         try:
+            params = self.preprocess
+            is_color = len(img_array.shape) == 3
+            gray = cv2.cvtColor(img_array, cv2.COLOR_RGB2GRAY) if is_color else img_array
+            
+            scale_factor = 1.0
+            if params['crop'] or params['target_text_height']:
+                text_box = self.locate_text(gray)
+                if text_box:
+                    x0, y0, x1, y1, text_height = text_box
+                    if params['crop']:
+                        margin = max(4, text_height // 3)
+                        x0, y0 = max(0, x0 - margin), max(0, y0 - margin)
+                        x1, y1 = min(gray.shape[1], x1 + margin), min(gray.shape[0], y1 + margin)
+                        img_array = img_array[y0:y1, x0:x1]
+                        gray = gray[y0:y1, x0:x1]
+                    target = params['target_text_height']
+                    if target and text_height > target * 1.15:
+                        scale_factor = target / text_height
+            
                                                         
-            height, width = img_array.shape[:2]
-            if width > self.max_image_size[0] or height > self.max_image_size[1]:
-                scale_factor = min(self.max_image_size[0] / width, self.max_image_size[1] / height)
-                new_width = int(width * scale_factor)
-                new_height = int(height * scale_factor)
-                img_array = cv2.resize(img_array, (new_width, new_height), interpolation=cv2.INTER_LINEAR)
+            height, width = gray.shape[:2]
+            scale_factor = min(scale_factor, self.max_image_size[0] / width, self.max_image_size[1] / height)
+            if scale_factor < 1.0:
+                size = (max(1, int(width * scale_factor)), max(1, int(height * scale_factor)))
+                img_array = cv2.resize(img_array, size, interpolation=cv2.INTER_AREA)
+                gray = cv2.resize(gray, size, interpolation=cv2.INTER_AREA)
+            
+            if params['binarize']:
+                _, mask = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+                if cv2.countNonZero(mask) < mask.size // 2:
+                    mask = cv2.bitwise_not(mask)
+                return mask
             
                                                  
             if self.skip_preprocessing:
-                return img_array
-            
-                                                                
-            if len(img_array.shape) == 3:
-                img_array = cv2.cvtColor(img_array, cv2.COLOR_RGB2GRAY)
+                return gray if params['grayscale'] else img_array
             
                                                                   
                                                                              
-            img_array = cv2.convertScaleAbs(img_array, alpha=1.2, beta=10)
-            
-            return img_array
+            return cv2.convertScaleAbs(gray, alpha=1.2, beta=10)
             
         except Exception as e:
             logging.error(f"Image preprocessing failed: {e}")
@@ -458,8 +949,8 @@ class OCRManager:
         Returns:
             Tuple of (success, message)
         """
-        if not self.ocr_available or not self.reader:
-            return False, f"{OCR_ENGINE or 'OCR'} not available"
+        if not self.ensure_engine():
+            return False, f"{engine_display_name(self.engine_name)} not available"
         
         if not self.app or not hasattr(self.app, 'layout_manager'):
             return False, "No app reference - cannot access drop layout area"
@@ -470,26 +961,25 @@ class OCRManager:
             if drop_area is None:
                 return False, "Could not capture drop layout area for testing"
             
-                                                                       
-            processed_img = self.preprocess_for_easyocr(drop_area)
-            
-                                                 
-            if OCR_ENGINE == "paddle":
-                results = self.reader.ocr(processed_img, cls=True)
-                success = True                                   
-            else:
-                results = self.reader.readtext(processed_img, detail=0)
-                success = True                                   
+            limiter = self.limiters['test']
+            with self._state_lock:
+                if not limiter.begin(time.time()):
+                    return False, "An OCR test is already running"
+            try:
+                self._read_frame(drop_area)
+            finally:
+                with self._state_lock:
+                    limiter.end()
             
-            return True, f"{OCR_ENGINE.title()}OCR is working correctly with drop layout area"
+            return True, f"{engine_display_name(self.engine_name)} is working correctly with drop layout area"
             
         except Exception as e:
-            return False, f"{OCR_ENGINE.title()}OCR test failed: {e}"
+            return False, f"{engine_display_name(self.engine_name)} test failed: {e}"
     
     def detect_fruit_spawn(self, text: str) -> Optional[str]:
         """
         Detect devil fruit spawn from OCR text
-        Matches against known GPO fruit names using fuzzy matching
+        Matches against known GPO fruit names using the indexed edit-distance matcher
         
         Args:
             text: OCR extracted text
@@ -511,35 +1001,14 @@ class OCRManager:
             if 'spawn' not in text_lower and 'spavn' not in text_lower:
                 return None
         
-                                                     
-        best_match = None
-        best_similarity = 0
-        best_fruit = None
-        
-        for i, fruit_lower in enumerate(self.devil_fruits_lower):
-                                  
-            if fruit_lower in text_lower:
-                print(f"✅ Direct fruit match: {self.devil_fruits[i]}")
-                return self.devil_fruits[i]
-            
-                                                            
-            if len(fruit_lower) >= 3:
-                for word in text_lower.split():
-                    if len(word) >= 3:
-                                              
-                        matches = sum(1 for a, b in zip(fruit_lower, word) if a == b)
-                        similarity = matches / max(len(fruit_lower), len(word))
-                        
-                                          
-                        if similarity > best_similarity:
-                            best_similarity = similarity
-                            best_match = word
-                            best_fruit = self.devil_fruits[i]
-        
-                                                        
-        if best_similarity >= 0.7:
-            print(f"✅ Fuzzy fruit match: '{best_match}' → {best_fruit} ({best_similarity*100:.0f}% similar)")
-            return best_fruit
+        match = self.fruit_matcher.match(text)
+        if match:
+            fruit_name, score = match
+            if score >= 1.0:
+                print(f"✅ Direct fruit match: {fruit_name}")
+            else:
+                print(f"✅ Fuzzy fruit match: {fruit_name} ({score*100:.0f}% similar)")
+            return fruit_name
         
         print(f"❌ No fruit name found in text: {text_lower}")
         return None
@@ -548,17 +1017,22 @@ class OCRManager:
         """Get OCR statistics"""
         return {
             "available": self.ocr_available,
+            "engine": self.engine_name,
             "last_text": self.last_text,
             "last_capture_time": self.last_capture_time,
-            "cooldown": self.capture_cooldown
+            "cooldown": self.capture_cooldown,
+            "burst": self.get_burst_stats(),
+            "purposes": {purpose: limiter.get_stats() for purpose, limiter in self.limiters.items()},
+            "pool": self.pool.get_stats() if self.pool is not None else None
         }
     
-    def detect_text_fallback(self, screenshot_area) -> Optional[str]:
+    def detect_text_fallback(self, screenshot_area, purpose: str = 'drop') -> Optional[str]:
         """
         Fallback text detection without OCR - detects text-like patterns in drop layout area
         
         Args:
             screenshot_area: numpy array of drop area screenshot
+            purpose: Rate limiter whose cooldown applies
             
         Returns:
             Simple text detection result or None
@@ -568,8 +1042,9 @@ class OCRManager:
             
         try:
                             
+            limiter = self._limiter(purpose)
             current_time = time.time()
-            if current_time - self.last_capture_time < self.capture_cooldown:
+            if current_time - limiter.last_time < limiter.cooldown:
                 return None
             
             height, width = screenshot_area.shape[:2]
@@ -633,7 +1108,8 @@ class OCRManager:
             very_colorful = len(screenshot_area.shape) == 3 and np.mean(np.var(screenshot_area, axis=(0, 1))) > 800
             
             if high_confidence or very_colorful:
-                self.last_capture_time = current_time
+                with self._state_lock:
+                    limiter.last_time = current_time
                                                                        
                 return f"TEXT_DETECTED_NO_OCR (score: {text_score}/4, area: {width}x{height})"
             
@@ -658,10 +1134,11 @@ class OCRManager:
             img_hash = self.simple_image_hash(img_array)
             
                                             
-            for cached_hash, cached_text in self.image_cache.items():
-                similarity = self.hash_similarity(img_hash, cached_hash)
-                if similarity > self.cache_similarity_threshold:
-                    return cached_text
+            with self._state_lock:
+                for cached_hash, cached_text in self.image_cache.items():
+                    similarity = self.hash_similarity(img_hash, cached_hash)
+                    if similarity > self.cache_similarity_threshold:
+                        return cached_text
             
             return None
             
@@ -679,14 +1156,14 @@ class OCRManager:
         """
         try:
                                                    
-            if len(self.image_cache) >= self.cache_max_size:
-                                                   
-                oldest_key = next(iter(self.image_cache))
-                del self.image_cache[oldest_key]
-            
-                                     
             img_hash = self.simple_image_hash(img_array)
-            self.image_cache[img_hash] = text_result
+            with self._state_lock:
+                if len(self.image_cache) >= self.cache_max_size:
+                                                       
+                    oldest_key = next(iter(self.image_cache))
+                    del self.image_cache[oldest_key]
+                
+                self.image_cache[img_hash] = text_result
             
         except Exception as e:
             logging.error(f"Cache storage failed: {e}")
@@ -740,39 +1217,48 @@ class OCRManager:
             logging.error(f"Hash similarity calculation failed: {e}")
             return 0.0
     
-    def capture_drop_area(self):
+    def capture_drop_area(self, sct=None, quiet: bool = False):
         """
         Capture screenshot from the configured drop layout area
         
+        Args:
+            sct: Optional open mss instance to reuse instead of opening a new session
+            quiet: Skip the capture log line (for frequent sampling)
+            
         Returns:
             numpy array of drop area screenshot or None if failed
         """
         try:
             if not self.app or not hasattr(self.app, 'layout_manager'):
-                print("❌ No app or layout manager available for drop area capture")
+                if not quiet:
+                    print("❌ No app or layout manager available for drop area capture")
                 return None
             
                                               
             drop_area = self.app.layout_manager.get_layout_area('drop')
             if not drop_area:
-                print("❌ Drop layout area not configured")
+                if not quiet:
+                    print("❌ Drop layout area not configured")
                 return None
             
-                                             
-            import mss
-            with mss.mss() as sct:
-                monitor = {
-                    'left': drop_area['x'],
-                    'top': drop_area['y'],
-                    'width': drop_area['width'],
-                    'height': drop_area['height']
-                }
-                screenshot = sct.grab(monitor)
-                screenshot_array = np.array(screenshot)
-                
+            monitor = {
+                'left': drop_area['x'],
+                'top': drop_area['y'],
+                'width': drop_area['width'],
+                'height': drop_area['height']
+            }
+            
+            if sct is None:
+                import mss
+                with mss.mss() as own_sct:
+                    screenshot_array = np.asarray(own_sct.grab(monitor))
+            else:
+                screenshot_array = np.asarray(sct.grab(monitor))
+            
+            if not quiet:
                 print(f"📸 Captured drop area: {drop_area['width']}x{drop_area['height']} at ({drop_area['x']}, {drop_area['y']})")
-                return screenshot_array
+            return screenshot_array
                 
         except Exception as e:
             logging.error(f"Drop area capture failed: {e}")
-            return None
\ No newline at end of file
+            return None
@@ -0,0 +1,338 @@
+"""
+OCR Pool for running recognition in worker processes
+Each worker owns its own engine, so EasyOCR's long GIL-holding calls no longer
+serialize drop, spawn and extra-region OCR. Frames are handed over through
+shared memory slots instead of being pickled.
+"""
+
+import atexit
+import logging
+import multiprocessing
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from multiprocessing import shared_memory
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+try:
+    from src.ocr_engines import create_engine, engine_display_name
+except ImportError:
+    from ocr_engines import create_engine, engine_display_name
+
+SLOT_ALIGNMENT = 64 * 1024
+WORKER_ATTACH_CACHE = 16
+
+
+def _attach_shared_memory(name: str) -> shared_memory.SharedMemory:
+    """Attach to an existing segment without letting this process's resource tracker unlink it"""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        shm = shared_memory.SharedMemory(name=name)
+        try:
+            from multiprocessing import resource_tracker
+            resource_tracker.unregister(shm._name, 'shared_memory')
+        except Exception:
+            pass
+        return shm
+
+
+def _pool_worker(worker_id: int, engines: List[str], task_queue, result_queue):
+    """Worker process loop: create an engine, then recognize frames read from shared memory"""
+    engine = None
+    engine_name = None
+    errors = []
+    for name in engines:
+        try:
+            engine = create_engine(name)
+            engine_name = name
+            break
+        except Exception as e:
+            errors.append(f"{name}: {e}")
+    result_queue.put(('ready', worker_id, engine_name, '; '.join(errors) if engine is None else None))
+    if engine is None:
+        return
+
+    parent = multiprocessing.parent_process()
+    attached: Dict[str, shared_memory.SharedMemory] = {}
+    try:
+        while True:
+            try:
+                task = task_queue.get(timeout=1.0)
+            except queue.Empty:
+                if parent is not None and not parent.is_alive():
+                    break
+                continue
+            if task is None:
+                break
+
+            job_id, shm_name, shape, dtype = task
+            try:
+                shm = attached.get(shm_name)
+                if shm is None:
+                    if len(attached) >= WORKER_ATTACH_CACHE:
+                        attached.pop(next(iter(attached))).close()
+                    shm = attached[shm_name] = _attach_shared_memory(shm_name)
+
+                img = np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+                start = time.perf_counter()
+                items = [(str(text), float(conf)) for text, conf in engine.recognize(img)]
+                elapsed = (time.perf_counter() - start) * 1000
+                del img
+                result_queue.put(('done', job_id, items, elapsed, None))
+            except Exception as e:
+                result_queue.put(('done', job_id, [], 0.0, str(e)))
+    finally:
+        for shm in attached.values():
+            try:
+                shm.close()
+            except Exception:
+                pass
+
+
+class _FrameSlot:
+    """A reusable shared memory buffer that holds one in-flight frame"""
+
+    def __init__(self, nbytes: int):
+        capacity = max(SLOT_ALIGNMENT, -(-nbytes // SLOT_ALIGNMENT) * SLOT_ALIGNMENT)
+        self.shm = shared_memory.SharedMemory(create=True, size=capacity)
+        self.capacity = capacity
+
+    def write(self, img: np.ndarray):
+        view = np.ndarray(img.shape, dtype=img.dtype, buffer=self.shm.buf)
+        view[...] = img
+        del view
+
+    def destroy(self):
+        try:
+            self.shm.close()
+            self.shm.unlink()
+        except Exception:
+            pass
+
+
+class OCRPool:
+    """
+    Process pool of OCR engines
+    Exposes recognize(img) like an OCREngine, so OCRManager can use it as its reader
+    """
+    thread_safe = True
+
+    def __init__(self, engines: List[str], size: int = 2, start_timeout: float = 180.0,
+                 result_timeout: float = 30.0):
+        self.engines = list(engines)
+        self.size = max(1, int(size))
+        self.start_timeout = start_timeout
+        self.result_timeout = result_timeout
+        self.engine_name = None
+        self.display_name = "OCR pool"
+        self.max_slots = self.size * 4
+
+        self._context = multiprocessing.get_context('spawn')
+        self._task_queue = None
+        self._result_queue = None
+        self._processes = []
+        self._collector = None
+        self._lock = threading.Lock()
+        self._free_slots: List[_FrameSlot] = []
+        self._slot_count = 0
+        self._jobs: Dict[int, Tuple[Future, _FrameSlot, float]] = {}
+        self._next_job_id = 0
+        self._running = False
+
+        self.stats = {'jobs': 0, 'errors': 0, 'recognize_ms': 0.0, 'total_ms': 0.0, 'max_in_flight': 0}
+
+    def start(self) -> bool:
+        """
+        Launch the workers and wait until each has created its engine
+
+        Returns:
+            True if at least one worker is ready
+        """
+        if self._running:
+            return True
+
+        self._task_queue = self._context.Queue()
+        self._result_queue = self._context.Queue()
+        for worker_id in range(self.size):
+            process = self._context.Process(target=_pool_worker, name=f"ocr-worker-{worker_id}",
+                                            args=(worker_id, self.engines, self._task_queue, self._result_queue),
+                                            daemon=True)
+            process.start()
+            self._processes.append(process)
+
+        print(f"🔧 Starting OCR pool with {self.size} worker(s)...")
+        ready = 0
+        deadline = time.time() + self.start_timeout
+        for _ in range(self.size):
+            try:
+                _, worker_id, engine_name, error = self._result_queue.get(timeout=max(0.1, deadline - time.time()))
+            except queue.Empty:
+                break
+            if error:
+                logging.error(f"OCR worker {worker_id} failed to start: {error}")
+                continue
+            ready += 1
+            self.engine_name = self.engine_name or engine_name
+
+        if not ready:
+            print("❌ OCR pool failed to start - no worker created an engine")
+            self.close()
+            return False
+
+        self.display_name = f"{engine_display_name(self.engine_name)} x{ready}"
+        self._running = True
+        self._collector = threading.Thread(target=self._collect_results, name="ocr-pool-results", daemon=True)
+        self._collector.start()
+        atexit.register(self.close)
+        print(f"✅ OCR pool ready - {ready} {engine_display_name(self.engine_name)} worker(s)")
+        return True
+
+    def _acquire_slot(self, nbytes: int) -> _FrameSlot:
+        with self._lock:
+            fitting = [slot for slot in self._free_slots if slot.capacity >= nbytes]
+            if fitting:
+                slot = min(fitting, key=lambda s: s.capacity)
+                self._free_slots.remove(slot)
+                return slot
+            if self._slot_count >= self.max_slots and self._free_slots:
+                self._free_slots.pop(0).destroy()
+                self._slot_count -= 1
+            self._slot_count += 1
+        return _FrameSlot(nbytes)
+
+    def _release_slot(self, slot: _FrameSlot):
+        with self._lock:
+            # Overflow slots (created while every slot was in flight) are destroyed, not parked
+            if self._running and self._slot_count <= self.max_slots:
+                self._free_slots.append(slot)
+                return
+            self._slot_count -= 1
+        slot.destroy()
+
+    def submit(self, img) -> Future:
+        """
+        Queue a preprocessed frame for recognition
+
+        Returns:
+            Future resolving to a list of (text, confidence) pairs
+        """
+        if not self._running:
+            raise RuntimeError("OCR pool is not running")
+
+        img = np.ascontiguousarray(img)
+        slot = self._acquire_slot(img.nbytes)
+        slot.write(img)
+
+        future = Future()
+        with self._lock:
+            job_id = self._next_job_id
+            self._next_job_id += 1
+            self._jobs[job_id] = (future, slot, time.perf_counter())
+            self.stats['max_in_flight'] = max(self.stats['max_in_flight'], len(self._jobs))
+        self._task_queue.put((job_id, slot.shm.name, img.shape, img.dtype.str))
+        return future
+
+    def recognize(self, img) -> List[Tuple[str, float]]:
+        """Recognize one frame, waiting at most result_timeout for a worker (raises TimeoutError)"""
+        return self.submit(img).result(timeout=self.result_timeout)
+
+    def map(self, images: list) -> List[List[Tuple[str, float]]]:
+        """Recognize several frames concurrently, returning results in input order (raises TimeoutError)"""
+        futures = [self.submit(img) for img in images]
+        deadline = time.monotonic() + self.result_timeout
+        return [future.result(timeout=max(0.0, deadline - time.monotonic())) for future in futures]
+
+    def _collect_results(self):
+        while self._running:
+            try:
+                message = self._result_queue.get(timeout=0.5)
+            except queue.Empty:
+                if not any(process.is_alive() for process in self._processes):
+                    logging.error("All OCR workers exited - failing pending jobs")
+                    self._fail_pending("OCR workers exited")
+                    break
+                continue
+            except (EOFError, OSError):
+                break
+
+            if message[0] != 'done':
+                continue
+            _, job_id, items, recognize_ms, error = message
+            with self._lock:
+                job = self._jobs.pop(job_id, None)
+            if job is None:
+                continue
+            future, slot, submitted = job
+            self._release_slot(slot)
+
+            self.stats['jobs'] += 1
+            self.stats['recognize_ms'] += recognize_ms
+            self.stats['total_ms'] += (time.perf_counter() - submitted) * 1000
+            if error:
+                self.stats['errors'] += 1
+                future.set_exception(RuntimeError(error))
+            else:
+                future.set_result(items)
+
+    def _fail_pending(self, reason: str):
+        with self._lock:
+            jobs = list(self._jobs.values())
+            self._jobs.clear()
+        for future, slot, _ in jobs:
+            self._release_slot(slot)
+            if not future.done():
+                future.set_exception(RuntimeError(reason))
+
+    def get_stats(self) -> dict:
+        """Throughput and queueing statistics"""
+        jobs = self.stats['jobs']
+        avg_recognize = self.stats['recognize_ms'] / jobs if jobs else 0.0
+        avg_total = self.stats['total_ms'] / jobs if jobs else 0.0
+        return {
+            "workers": sum(1 for process in self._processes if process.is_alive()),
+            "engine": self.engine_name,
+            "jobs": jobs,
+            "errors": self.stats['errors'],
+            "in_flight": len(self._jobs),
+            "max_in_flight": self.stats['max_in_flight'],
+            "avg_recognize_ms": avg_recognize,
+            "avg_queue_ms": max(0.0, avg_total - avg_recognize),
+            "shared_slots": self._slot_count
+        }
+
+    def close(self):
+        """Stop the workers and release all shared memory"""
+        with self._lock:
+            was_running = self._running
+            self._running = False
+        if self._task_queue is not None:
+            for _ in self._processes:
+                try:
+                    self._task_queue.put(None)
+                except Exception:
+                    pass
+        for process in self._processes:
+            process.join(timeout=3)
+            if process.is_alive():
+                process.terminate()
+        self._processes = []
+
+        if self._collector is not None and self._collector is not threading.current_thread():
+            self._collector.join(timeout=2)
+        self._fail_pending("OCR pool closed")
+        with self._lock:
+            slots, self._free_slots = self._free_slots, []
+            self._slot_count -= len(slots)
+        for slot in slots:
+            slot.destroy()
+
+        try:
+            atexit.unregister(self.close)
+        except Exception:
+            pass
+        if was_running:
+            print("🛑 OCR pool stopped")
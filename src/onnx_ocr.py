@@ -0,0 +1,383 @@
+"""
+ONNX OCR - EasyOCR's detector and recognizer exported to int8 ONNX models
+Runs on ONNX Runtime CPU without importing torch. Pre- and post-processing follow
+EasyOCR's (CRAFT box extraction, line grouping, CTC greedy decoding, confidence)
+so results match the PyTorch reader up to quantization error.
+
+Usage:
+    python src/onnx_ocr.py export [--out onnx_models] [--keep-fp32]   (needs easyocr + torch + onnx)
+    python src/onnx_ocr.py read image.png [--models onnx_models]
+"""
+
+import argparse
+import json
+import math
+import os
+import sys
+import time
+from typing import List, Tuple
+
+import numpy as np
+
+try:
+    from src.lazy_import import lazy_module
+except ImportError:
+    from lazy_import import lazy_module
+
+cv2 = lazy_module('cv2')
+
+DEFAULT_MODEL_DIR = "onnx_models"
+DETECTOR_FILE = "craft_int8.onnx"
+RECOGNIZER_FILE = "recognizer_int8.onnx"
+METADATA_FILE = "onnx_ocr.json"
+
+DETECTOR_MEAN = np.array([0.485, 0.456, 0.406], dtype=np.float32) * 255.0
+DETECTOR_STD = np.array([0.229, 0.224, 0.225], dtype=np.float32) * 255.0
+
+
+def models_exist(model_dir: str = DEFAULT_MODEL_DIR) -> bool:
+    """Check whether exported models and metadata are present"""
+    return all(os.path.exists(os.path.join(model_dir, name))
+               for name in (DETECTOR_FILE, RECOGNIZER_FILE, METADATA_FILE))
+
+
+def resize_aspect_ratio(img: np.ndarray, square_size: int, mag_ratio: float) -> Tuple[np.ndarray, float]:
+    """Scale the longest side to mag_ratio (capped at square_size) and pad to multiples of 32"""
+    height, width, channels = img.shape
+    target_size = min(mag_ratio * max(height, width), square_size)
+    ratio = target_size / max(height, width)
+    target_h, target_w = int(height * ratio), int(width * ratio)
+    proc = cv2.resize(img, (target_w, target_h), interpolation=cv2.INTER_LINEAR)
+
+    padded = np.zeros((target_h + (-target_h % 32), target_w + (-target_w % 32), channels), dtype=np.float32)
+    padded[:target_h, :target_w, :] = proc
+    return padded, ratio
+
+
+def detection_boxes(textmap: np.ndarray, linkmap: np.ndarray, text_threshold: float,
+                    link_threshold: float, low_text: float) -> List[np.ndarray]:
+    """CRAFT score maps to quadrilateral word boxes (port of EasyOCR's getDetBoxes_core)"""
+    img_h, img_w = textmap.shape
+    _, text_score = cv2.threshold(textmap, low_text, 1, 0)
+    _, link_score = cv2.threshold(linkmap, link_threshold, 1, 0)
+    combined = np.clip(text_score + link_score, 0, 1).astype(np.uint8)
+    count, labels, stats, _ = cv2.connectedComponentsWithStats(combined, connectivity=4)
+
+    boxes = []
+    for k in range(1, count):
+        size = stats[k, cv2.CC_STAT_AREA]
+        if size < 10:
+            continue
+        component = labels == k
+        if np.max(textmap[component]) < text_threshold:
+            continue
+
+        segmap = np.zeros(textmap.shape, dtype=np.uint8)
+        segmap[component] = 255
+        segmap[np.logical_and(link_score == 1, text_score == 0)] = 0
+        x, y = stats[k, cv2.CC_STAT_LEFT], stats[k, cv2.CC_STAT_TOP]
+        w, h = stats[k, cv2.CC_STAT_WIDTH], stats[k, cv2.CC_STAT_HEIGHT]
+        niter = int(math.sqrt(size * min(w, h) / (w * h)) * 2)
+        sx, ex = max(0, x - niter), min(img_w, x + w + niter + 1)
+        sy, ey = max(0, y - niter), min(img_h, y + h + niter + 1)
+        kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (1 + niter, 1 + niter))
+        segmap[sy:ey, sx:ex] = cv2.dilate(segmap[sy:ey, sx:ex], kernel)
+
+        contours = np.roll(np.array(np.where(segmap != 0)), 1, axis=0).transpose().reshape(-1, 2)
+        box = cv2.boxPoints(cv2.minAreaRect(contours))
+        box_w, box_h = np.linalg.norm(box[0] - box[1]), np.linalg.norm(box[1] - box[2])
+        if abs(1 - max(box_w, box_h) / (min(box_w, box_h) + 1e-5)) <= 0.1:
+            left, right = contours[:, 0].min(), contours[:, 0].max()
+            top, bottom = contours[:, 1].min(), contours[:, 1].max()
+            box = np.array([[left, top], [right, top], [right, bottom], [left, bottom]], dtype=np.float32)
+        boxes.append(np.roll(box, 4 - box.sum(axis=1).argmin(), 0))
+    return boxes
+
+
+def group_text_boxes(boxes: List[np.ndarray], ycenter_ths: float = 0.5, height_ths: float = 0.5,
+                     width_ths: float = 0.5, add_margin: float = 0.1, min_size: int = 20) -> List[List[int]]:
+    """
+    Merge word boxes into text lines (EasyOCR's group_text_box for horizontal text)
+
+    Returns:
+        List of [x_min, x_max, y_min, y_max] line boxes
+    """
+    items = []
+    for box in boxes:
+        x_min, x_max = float(box[:, 0].min()), float(box[:, 0].max())
+        y_min, y_max = float(box[:, 1].min()), float(box[:, 1].max())
+        items.append([x_min, x_max, y_min, y_max, 0.5 * (y_min + y_max), y_max - y_min])
+    items.sort(key=lambda item: item[4])
+
+    lines, current = [], []
+    for item in items:
+        if current:
+            mean_height = np.mean([b[5] for b in current])
+            mean_center = np.mean([b[4] for b in current])
+            if abs(mean_center - item[4]) >= ycenter_ths * mean_height:
+                lines.append(current)
+                current = []
+        current.append(item)
+    if current:
+        lines.append(current)
+
+    merged = []
+    for line in lines:
+        line.sort(key=lambda item: item[0])
+        group = [line[0]]
+        for item in line[1:]:
+            mean_height = np.mean([b[5] for b in group])
+            previous_end = max(b[1] for b in group)
+            if abs(mean_height - item[5]) < height_ths * mean_height and item[0] - previous_end < width_ths * mean_height:
+                group.append(item)
+                continue
+            merged.append(group)
+            group = [item]
+        merged.append(group)
+
+    results = []
+    for group in merged:
+        x_min, x_max = min(b[0] for b in group), max(b[1] for b in group)
+        y_min, y_max = min(b[2] for b in group), max(b[3] for b in group)
+        if max(x_max - x_min, y_max - y_min) <= min_size:
+            continue
+        margin = int(add_margin * min(x_max - x_min, y_max - y_min))
+        results.append([int(x_min - margin), int(x_max + margin), int(y_min - margin), int(y_max + margin)])
+    return results
+
+
+def adjust_contrast_grey(img: np.ndarray, target: float = 0.5) -> np.ndarray:
+    """Stretch a low-contrast grayscale crop (EasyOCR's second-pass contrast adjustment)"""
+    high, low = np.percentile(img, 90), np.percentile(img, 10)
+    if (high - low) / max(10, high + low) >= target:
+        return img
+    stretched = (img.astype(np.float32) - low + 25) * (200.0 / max(10, high - low))
+    return np.clip(stretched, 0, 255).astype(np.uint8)
+
+
+def ctc_greedy_decode(probs: np.ndarray, characters: List[str]) -> List[Tuple[str, float]]:
+    """
+    Greedy CTC decoding with EasyOCR's confidence (product of kept probabilities ** (2 / sqrt(n)))
+
+    Args:
+        probs: (batch, steps, classes) softmax probabilities
+        characters: Class index to character list (index 0 is the CTC blank)
+    """
+    results = []
+    indices = probs.argmax(axis=2)
+    max_probs = probs.max(axis=2)
+    for index_row, prob_row in zip(indices, max_probs):
+        keep = np.ones(len(index_row), dtype=bool)
+        keep[1:] = index_row[1:] != index_row[:-1]
+        keep &= index_row != 0
+        text = ''.join(characters[i] for i in index_row[keep])
+        kept = prob_row[index_row != 0]
+        confidence = float(kept.prod() ** (2.0 / np.sqrt(len(kept)))) if len(kept) else 0.0
+        results.append((text, confidence))
+    return results
+
+
+def _softmax(logits: np.ndarray) -> np.ndarray:
+    shifted = np.exp(logits - logits.max(axis=2, keepdims=True))
+    return shifted / shifted.sum(axis=2, keepdims=True)
+
+
+class OnnxOCR:
+    """Int8 CRAFT detector + CRNN recognizer on ONNX Runtime"""
+
+    def __init__(self, model_dir: str = DEFAULT_MODEL_DIR, threads: int = 0):
+        import onnxruntime as ort
+
+        with open(os.path.join(model_dir, METADATA_FILE), 'r', encoding='utf-8') as f:
+            self.metadata = json.load(f)
+        self.characters = self.metadata['characters']
+        self.image_height = self.metadata.get('image_height', 64)
+        self.canvas_size = self.metadata.get('canvas_size', 2560)
+        self.mag_ratio = self.metadata.get('mag_ratio', 1.0)
+        self.text_threshold = self.metadata.get('text_threshold', 0.7)
+        self.link_threshold = self.metadata.get('link_threshold', 0.4)
+        self.low_text = self.metadata.get('low_text', 0.4)
+        self.contrast_ths = self.metadata.get('contrast_ths', 0.1)
+        self.adjust_contrast = self.metadata.get('adjust_contrast', 0.5)
+        self.max_width = self.metadata.get('max_width', 2048)
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if threads:
+            options.intra_op_num_threads = threads
+        providers = ['CPUExecutionProvider']
+        self.detector = ort.InferenceSession(os.path.join(model_dir, DETECTOR_FILE), options, providers=providers)
+        self.recognizer = ort.InferenceSession(os.path.join(model_dir, RECOGNIZER_FILE), options, providers=providers)
+        self.detector_input = self.detector.get_inputs()[0].name
+        self.recognizer_input = self.recognizer.get_inputs()[0].name
+
+    def detect(self, color: np.ndarray) -> List[List[int]]:
+        """Find text line boxes ([x_min, x_max, y_min, y_max]) in a 3-channel image"""
+        resized, ratio = resize_aspect_ratio(color, self.canvas_size, self.mag_ratio)
+        tensor = ((resized - DETECTOR_MEAN) / DETECTOR_STD).transpose(2, 0, 1)[None].astype(np.float32)
+        score_map = self.detector.run(None, {self.detector_input: tensor})[0][0]
+
+        boxes = detection_boxes(score_map[:, :, 0], score_map[:, :, 1],
+                                self.text_threshold, self.link_threshold, self.low_text)
+        scale = 2.0 / ratio
+        return group_text_boxes([box * scale for box in boxes])
+
+    def _predict(self, crops: List[np.ndarray], max_width: int) -> List[Tuple[str, float]]:
+        """One batched recognizer call; crops are right-padded by repeating their last column"""
+        batch = np.empty((len(crops), 1, self.image_height, max_width), dtype=np.float32)
+        for i, crop in enumerate(crops):
+            normalized = (crop.astype(np.float32) / 255.0 - 0.5) / 0.5
+            batch[i, 0, :, :crop.shape[1]] = normalized
+            batch[i, 0, :, crop.shape[1]:] = normalized[:, -1:]
+        logits = self.recognizer.run(None, {self.recognizer_input: batch})[0]
+        return ctc_greedy_decode(_softmax(logits), self.characters)
+
+    def recognize_lines(self, gray: np.ndarray, lines: List[List[int]]) -> List[Tuple[str, float]]:
+        """Recognize line crops of a grayscale image, retrying low-confidence lines with stretched contrast"""
+        crops = []
+        for x_min, x_max, y_min, y_max in lines:
+            crop = gray[max(0, y_min):max(0, y_max), max(0, x_min):max(0, x_max)]
+            if crop.shape[0] < 2 or crop.shape[1] < 2:
+                continue
+            width = min(int(self.image_height * crop.shape[1] / crop.shape[0]), self.max_width)
+            crops.append(cv2.resize(crop, (max(1, width), self.image_height), interpolation=cv2.INTER_LINEAR))
+        if not crops:
+            return []
+
+        max_width = int(math.ceil(max(crop.shape[1] for crop in crops) / self.image_height)) * self.image_height
+        results = self._predict(crops, max_width)
+
+        retry = [i for i, (_, confidence) in enumerate(results) if confidence < self.contrast_ths]
+        if retry:
+            second = self._predict([adjust_contrast_grey(crops[i], self.adjust_contrast) for i in retry], max_width)
+            for i, item in zip(retry, second):
+                if item[1] > results[i][1]:
+                    results[i] = item
+        return results
+
+    def readtext(self, img: np.ndarray) -> List[Tuple[str, float]]:
+        """
+        Detect and recognize text
+
+        Args:
+            img: 3-channel or grayscale numpy array, handled exactly like EasyOCR's reformat_input
+
+        Returns:
+            List of (text, confidence) pairs in reading order
+        """
+        if len(img.shape) == 2:
+            gray, color = img, cv2.cvtColor(img, cv2.COLOR_GRAY2BGR)
+        else:
+            color = img[:, :, :3]
+            gray = cv2.cvtColor(color, cv2.COLOR_BGR2GRAY)
+        return [item for item in self.recognize_lines(gray, self.detect(color)) if item[0]]
+
+
+def _recognizer_for_export(model):
+    """Wrap EasyOCR's recognizer so ONNX export sees a single image input (the text argument is unused by CTC)"""
+    import torch
+
+    class RecognizerExport(torch.nn.Module):
+        def __init__(self, inner):
+            super().__init__()
+            self.inner = inner
+
+        def forward(self, image):
+            return self.inner(image, None)
+
+    return RecognizerExport(model)
+
+
+def export_models(model_dir: str = DEFAULT_MODEL_DIR, keep_fp32: bool = False, opset: int = 17) -> dict:
+    """
+    Export EasyOCR's English detector and recognizer to ONNX and quantize them to int8
+
+    Returns:
+        Dict of model file sizes in MB
+    """
+    import easyocr
+    import torch
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+
+    os.makedirs(model_dir, exist_ok=True)
+    reader = easyocr.Reader(['en'], gpu=False, verbose=False, quantize=False)
+    detector = reader.detector.module if hasattr(reader.detector, 'module') else reader.detector
+    recognizer = reader.recognizer.module if hasattr(reader.recognizer, 'module') else reader.recognizer
+    detector.eval()
+    recognizer.eval()
+
+    detector_fp32 = os.path.join(model_dir, "craft_fp32.onnx")
+    recognizer_fp32 = os.path.join(model_dir, "recognizer_fp32.onnx")
+    with torch.no_grad():
+        torch.onnx.export(detector, torch.randn(1, 3, 320, 640), detector_fp32, opset_version=opset,
+                          input_names=['image'], output_names=['scores', 'features'],
+                          dynamic_axes={'image': {2: 'height', 3: 'width'},
+                                        'scores': {1: 'score_height', 2: 'score_width'}})
+        torch.onnx.export(_recognizer_for_export(recognizer), torch.randn(1, 1, 64, 256), recognizer_fp32,
+                          opset_version=opset, input_names=['image'], output_names=['logits'],
+                          dynamic_axes={'image': {0: 'batch', 3: 'width'}, 'logits': {0: 'batch', 1: 'steps'}})
+
+    quantize_dynamic(detector_fp32, os.path.join(model_dir, DETECTOR_FILE), weight_type=QuantType.QUInt8)
+    quantize_dynamic(recognizer_fp32, os.path.join(model_dir, RECOGNIZER_FILE), weight_type=QuantType.QInt8)
+
+    metadata = {
+        'characters': list(reader.converter.character),
+        'image_height': 64,
+        'canvas_size': 2560,
+        'mag_ratio': 1.0,
+        'text_threshold': 0.7,
+        'link_threshold': 0.4,
+        'low_text': 0.4,
+        'contrast_ths': 0.1,
+        'adjust_contrast': 0.5,
+        'easyocr_version': getattr(easyocr, '__version__', 'unknown')
+    }
+    with open(os.path.join(model_dir, METADATA_FILE), 'w', encoding='utf-8') as f:
+        json.dump(metadata, f, indent=2)
+
+    sizes = {name: os.path.getsize(os.path.join(model_dir, name)) / (1024 * 1024)
+             for name in (os.path.basename(detector_fp32), os.path.basename(recognizer_fp32),
+                          DETECTOR_FILE, RECOGNIZER_FILE)}
+    if not keep_fp32:
+        os.remove(detector_fp32)
+        os.remove(recognizer_fp32)
+    return sizes
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Int8 ONNX Runtime OCR for GPO banners")
+    sub = parser.add_subparsers(dest='command', required=True)
+    export = sub.add_parser('export', help="export and quantize EasyOCR's models (needs easyocr, torch, onnx)")
+    export.add_argument('--out', default=DEFAULT_MODEL_DIR)
+    export.add_argument('--keep-fp32', action='store_true', help="keep the unquantized models for comparison")
+    read = sub.add_parser('read', help="recognize text in an image")
+    read.add_argument('image')
+    read.add_argument('--models', default=DEFAULT_MODEL_DIR)
+    args = parser.parse_args(argv)
+
+    if args.command == 'export':
+        print("🔧 Exporting EasyOCR models to ONNX and quantizing to int8...")
+        sizes = export_models(args.out, args.keep_fp32)
+        for name, size in sizes.items():
+            print(f"📦 {name}: {size:.1f} MB")
+        print(f"✅ Models saved to {args.out} - run 'python src/ocr_benchmark.py --engines easy onnx' to compare")
+        return 0
+
+    image = cv2.imread(args.image, cv2.IMREAD_COLOR)
+    if image is None:
+        print(f"❌ Could not read {args.image}")
+        return 1
+    start = time.perf_counter()
+    ocr = OnnxOCR(args.models)
+    cold_start = time.perf_counter() - start
+    start = time.perf_counter()
+    results = ocr.readtext(cv2.cvtColor(image, cv2.COLOR_BGR2RGB))
+    elapsed = (time.perf_counter() - start) * 1000
+    for text, confidence in results:
+        print(f"📝 {text} ({confidence:.2f})")
+    print(f"⏱️ Loaded in {cold_start:.2f}s, recognized in {elapsed:.1f}ms")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -38,6 +38,11 @@ class OverlayManager:
         self.frame = None
         self.label = None
         self.point_indicators = []                                 
+        self.indicator_windows = {}
+        self.text_display = None
+        self._text_widget = None
+        self._shown_layout = None
+        self._applied_style = {}
         self.drag_data = {'x': 0, 'y': 0, 'resize_edge': None, 'start_width': 0, 
                          'start_height': 0, 'start_x': 0, 'start_y': 0}
     
@@ -77,19 +82,13 @@ class OverlayManager:
         self.label.place(relx=0.5, y=5, anchor='n')
         
                                                                       
-        self.text_display = None
-        current_layout = self.get_current_layout()
-        if current_layout == 'drop':
-                                                                                        
-            self.text_display = tk.Text(self.frame, height=4, width=30, 
-                                      bg=bg_color, fg='white', font=('Courier', 9),
-                                      wrap=tk.WORD, state=tk.DISABLED, bd=0, 
-                                      highlightthickness=0, relief='flat')
-                                                           
-            self.text_display.pack(pady=(30, 5), padx=5, fill=tk.BOTH, expand=True)
-        
-                                     
-        self.draw_click_points()
+        self._text_widget = tk.Text(self.frame, height=4, width=30, 
+                                    bg=bg_color, fg='white', font=('Courier', 9),
+                                    wrap=tk.WORD, state=tk.DISABLED, bd=0, 
+                                    highlightthickness=0, relief='flat')
+        self._shown_layout = None
+        self._applied_style = {'bg': bg_color, 'border': border_color, 'name': layout_config['name']}
+        self._show_layout(current_layout)
         
                      
         self.window.bind("<ButtonPress-1>", self._start_action)
@@ -106,75 +105,83 @@ class OverlayManager:
         self.label.bind("<B1-Motion>", self._motion)
         self.label.bind("<Motion>", self._update_cursor)
     
+    def get_click_points(self):
+        """Configured click points as {label: ((x, y), color)}"""
+        points_config = [
+            (getattr(self.app, 'fishing_location', None), '#FFD700', 'Cast Location'),          
+            (self.app.point_coords.get(1, None), '#9370DB', 'Auto-Purchase Point 1'),          
+            (self.app.point_coords.get(2, None), '#9370DB', 'Auto-Purchase Point 2'),          
+            (self.app.point_coords.get(3, None), '#9370DB', 'Auto-Purchase Point 3'),          
+            (self.app.fruit_coords.get('fruit_point', None), '#FF69B4', 'Fruit Storage Point'),        
+            (self.app.fruit_coords.get('fruit_point_2', None), '#FF69B4', 'Fruit Storage Point 2'),        
+            (self.app.fruit_coords.get('bait_point', None), '#00CED1', 'Bait Selection Point'),        
+        ]
+        return {label: ((coords[0], coords[1]), color) for coords, color, label in points_config if coords}
+    
     def draw_click_points(self):
-        """Draw visual indicators for all configured click points as separate topmost windows"""
+        """Sync the topmost click point indicator windows with the configured points
+        
+        Indicators are only created, moved or destroyed for points that changed, so
+        calling this on every layout switch or overlay drag is nearly free.
+        """
         if not self.window:
-            print("❌ draw_click_points: No window")
             return
         
-        print(f"\n🔍 Drawing click points as separate topmost windows")
+        points = self.get_click_points()
         
-                                   
-        for indicator in self.point_indicators:
+        for label in [label for label in self.indicator_windows if label not in points]:
+            window, _ = self.indicator_windows.pop(label)
             try:
-                indicator.destroy()
+                window.destroy()
             except:
                 pass
-        self.point_indicators = []
         
-        print(f"App point_coords: {self.app.point_coords}")
-        print(f"App fruit_coords: {self.app.fruit_coords}")
-        print(f"App fishing_location: {getattr(self.app, 'fishing_location', None)}")
+        changed = 0
+        for label, (coords, color) in points.items():
+            existing = self.indicator_windows.get(label)
+            if existing and existing[1] == (coords, color):
+                continue
+            point_x, point_y = coords
+            if existing and existing[1][1] == color:
+                existing[0].geometry(f"32x32+{point_x-16}+{point_y-16}")
+                self.indicator_windows[label] = (existing[0], (coords, color))
+            else:
+                if existing:
+                    try:
+                        existing[0].destroy()
+                    except:
+                        pass
+                self.indicator_windows[label] = (self._create_indicator(coords, color, label), (coords, color))
+            changed += 1
         
-                                                   
-        points_config = [
-                                    
-            (getattr(self.app, 'fishing_location', None), '#FFD700', 'Cast Location'),          
-            (self.app.point_coords.get(1, None), '#9370DB', 'Auto-Purchase Point 1'),          
-            (self.app.point_coords.get(2, None), '#9370DB', 'Auto-Purchase Point 2'),          
-            (self.app.point_coords.get(3, None), '#9370DB', 'Auto-Purchase Point 3'),          
-            (self.app.fruit_coords.get('fruit_point', None), '#FF69B4', 'Fruit Storage Point'),        
-            (self.app.fruit_coords.get('fruit_point_2', None), '#FF69B4', 'Fruit Storage Point 2'),        
-            (self.app.fruit_coords.get('bait_point', None), '#00CED1', 'Bait Selection Point'),        
-        ]
+        self.point_indicators = [window for window, _ in self.indicator_windows.values()]
+        if changed:
+            print(f"🔍 Updated {changed} click point indicator(s), {len(points)} shown")
+    
+    def _create_indicator(self, coords, color, label):
+        """Create one topmost indicator window centred on a screen point"""
+        point_x, point_y = coords
+        indicator_window = tk.Toplevel(self.app.root)
+        indicator_window.overrideredirect(True)
+        indicator_window.attributes('-topmost', True)
+        indicator_window.attributes('-alpha', 0.95)
+        indicator_window.attributes('-transparentcolor', 'black')
+        indicator_window.geometry(f"32x32+{point_x-16}+{point_y-16}")
         
-        for coords, color, label in points_config:
-            if coords:
-                                                 
-                point_x = coords[0]
-                point_y = coords[1]
-                
-                print(f"✅ Creating TOPMOST indicator window for {label} at screen ({point_x}, {point_y})")
-                
-                                                                     
-                indicator_window = tk.Toplevel(self.app.root)
-                indicator_window.overrideredirect(True)
-                indicator_window.attributes('-topmost', True)
-                indicator_window.attributes('-alpha', 0.95)
-                indicator_window.attributes('-transparentcolor', 'black')
-                
-                                                      
-                indicator_window.geometry(f"32x32+{point_x-16}+{point_y-16}")
-                
-                                              
-                container = tk.Frame(indicator_window, bg='black')
-                container.pack(fill='both', expand=True)
-                
-                                                   
-                indicator = tk.Label(container, text="●", 
-                                   fg=color, bg='black',
-                                   font=('Arial', 22, 'bold'),
-                                   relief='solid', bd=2,
-                                   borderwidth=2,
-                                   highlightbackground='white',
-                                   highlightthickness=2)
-                indicator.pack(expand=True, padx=2, pady=2)
-                
-                             
-                ToolTip(indicator, label)
-                
-                self.point_indicators.append(indicator_window)
-                print(f"✓ Drew {label} at ({point_x}, {point_y}) with color {color}")
+        container = tk.Frame(indicator_window, bg='black')
+        container.pack(fill='both', expand=True)
+        
+        indicator = tk.Label(container, text="●", 
+                           fg=color, bg='black',
+                           font=('Arial', 22, 'bold'),
+                           relief='solid', bd=2,
+                           borderwidth=2,
+                           highlightbackground='white',
+                           highlightthickness=2)
+        indicator.pack(expand=True, padx=2, pady=2)
+        
+        ToolTip(indicator, label)
+        return indicator_window
     
     def destroy(self):
         if self.window is not None:
@@ -189,17 +196,22 @@ class OverlayManager:
             self.app.layout_manager.set_layout_area(current_layout, area)
             
                               
-            for indicator in self.point_indicators:
+            for indicator, _ in self.indicator_windows.values():
                 try:
                     indicator.destroy()
                 except:
                     pass
+            self.indicator_windows = {}
             self.point_indicators = []
             
             self.window.destroy()
             self.window = None
             self.frame = None
             self.label = None
+            self.text_display = None
+            self._text_widget = None
+            self._shown_layout = None
+            self._applied_style = {}
     
     def _get_resize_edge(self, x, y):
         width = self.window.winfo_width()
@@ -320,46 +332,51 @@ class OverlayManager:
             return
         
         current_layout = self.get_current_layout()
-        layout_config = self.app.layout_manager.layouts[current_layout]
-        
-                       
-        bg_color = self._rgb_to_hex(layout_config['color'])
-        border_color = self._rgb_to_hex(layout_config['border_color'])
-        
-        if self.frame:
-            self.frame.config(bg=bg_color, highlightbackground=border_color)
+        if self._show_layout(current_layout):
+            print(f"🎯 Overlay updated for {self.app.layout_manager.layouts[current_layout]['name']}")
+    
+    def _show_layout(self, layout):
+        """
+        Switch the pre-built overlay widgets to a layout, touching only what differs
         
-        if self.label:
-            self.label.config(text=layout_config['name'], bg=bg_color)
-                                                             
-            self.label.place(relx=0.5, y=5, anchor='n')
+        Returns:
+            True if anything was reconfigured
+        """
+        layout_config = self.app.layout_manager.layouts[layout]
+        style = {
+            'bg': self._rgb_to_hex(layout_config['color']),
+            'border': self._rgb_to_hex(layout_config['border_color']),
+            'name': layout_config['name']
+        }
+        changed = {key: value for key, value in style.items() if self._applied_style.get(key) != value}
         
-                                                    
-        if current_layout == 'drop' and not self.text_display:
-                                                                                        
-            self.text_display = tk.Text(self.frame, height=4, width=30, 
-                                      bg=bg_color, fg='white', font=('Courier', 9),
-                                      wrap=tk.WORD, state=tk.DISABLED, bd=0, 
-                                      highlightthickness=0, relief='flat')
-                                                           
-            self.text_display.pack(pady=(30, 5), padx=5, fill=tk.BOTH, expand=True)
-        elif current_layout == 'bar' and self.text_display:
-            self.text_display.destroy()
-            self.text_display = None
+        if self.frame and ('bg' in changed or 'border' in changed):
+            self.frame.config(bg=style['bg'], highlightbackground=style['border'])
+        if self.label and ('bg' in changed or 'name' in changed):
+            self.label.config(text=style['name'], bg=style['bg'])
+        if self._text_widget and 'bg' in changed:
+            self._text_widget.config(bg=style['bg'])
+        self._applied_style = style
         
-                                                 
-        if self.text_display and current_layout == 'drop':
-            self.text_display.config(bg=bg_color, fg='white')
+                                                                          
+        switched = layout != self._shown_layout
+        if switched and self._text_widget:
+            if layout == 'drop':
+                self._text_widget.pack(pady=(30, 5), padx=5, fill=tk.BOTH, expand=True)
+                self.text_display = self._text_widget
+            else:
+                self._text_widget.pack_forget()
+                self.text_display = None
+        self._shown_layout = layout
         
-                                                
         current_area = self.get_current_area()
         geometry = f"{current_area['width']}x{current_area['height']}+{current_area['x']}+{current_area['y']}"
-        self.window.geometry(geometry)
+        moved = self.window.geometry() != geometry
+        if moved:
+            self.window.geometry(geometry)
         
-                             
         self.draw_click_points()
-        
-        print(f"🎯 Overlay updated for {layout_config['name']}")
+        return bool(changed) or switched or moved
     
     def display_captured_text(self, text):
         """Display captured OCR text in the overlay"""
@@ -0,0 +1,71 @@
+"""
+Profiling helpers shared by the benchmark and diagnostics tools
+Memory readings work on Windows without psutil and fall back to resource on POSIX
+"""
+
+import ctypes
+import sys
+from typing import List, Optional
+
+
+class _ProcessMemoryCounters(ctypes.Structure):
+    _fields_ = [
+        ('cb', ctypes.c_ulong),
+        ('PageFaultCount', ctypes.c_ulong),
+        ('PeakWorkingSetSize', ctypes.c_size_t),
+        ('WorkingSetSize', ctypes.c_size_t),
+        ('QuotaPeakPagedPoolUsage', ctypes.c_size_t),
+        ('QuotaPagedPoolUsage', ctypes.c_size_t),
+        ('QuotaPeakNonPagedPoolUsage', ctypes.c_size_t),
+        ('QuotaNonPagedPoolUsage', ctypes.c_size_t),
+        ('PagefileUsage', ctypes.c_size_t),
+        ('PeakPagefileUsage', ctypes.c_size_t),
+    ]
+
+
+def _windows_memory_counters() -> Optional[_ProcessMemoryCounters]:
+    try:
+        counters = _ProcessMemoryCounters()
+        counters.cb = ctypes.sizeof(_ProcessMemoryCounters)
+        handle = ctypes.windll.kernel32.GetCurrentProcess()
+        if ctypes.windll.kernel32.K32GetProcessMemoryInfo(handle, ctypes.byref(counters), counters.cb):
+            return counters
+    except Exception:
+        pass
+    return None
+
+
+def current_rss_mb() -> Optional[float]:
+    """Resident memory of this process in MB, or None if it cannot be read"""
+    if sys.platform == 'win32':
+        counters = _windows_memory_counters()
+        return counters.WorkingSetSize / (1024 * 1024) if counters else None
+    try:
+        with open('/proc/self/statm', 'r') as f:
+            pages = int(f.read().split()[1])
+        import os
+        return pages * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+    except Exception:
+        return peak_rss_mb()
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Peak resident memory of this process in MB, or None if it cannot be read"""
+    if sys.platform == 'win32':
+        counters = _windows_memory_counters()
+        return counters.PeakWorkingSetSize / (1024 * 1024) if counters else None
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+    except Exception:
+        return None
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of a list (0.0 for an empty list)"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100.0 * (len(ordered) - 1)))))
+    return ordered[index]
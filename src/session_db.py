@@ -0,0 +1,222 @@
+"""
+Session Database - persistent catch and session history in SQLite
+Every cast, catch, timeout, drop, fruit, purchase and recovery is recorded as an
+event row. Callers only enqueue; a writer thread inserts events in batches inside
+one transaction, and the database runs in WAL mode so the history window can read
+while the bot is writing.
+"""
+
+import os
+import queue
+import sqlite3
+import threading
+import time
+from typing import List, Optional
+
+DEFAULT_DB_FILE = "fishing_history.db"
+EVENT_KINDS = ('cast', 'catch', 'timeout', 'drop', 'fruit', 'purchase', 'recovery')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    id INTEGER PRIMARY KEY,
+    started REAL NOT NULL,
+    ended REAL
+);
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    session_id INTEGER NOT NULL,
+    ts REAL NOT NULL,
+    kind TEXT NOT NULL,
+    duration REAL,
+    detail TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_events_session ON events (session_id);
+CREATE INDEX IF NOT EXISTS idx_events_kind_ts ON events (kind, ts);
+"""
+
+
+def connect(path: str) -> sqlite3.Connection:
+    conn = sqlite3.connect(path, timeout=5.0)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.row_factory = sqlite3.Row
+    return conn
+
+
+class SessionDatabase:
+    """Queues history events and writes them in batches from a background thread"""
+
+    def __init__(self, path: str = DEFAULT_DB_FILE, batch_size: int = 200, flush_interval: float = 1.0):
+        """
+        Args:
+            path: SQLite database file
+            batch_size: Most events inserted per transaction
+            flush_interval: Longest an event waits in the queue before it is written
+        """
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.session_id: Optional[int] = None
+
+        self._queue = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.stats = {'queued': 0, 'written': 0, 'batches': 0, 'errors': 0, 'last_batch_ms': 0.0}
+
+        conn = connect(self.path)
+        try:
+            conn.executescript(SCHEMA)
+        finally:
+            conn.close()
+
+    def start_session(self) -> int:
+        """Begin a new session; events recorded afterwards belong to it"""
+        if self.session_id is not None:
+            self.end_session()
+        session_id = int(time.time() * 1000)
+        self.session_id = session_id
+        self._put(('session_start', session_id, session_id / 1000.0))
+        return session_id
+
+    def end_session(self):
+        if self.session_id is not None:
+            self._put(('session_end', self.session_id, time.time()))
+            self.session_id = None
+
+    def record(self, kind: str, duration: Optional[float] = None, detail: Optional[str] = None):
+        """Queue an event for the current session (never blocks on disk)"""
+        if self.session_id is None:
+            self.start_session()
+        self._put(('event', self.session_id, time.time(), kind, duration, detail))
+
+    def _put(self, item):
+        self._queue.put(item)
+        with self._lock:
+            self.stats['queued'] += 1
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="history-writer", daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        conn = connect(self.path)
+        try:
+            while True:
+                item = self._queue.get()
+                if item is None:
+                    return
+                batch = [item]
+                deadline = time.time() + self.flush_interval
+                stop = False
+                while len(batch) < self.batch_size:
+                    remaining = deadline - time.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        item = self._queue.get(timeout=remaining)
+                    except queue.Empty:
+                        break
+                    if item is None:
+                        stop = True
+                        break
+                    batch.append(item)
+                self._write_batch(conn, batch)
+                if stop:
+                    return
+        finally:
+            conn.close()
+
+    def _write_batch(self, conn: sqlite3.Connection, batch: list):
+        start = time.perf_counter()
+        events = [item[1:] for item in batch if item[0] == 'event']
+        try:
+            with conn:
+                for item in batch:
+                    if item[0] == 'session_start':
+                        conn.execute("INSERT OR IGNORE INTO sessions (id, started) VALUES (?, ?)", item[1:])
+                if events:
+                    conn.executemany("INSERT INTO events (session_id, ts, kind, duration, detail) "
+                                     "VALUES (?, ?, ?, ?, ?)", events)
+                for item in batch:
+                    if item[0] == 'session_end':
+                        conn.execute("UPDATE sessions SET ended = ? WHERE id = ?", (item[2], item[1]))
+            self.stats['written'] += len(batch)
+            self.stats['batches'] += 1
+            self.stats['last_batch_ms'] = (time.perf_counter() - start) * 1000
+        except sqlite3.Error as e:
+            self.stats['errors'] += 1
+            print(f"❌ History write failed ({len(batch)} events): {e}")
+
+    def close(self):
+        """End the session, write everything still queued and stop the writer"""
+        self.end_session()
+        with self._lock:
+            thread = self._thread
+        if thread is not None and thread.is_alive():
+            self._queue.put(None)
+            thread.join(timeout=5)
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def _reader(self) -> sqlite3.Connection:
+        """Per-thread read connection"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = connect(self.path)
+            self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def _filters(session_id: Optional[int], kind: Optional[str]):
+        clauses, params = [], []
+        if session_id is not None:
+            clauses.append("session_id = ?")
+            params.append(session_id)
+        if kind:
+            clauses.append("kind = ?")
+            params.append(kind)
+        return clauses, params
+
+    def fetch_events(self, session_id: Optional[int] = None, kind: Optional[str] = None,
+                     before_id: Optional[int] = None, limit: int = 50) -> List[sqlite3.Row]:
+        """
+        One page of events, newest first (keyset paging, so deep pages stay cheap)
+
+        Args:
+            before_id: Only return events older than this id (the last id of the previous page)
+        """
+        clauses, params = self._filters(session_id, kind)
+        if before_id is not None:
+            clauses.append("id < ?")
+            params.append(before_id)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        return self._reader().execute(
+            f"SELECT id, session_id, ts, kind, duration, detail FROM events {where} ORDER BY id DESC LIMIT ?",
+            params + [limit]).fetchall()
+
+    def count_events(self, session_id: Optional[int] = None, kind: Optional[str] = None) -> int:
+        clauses, params = self._filters(session_id, kind)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        return self._reader().execute(f"SELECT COUNT(*) FROM events {where}", params).fetchone()[0]
+
+    def hourly_counts(self, kind: str = 'catch', since: Optional[float] = None) -> List[tuple]:
+        """(hour start timestamp, count) for one event kind, oldest hour first"""
+        since = 0.0 if since is None else since
+        rows = self._reader().execute(
+            "SELECT CAST(ts / 3600 AS INTEGER) * 3600 AS hour, COUNT(*) FROM events "
+            "WHERE kind = ? AND ts >= ? GROUP BY hour ORDER BY hour", (kind, since)).fetchall()
+        return [(row[0], row[1]) for row in rows]
+
+    def list_sessions(self, limit: int = 20, offset: int = 0) -> List[sqlite3.Row]:
+        """Most recent sessions with their catch and fruit totals"""
+        return self._reader().execute(
+            "SELECT s.id, s.started, s.ended, "
+            "(SELECT COUNT(*) FROM events e WHERE e.session_id = s.id AND e.kind = 'catch') AS catches, "
+            "(SELECT COUNT(*) FROM events e WHERE e.session_id = s.id AND e.kind = 'fruit') AS fruits "
+            "FROM sessions s ORDER BY s.id DESC LIMIT ? OFFSET ?", (limit, offset)).fetchall()
+
+    def get_stats(self) -> dict:
+        return dict(self.stats, pending=self._queue.qsize(),
+                    size_kb=os.path.getsize(self.path) / 1024 if os.path.exists(self.path) else 0.0)
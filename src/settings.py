@@ -1,7 +1,11 @@
 import json
 import os
 import tkinter as tk
-from datetime import datetime
+
+try:
+    from src.settings_model import Settings
+except ImportError:
+    from settings_model import Settings
 
 class SettingsManager:
     def __init__(self, app):
@@ -11,100 +15,9 @@ class SettingsManager:
             os.makedirs(self.presets_dir)
     
     def auto_save(self):
-                                                                   
-        auto_purchase_enabled = False
-        if hasattr(self.app, 'auto_purchase_toggle_btn'):
-            auto_purchase_enabled = self.app.auto_purchase_toggle_btn.enabled
-        elif hasattr(self.app, 'auto_purchase_var'):
-            auto_purchase_enabled = self.app.auto_purchase_var.get()
-            
-                              
-        webhook_enabled = False
-        if hasattr(self.app, 'webhook_toggle_btn'):
-            webhook_enabled = self.app.webhook_toggle_btn.enabled
-        elif hasattr(self.app, 'webhook_enabled'):
-            webhook_enabled = self.app.webhook_enabled
-            
-                                    
-        fruit_storage_enabled = getattr(self.app, 'fruit_storage_enabled', True)
-        if hasattr(self.app, 'fruit_storage_toggle_btn'):
-            fruit_storage_enabled = self.app.fruit_storage_toggle_btn.enabled
-            
-                           
-        zoom_settings = {
-            'auto_zoom_enabled': getattr(self.app, 'auto_zoom_enabled', False),
-            'zoom_out_steps': getattr(self.app.zoom_out_var, 'get', lambda: 5)() if hasattr(self.app, 'zoom_out_var') else 5,
-            'zoom_in_steps': getattr(self.app.zoom_in_var, 'get', lambda: 8)() if hasattr(self.app, 'zoom_in_var') else 8,
-            'step_delay': getattr(self.app, 'step_delay', 0.1),
-            'sequence_delay': getattr(self.app, 'sequence_delay', 0.5),
-            'zoom_cooldown': getattr(self.app, 'zoom_cooldown', 2.0),
-            'auto_mouse_position_enabled': getattr(self.app.mouse_pos_var, 'get', lambda: False)() if hasattr(self.app, 'mouse_pos_var') else False
-        }
-        
-        if hasattr(self.app, 'auto_zoom_toggle_btn'):
-            zoom_settings['auto_zoom_enabled'] = self.app.auto_zoom_toggle_btn.enabled
-        
-        print(f"💾 Zoom settings to save: auto_zoom_enabled={zoom_settings['auto_zoom_enabled']}, auto_mouse_position_enabled={zoom_settings['auto_mouse_position_enabled']}")
-            
-                                                                
-        preset_data = {
-                                    
-            'auto_purchase_enabled': auto_purchase_enabled,
-            'auto_purchase_amount': getattr(self.app.amount_var, 'get', lambda: getattr(self.app, 'auto_purchase_amount', 100))() if hasattr(self.app, 'amount_var') else getattr(self.app, 'auto_purchase_amount', 100),
-            'loops_per_purchase': getattr(self.app.loops_var, 'get', lambda: getattr(self.app, 'loops_per_purchase', 1))() if hasattr(self.app, 'loops_var') else getattr(self.app, 'loops_per_purchase', 1),
-            
-                               
-            'point_coords': getattr(self.app, 'point_coords', {}),
-            'fruit_coords': getattr(self.app, 'fruit_coords', {}),
-            'fishing_location': getattr(self.app, 'fishing_location', None),
-            'top_bait_coords': getattr(self.app, 'top_bait_coords', None),
-            
-                                    
-            'fruit_storage_enabled': fruit_storage_enabled,
-            'fruit_storage_key': getattr(self.app, 'fruit_storage_key', '2'),
-            'rod_key': getattr(self.app, 'rod_key', '1'),
-            
-                                    
-            'kp': getattr(self.app.kp_var, 'get', lambda: getattr(self.app, 'kp', 0.1))() if hasattr(self.app, 'kp_var') else getattr(self.app, 'kp', 0.1),
-            'kd': getattr(self.app.kd_var, 'get', lambda: getattr(self.app, 'kd', 0.5))() if hasattr(self.app, 'kd_var') else getattr(self.app, 'kd', 0.5),
-            
-                              
-            'scan_timeout': getattr(self.app.scan_timeout_var, 'get', lambda: getattr(self.app, 'scan_timeout', 15.0))() if hasattr(self.app, 'scan_timeout_var') else getattr(self.app, 'scan_timeout', 15.0),
-            'wait_after_loss': getattr(self.app, 'wait_after_loss', 1.0),
-            'smart_check_interval': getattr(self.app, 'smart_check_interval', 15.0),
-            
-                              
-            'webhook_url': getattr(self.app.webhook_url_var, 'get', lambda: getattr(self.app, 'webhook_url', ''))() if hasattr(self.app, 'webhook_url_var') else getattr(self.app, 'webhook_url', ''),
-            'webhook_enabled': webhook_enabled,
-            'webhook_interval': getattr(self.app.webhook_interval_var, 'get', lambda: getattr(self.app, 'webhook_interval', 10))() if hasattr(self.app, 'webhook_interval_var') else getattr(self.app, 'webhook_interval', 10),
-            
-                                                   
-            'fish_progress_webhook_enabled': getattr(self.app, 'fish_progress_webhook_enabled', True),
-            'devil_fruit_webhook_enabled': getattr(self.app, 'devil_fruit_webhook_enabled', True),
-            'purchase_webhook_enabled': getattr(self.app, 'purchase_webhook_enabled', True),
-            'recovery_webhook_enabled': getattr(self.app, 'recovery_webhook_enabled', True),
-            
-                            
-            'dark_theme': getattr(self.app, 'dark_theme', True),
-            'current_theme': getattr(self.app, 'current_theme', 'default'),
-            
-                             
-            'layout_settings': getattr(self.app, 'layout_settings', {}),
-            
-                           
-            'zoom_settings': zoom_settings,
-            
-                            
-            'auto_update_enabled': getattr(self.app, 'auto_update_enabled', False),
-            'hotkeys': getattr(self.app, 'hotkeys', {}),
-            'last_saved': datetime.now().isoformat()
-        }
-        
-        settings_file = "default_settings.json"
+        """Persist settings through the app's settings model so there is only one field list"""
         try:
-            with open(settings_file, 'w') as f:
-                json.dump(preset_data, f, indent=2)
-            print(f"Settings auto-saved successfully (excluding webhook settings)")
+            self.app.auto_save_settings()
         except Exception as e:
             print(f'Error auto-saving settings: {e}')
     
@@ -115,7 +28,7 @@ class SettingsManager:
             
         try:
             with open(settings_file, 'r') as f:
-                preset_data = json.load(f)
+                preset_data = Settings.from_dict(json.load(f)).to_dict()
             
                                     
             self.app.auto_purchase_amount = preset_data.get('auto_purchase_amount', 100)
@@ -200,7 +113,7 @@ class SettingsManager:
             
         try:
             with open(settings_file, 'r') as f:
-                preset_data = json.load(f)
+                preset_data = Settings.from_dict(json.load(f)).to_dict()
             
                                    
             if hasattr(self.app, 'auto_purchase_toggle_btn'):
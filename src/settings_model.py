@@ -0,0 +1,243 @@
+"""
+Settings Model - single source of truth for persisted settings
+The GUI pushes its Tk values into SettingsModel; worker threads (fishing bot, zoom
+controller, webhooks) read an immutable Settings snapshot or subscribe to changes
+instead of calling Tk variables from outside the Tk thread.
+"""
+
+import copy
+import threading
+from dataclasses import dataclass, field, fields, replace
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+DEFAULT_ZOOM_SETTINGS = {
+    'auto_zoom_enabled': False,
+    'auto_mouse_position_enabled': False,
+    'zoom_out_steps': 5,
+    'zoom_in_steps': 8,
+    'step_delay': 0.1,
+    'sequence_delay': 0.5,
+    'zoom_cooldown': 2.0
+}
+
+
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """Immutable settings snapshot; field defaults are the application defaults"""
+
+    auto_purchase_enabled: bool = False
+    auto_purchase_amount: int = 100
+    loops_per_purchase: int = 1
+    purchase_interval: int = 0
+    purchase_delay_after_key: float = 2.0
+    purchase_click_delay: float = 1.0
+    purchase_after_type_delay: float = 1.0
+    point_coords: dict = field(default_factory=dict)
+
+    fruit_coords: dict = field(default_factory=dict)
+    fishing_location: Optional[list] = None
+    fruit_storage_enabled: bool = False
+    fruit_storage_key: str = '2'
+    fruit_storage_key_2: str = '3'
+    rod_key: str = '1'
+
+    auto_bait_enabled: bool = False
+    top_bait_coords: Optional[list] = None
+    top_bait_coords_2: Optional[list] = None
+
+    kp: float = 0.1
+    kd: float = 0.5
+    scan_timeout: float = 15.0
+    wait_after_loss: float = 1.0
+    smart_check_interval: float = 15.0
+    recovery_enabled: bool = True
+
+    webhook_url: str = ''
+    webhook_enabled: bool = False
+    webhook_interval: int = 10
+    fish_progress_webhook_enabled: bool = True
+    devil_fruit_webhook_enabled: bool = True
+    fruit_spawn_webhook_enabled: bool = True
+    purchase_webhook_enabled: bool = True
+    recovery_webhook_enabled: bool = True
+    bait_webhook_enabled: bool = True
+    webhook_digest_enabled: bool = False
+    webhook_digest_minutes: int = 5
+    webhook_attachments_enabled: bool = False
+    webhook_attachment_max_kb: int = 256
+    webhook_attachment_quality: int = 80
+
+    ocr_performance_mode: str = 'fast'
+    ocr_burst_frames: int = 3
+    ocr_burst_window: float = 0.4
+    ocr_vote_confidence: float = 0.6
+    ocr_pool_size: int = 0
+
+    silent_mode: bool = False
+    verbose_logging: bool = False
+
+    window_width: int = 420
+    window_height: int = 650
+    dark_theme: bool = True
+    current_theme: str = 'default'
+    layout_settings: dict = field(default_factory=dict)
+    zoom_settings: dict = field(default_factory=lambda: dict(DEFAULT_ZOOM_SETTINGS))
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'Settings':
+        """Build a snapshot from saved JSON, filling defaults and coercing types; unknown keys are ignored"""
+        defaults = cls()
+        values = {}
+        for f in SETTINGS_FIELDS:
+            if f.name in data:
+                values[f.name] = _coerce(data[f.name], getattr(defaults, f.name))
+        if isinstance(values.get('zoom_settings'), dict):
+            values['zoom_settings'] = {**DEFAULT_ZOOM_SETTINGS, **values['zoom_settings']}
+        return replace(defaults, **values)
+
+    def to_dict(self) -> dict:
+        """JSON-ready copy of every field plus a last_saved timestamp"""
+        data = {f.name: copy.deepcopy(getattr(self, f.name)) for f in SETTINGS_FIELDS}
+        data['last_saved'] = datetime.now().isoformat()
+        return data
+
+
+SETTINGS_FIELDS = fields(Settings)
+SETTINGS_KEYS = frozenset(f.name for f in SETTINGS_FIELDS)
+
+PRESET_FIELDS = (
+    'auto_purchase_enabled', 'auto_purchase_amount', 'loops_per_purchase', 'point_coords',
+    'kp', 'kd', 'scan_timeout', 'wait_after_loss',
+    'purchase_delay_after_key', 'purchase_click_delay', 'purchase_after_type_delay',
+    'auto_bait_enabled', 'recovery_enabled', 'silent_mode', 'verbose_logging', 'dark_theme'
+)
+
+
+def _coerce(value, default):
+    """Convert a loaded value to the type of its default, keeping the default if it can't be converted"""
+    if default is None or value is None:
+        return value
+    try:
+        if isinstance(default, bool):
+            return value if isinstance(value, bool) else str(value).lower() in ('1', 'true', 'yes', 'on')
+        if isinstance(default, (int, float, str)):
+            return type(default)(value)
+        if isinstance(default, dict):
+            return dict(value)
+    except (TypeError, ValueError):
+        return default
+    return value
+
+
+def diff_settings(old: Settings, new: Settings) -> Dict[str, Tuple[object, object]]:
+    """Fields whose values differ, as {name: (old, new)}"""
+    changes = {}
+    for f in SETTINGS_FIELDS:
+        before, after = getattr(old, f.name), getattr(new, f.name)
+        if before != after:
+            changes[f.name] = (before, after)
+    return changes
+
+
+class SettingsModel:
+    """Holds the current Settings snapshot, tracks dirty fields and notifies subscribers"""
+
+    def __init__(self, settings: Optional[Settings] = None):
+        self._settings = settings or Settings()
+        self._lock = threading.Lock()
+        self._dirty = set()
+        self._subscribers: List[Tuple[Callable, Optional[frozenset]]] = []
+        self.stats = {'updates': 0, 'changes': 0, 'notifications': 0}
+
+    def snapshot(self) -> Settings:
+        """Current immutable snapshot (cheap: no copy is made)"""
+        return self._settings
+
+    def get(self, name: str, default=None):
+        return getattr(self._settings, name, default)
+
+    def load(self, data: dict) -> dict:
+        """
+        Replace the settings with saved data without marking anything dirty
+
+        Returns:
+            The normalized settings dict (every key present, defaults filled in)
+        """
+        return self._apply(Settings.from_dict(data), mark_dirty=False)[1].to_dict()
+
+    def update(self, values: Optional[dict] = None, **changes) -> Dict[str, Tuple[object, object]]:
+        """
+        Apply a partial update
+
+        Args:
+            values: Dict of field values (unknown keys are ignored)
+            **changes: Field values as keyword arguments
+
+        Returns:
+            {name: (old, new)} for the fields that actually changed
+        """
+        merged = {key: value for key, value in {**(values or {}), **changes}.items() if key in SETTINGS_KEYS}
+        self.stats['updates'] += 1
+        if not merged:
+            return {}
+        with self._lock:
+            current = self._settings
+            candidate = Settings.from_dict({**{f.name: getattr(current, f.name) for f in SETTINGS_FIELDS}, **merged})
+        return self._apply(candidate, mark_dirty=True)[0]
+
+    def _apply(self, new: Settings, mark_dirty: bool):
+        with self._lock:
+            changes = diff_settings(self._settings, new)
+            if not changes:
+                return {}, self._settings
+            self._settings = new
+            if mark_dirty:
+                self._dirty.update(changes)
+            subscribers = list(self._subscribers)
+            self.stats['changes'] += len(changes)
+
+        for callback, wanted in subscribers:
+            if wanted is not None and wanted.isdisjoint(changes):
+                continue
+            try:
+                self.stats['notifications'] += 1
+                callback(changes, new)
+            except Exception as e:
+                print(f"⚠️ Settings subscriber error: {e}")
+        return changes, new
+
+    def subscribe(self, callback: Callable[[dict, Settings], None], fields: Optional[Iterable[str]] = None) -> Callable[[], None]:
+        """
+        Call callback(changes, snapshot) after every update that changes one of fields (all fields if None)
+        Callbacks run on the thread that made the update and must not block.
+
+        Returns:
+            Function that removes the subscription
+        """
+        entry = (callback, frozenset(fields) if fields is not None else None)
+        with self._lock:
+            self._subscribers.append(entry)
+
+        def unsubscribe():
+            with self._lock:
+                if entry in self._subscribers:
+                    self._subscribers.remove(entry)
+        return unsubscribe
+
+    def is_dirty(self) -> bool:
+        with self._lock:
+            return bool(self._dirty)
+
+    def take_dirty(self) -> set:
+        """Return and clear the fields changed since the last call"""
+        with self._lock:
+            dirty, self._dirty = self._dirty, set()
+        return dirty
+
+    def to_dict(self, keys: Optional[Iterable[str]] = None) -> dict:
+        """Settings as a JSON-ready dict, optionally limited to keys"""
+        data = self._settings.to_dict()
+        if keys is not None:
+            data = {key: data[key] for key in keys if key in data}
+        return data
@@ -0,0 +1,143 @@
+"""
+Settings Store for debounced, atomic settings persistence
+Callers hand over a snapshot dict on every change; a worker thread waits for the
+changes to settle, serializes the latest snapshot and replaces the settings file
+atomically. Writes are skipped when the content has not changed.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Optional
+
+DEFAULT_SETTINGS_FILE = "default_settings.json"
+VOLATILE_KEYS = ('last_saved',)
+
+
+def settings_hash(data: dict) -> str:
+    """Hash of the settings content, ignoring volatile keys such as the save timestamp"""
+    stable = {key: value for key, value in data.items() if key not in VOLATILE_KEYS}
+    encoded = json.dumps(stable, sort_keys=True, default=str).encode('utf-8')
+    return hashlib.sha1(encoded).hexdigest()
+
+
+def write_json_atomic(path: str, data: dict):
+    """Write JSON to a temp file next to path, then swap it in with os.replace"""
+    temp_path = f"{path}.tmp"
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, path)
+
+
+class SettingsStore:
+    """Coalesces settings saves and writes them from a background thread"""
+
+    def __init__(self, path: str = DEFAULT_SETTINGS_FILE, debounce: float = 0.5, max_delay: float = 5.0):
+        """
+        Args:
+            path: Settings file to write
+            debounce: Seconds without changes before a snapshot is written
+            max_delay: Upper bound on how long a stream of changes can postpone a write
+        """
+        self.path = path
+        self.debounce = debounce
+        self.max_delay = max_delay
+
+        self._condition = threading.Condition()
+        self._write_lock = threading.Lock()
+        self._pending = None
+        self._sequence = 0
+        self._written_sequence = 0
+        self._first_change = 0.0
+        self._last_change = 0.0
+        self._thread = None
+        self._running = False
+        self._last_hash = self._hash_file()
+
+        self.stats = {'requests': 0, 'writes': 0, 'unchanged': 0, 'errors': 0, 'last_write_ms': 0.0}
+
+    def _hash_file(self) -> Optional[str]:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return settings_hash(json.load(f))
+        except (OSError, ValueError):
+            return None
+
+    def save(self, data: dict):
+        """Queue a settings snapshot; only the latest snapshot in a debounce window is written"""
+        now = time.time()
+        with self._condition:
+            self.stats['requests'] += 1
+            if self._pending is None:
+                self._first_change = now
+            self._sequence += 1
+            self._pending = (self._sequence, data)
+            self._last_change = now
+            self._condition.notify()
+            if not self._running:
+                self._running = True
+                self._thread = threading.Thread(target=self._run, name="settings-writer", daemon=True)
+                self._thread.start()
+
+    def flush(self):
+        """Write any pending snapshot now (used on exit)"""
+        with self._condition:
+            pending, self._pending = self._pending, None
+        if pending is not None:
+            self._write(*pending)
+
+    def close(self):
+        """Flush and stop the writer thread"""
+        with self._condition:
+            self._running = False
+            self._condition.notify_all()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=2)
+        self.flush()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while self._running:
+                    if self._pending is not None:
+                        now = time.time()
+                        due = min(self._last_change + self.debounce, self._first_change + self.max_delay)
+                        if now >= due:
+                            break
+                        self._condition.wait(timeout=due - now)
+                    else:
+                        self._condition.wait()
+                if not self._running:
+                    return
+                pending, self._pending = self._pending, None
+            self._write(*pending)
+
+    def _write(self, sequence: int, data: dict):
+        with self._write_lock:
+            if sequence <= self._written_sequence:
+                return
+            self._written_sequence = sequence
+            start = time.perf_counter()
+            try:
+                content_hash = settings_hash(data)
+                if content_hash == self._last_hash:
+                    self.stats['unchanged'] += 1
+                    return
+                write_json_atomic(self.path, data)
+                self._last_hash = content_hash
+                self.stats['writes'] += 1
+                self.stats['last_write_ms'] = (time.perf_counter() - start) * 1000
+                print(f"💾 Settings saved to {self.path} ({self.stats['last_write_ms']:.1f}ms)")
+            except Exception as e:
+                self.stats['errors'] += 1
+                print(f"❌ ERROR saving settings: {e}")
+
+    def get_stats(self) -> dict:
+        """Save requests versus actual writes"""
+        with self._condition:
+            pending = self._pending is not None
+        return dict(self.stats, pending=pending)
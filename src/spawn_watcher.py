@@ -0,0 +1,142 @@
+"""
+Spawn Watcher for change-driven devil fruit spawn checks
+Keeps a tiny downscaled signature of the drop area and only asks for OCR when the
+region has changed meaningfully and settled, instead of OCRing on a fixed timer
+"""
+
+import time
+from typing import Optional
+
+import numpy as np
+
+FIXED_POLL_INTERVAL = 4.0
+
+
+def region_signature(frame, rows: int = 8, cols: int = 32) -> Optional[np.ndarray]:
+    """
+    Block-averaged grayscale thumbnail of a frame
+
+    Args:
+        frame: BGRA/BGR/gray numpy array
+        rows: Signature height
+        cols: Signature width
+
+    Returns:
+        float32 array of shape (rows, cols), or None if the frame is empty
+    """
+    if frame is None or frame.size == 0:
+        return None
+    gray = frame[..., :3].mean(axis=2, dtype=np.float32) if frame.ndim == 3 else frame.astype(np.float32)
+    rows = min(rows, gray.shape[0])
+    cols = min(cols, gray.shape[1])
+    height = gray.shape[0] - gray.shape[0] % rows
+    width = gray.shape[1] - gray.shape[1] % cols
+    return gray[:height, :width].reshape(rows, height // rows, cols, width // cols).mean(axis=(1, 3))
+
+
+def signature_distance(a: Optional[np.ndarray], b: Optional[np.ndarray]) -> float:
+    """Mean absolute difference between two signatures (0-255 scale, inf if not comparable)"""
+    if a is None or b is None or a.shape != b.shape:
+        return float('inf')
+    return float(np.abs(a - b).mean())
+
+
+class SpawnWatcher:
+    """Decides when the drop area is worth OCRing for a spawn banner"""
+
+    def __init__(self, sample_interval: float = 0.25, change_threshold: float = 6.0,
+                 settle_threshold: float = 2.0, min_interval: float = 1.5,
+                 max_settle_time: float = 1.0, max_interval: float = 60.0):
+        """
+        Args:
+            sample_interval: Seconds between signature samples
+            change_threshold: Distance from the last OCR'd signature that counts as a change
+            settle_threshold: Frame-to-frame distance below which the banner is considered fully drawn
+            min_interval: Minimum seconds between OCR requests
+            max_settle_time: OCR a changed region after this long even if it keeps moving
+            max_interval: Safety re-check when nothing has changed for this long (0 disables)
+        """
+        self.sample_interval = sample_interval
+        self.change_threshold = change_threshold
+        self.settle_threshold = settle_threshold
+        self.min_interval = min_interval
+        self.max_settle_time = max_settle_time
+        self.max_interval = max_interval
+        self.reset()
+
+    def reset(self):
+        """Forget the reference signature and statistics"""
+        self.reference = None
+        self.previous = None
+        self.change_started = None
+        self.last_sample_time = 0.0
+        self.last_ocr_time = 0.0
+        self.watch_started = None
+        self.watched_seconds = 0.0
+        self.stats = {'samples': 0, 'changes': 0, 'ocr_requests': 0, 'safety_checks': 0}
+
+    def due(self, now: Optional[float] = None) -> bool:
+        """Whether it is time to take another sample"""
+        now = time.time() if now is None else now
+        return now - self.last_sample_time >= self.sample_interval
+
+    def observe(self, frame, now: Optional[float] = None) -> bool:
+        """
+        Feed a drop area frame
+
+        Args:
+            frame: numpy array of the drop area
+            now: Optional timestamp (defaults to time.time())
+
+        Returns:
+            True if this frame should be OCR'd now
+        """
+        now = time.time() if now is None else now
+        if self.watch_started is not None:
+            self.watched_seconds += min(now - self.last_sample_time, self.sample_interval * 4)
+        self.watch_started = self.watch_started or now
+        self.last_sample_time = now
+
+        signature = region_signature(frame)
+        if signature is None:
+            return False
+        self.stats['samples'] += 1
+
+        previous, self.previous = self.previous, signature
+        if self.reference is None:
+            return self._request(signature, now)
+
+        if self.change_started is None:
+            if signature_distance(signature, self.reference) < self.change_threshold:
+                if self.max_interval and now - self.last_ocr_time >= self.max_interval:
+                    self.stats['safety_checks'] += 1
+                    return self._request(signature, now)
+                return False
+            self.change_started = now
+            self.stats['changes'] += 1
+
+        settled = signature_distance(signature, previous) < self.settle_threshold
+        waited_enough = now - self.change_started >= self.max_settle_time
+        if (settled or waited_enough) and now - self.last_ocr_time >= self.min_interval:
+            return self._request(signature, now)
+        return False
+
+    def _request(self, signature: np.ndarray, now: float) -> bool:
+        self.reference = signature
+        self.change_started = None
+        self.last_ocr_time = now
+        self.stats['ocr_requests'] += 1
+        return True
+
+    def get_stats(self) -> dict:
+        """OCR request rate compared with the old fixed-interval poll"""
+        hours = self.watched_seconds / 3600.0
+        fixed_polls = self.watched_seconds / FIXED_POLL_INTERVAL
+        requests = self.stats['ocr_requests']
+        return {
+            **self.stats,
+            "watched_seconds": self.watched_seconds,
+            "ocr_per_hour": requests / hours if hours else 0.0,
+            "fixed_poll_per_hour": 3600.0 / FIXED_POLL_INTERVAL,
+            "reduction": 1.0 - requests / fixed_polls if fixed_polls >= 1 else 0.0
+        }
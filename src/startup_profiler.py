@@ -0,0 +1,170 @@
+"""
+Startup Profiler for measuring GUI time-to-interactive
+Disabled by default; enable with the GPO_PROFILE_STARTUP=1 environment variable or
+the --profile-startup command line flag. When enabled, each timed section of
+startup (component imports, construction, widget building) and every module
+import (-X importtime style) is logged, and a summary with RSS is printed once
+Tk goes idle after the first paint.
+
+Cold-start benchmark (launches fresh processes that exit after first paint):
+    python src/startup_profiler.py [--runs 5]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+from typing import List, Optional, Tuple
+
+try:
+    from src.lazy_import import LOAD_TIMES, ImportProfiler
+    from src.profiling import current_rss_mb, percentile
+except ImportError:
+    from lazy_import import LOAD_TIMES, ImportProfiler
+    from profiling import current_rss_mb, percentile
+
+PROFILE_ENV_VAR = "GPO_PROFILE_STARTUP"
+PROFILE_FLAG = "--profile-startup"
+EXIT_FLAG = "--exit-after-paint"
+RESULT_PREFIX = "STARTUP_RESULT "
+
+
+def profiling_requested() -> bool:
+    return os.environ.get(PROFILE_ENV_VAR, '') not in ('', '0') or PROFILE_FLAG in sys.argv
+
+
+class StartupProfiler:
+    """Records nested section timings relative to a common origin"""
+
+    def __init__(self, enabled: Optional[bool] = None, origin: Optional[float] = None):
+        """
+        Args:
+            enabled: Force profiling on/off (None checks the env var and command line)
+            origin: perf_counter() value treated as t=0 (defaults to now)
+        """
+        self.enabled = profiling_requested() if enabled is None else enabled
+        self.exit_after_paint = self.enabled and EXIT_FLAG in sys.argv
+        self.origin = time.perf_counter() if origin is None else origin
+        self.records: List[Tuple[str, float, float, int]] = []
+        self.marks: List[Tuple[str, float, Optional[float]]] = []
+        self._depth = 0
+        self._reported = False
+        self.imports = ImportProfiler().install() if self.enabled else None
+
+    def elapsed_ms(self) -> float:
+        return (time.perf_counter() - self.origin) * 1000
+
+    @contextmanager
+    def section(self, name: str):
+        """Time a block of startup work (no-op when disabled)"""
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        depth = self._depth
+        self._depth += 1
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            self.records.append((name, (start - self.origin) * 1000, (time.perf_counter() - start) * 1000, depth))
+
+    def mark(self, name: str):
+        """Record a point in time such as first paint, with the process RSS at that moment"""
+        if self.enabled:
+            self.marks.append((name, self.elapsed_ms(), current_rss_mb()))
+
+    def report(self):
+        """Print every section in start order, the slowest imports and the recorded marks"""
+        if not self.enabled or self._reported:
+            return
+        self._reported = True
+        if self.imports is not None:
+            self.imports.uninstall()
+
+        print(f"\n⏱️ Startup profile ({len(self.records)} sections)")
+        for name, started, duration, depth in sorted(self.records, key=lambda r: r[1]):
+            print(f"   {started:8.1f}ms  {'  ' * depth}{name}: {duration:.1f}ms")
+        if self.imports is not None:
+            for line in self.imports.format_report():
+                print(line)
+        if LOAD_TIMES:
+            deferred = ", ".join(f"{name} {ms:.0f}ms" for name, ms in LOAD_TIMES.items())
+            print(f"💤 Deferred imports loaded before first paint: {deferred}")
+        for name, at, rss in self.marks:
+            rss_text = f", RSS {rss:.1f} MB" if rss is not None else ""
+            print(f"   ⏱️ {name}: {at:.1f}ms{rss_text}")
+
+        paint = self.marks[-1] if self.marks else (None, self.elapsed_ms(), current_rss_mb())
+        print(RESULT_PREFIX + json.dumps({
+            'interactive_ms': paint[1],
+            'rss_mb': paint[2],
+            'paint_time': time.time(),
+            'imports': len(self.imports.records) if self.imports is not None else 0,
+            'deferred_loaded': sorted(LOAD_TIMES)
+        }))
+
+
+def run_cold_start(main_script: str, timeout: float = 120.0) -> Optional[dict]:
+    """
+    Launch the app in a fresh interpreter and wait for it to exit after first paint
+
+    Returns:
+        Parsed result dict plus cold_start_ms (process launch to first paint), or None on failure
+    """
+    env = dict(os.environ, PYTHONIOENCODING='utf-8', PYTHONDONTWRITEBYTECODE='1')
+    env.pop(PROFILE_ENV_VAR, None)
+    launched = time.time()
+    try:
+        completed = subprocess.run([sys.executable, main_script, PROFILE_FLAG, EXIT_FLAG],
+                                   capture_output=True, text=True, encoding='utf-8', errors='replace',
+                                   timeout=timeout, env=env)
+    except subprocess.TimeoutExpired:
+        print(f"❌ Startup did not finish within {timeout:.0f}s")
+        return None
+
+    for line in completed.stdout.splitlines():
+        if line.startswith(RESULT_PREFIX):
+            result = json.loads(line[len(RESULT_PREFIX):])
+            result['cold_start_ms'] = (result['paint_time'] - launched) * 1000
+            return result
+    tail = (completed.stderr or completed.stdout).strip().splitlines()[-5:]
+    print(f"❌ No startup result (exit code {completed.returncode})")
+    for line in tail:
+        print(f"   {line}")
+    return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure cold-start time and RSS at first paint")
+    parser.add_argument('--runs', type=int, default=5, help="number of fresh launches")
+    parser.add_argument('--main', default=os.path.join(os.path.dirname(os.path.abspath(__file__)), 'main.py'),
+                        help="entry script to launch")
+    args = parser.parse_args(argv)
+
+    results = []
+    for run in range(1, args.runs + 1):
+        result = run_cold_start(args.main)
+        if result is None:
+            return 1
+        results.append(result)
+        rss = f"{result['rss_mb']:.1f} MB" if result['rss_mb'] is not None else "n/a"
+        print(f"   Run {run}: cold start {result['cold_start_ms']:.0f}ms, "
+              f"in-process {result['interactive_ms']:.0f}ms, RSS {rss}, {result['imports']} imports")
+
+    cold = [r['cold_start_ms'] for r in results]
+    rss_values = [r['rss_mb'] for r in results if r['rss_mb'] is not None]
+    print(f"📊 Cold start to first paint: p50 {percentile(cold, 50):.0f}ms, max {max(cold):.0f}ms "
+          f"over {len(results)} runs")
+    if rss_values:
+        print(f"   RSS at first paint: p50 {percentile(rss_values, 50):.1f} MB")
+    deferred = sorted({name for r in results for name in r['deferred_loaded']})
+    print(f"   Deferred modules loaded before paint: {', '.join(deferred) if deferred else 'none'}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
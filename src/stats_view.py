@@ -0,0 +1,78 @@
+"""
+Stats View - view-model for the Overview stat cards
+StatsViewModel turns session state into label texts; StatsView remembers what
+each label currently shows and only reconfigures labels whose text changed, so
+the once-a-second refresh tick costs no redraws while nothing happens.
+"""
+
+import time
+from typing import Dict, Optional
+
+
+def format_duration(seconds: float) -> str:
+    seconds = max(0, int(seconds))
+    return f'{seconds // 3600:02d}:{(seconds % 3600) // 60:02d}:{seconds % 60:02d}'
+
+
+class StatsViewModel:
+    """Computes the stat label texts from the app's session counters"""
+
+    def __init__(self, app):
+        self.app = app
+
+    def session_seconds(self, now: Optional[float] = None) -> float:
+        app = self.app
+        if not app.start_time:
+            return 0.0
+        end = app.pause_time if app.is_paused and app.pause_time else (now or time.time())
+        return (end - app.start_time) - app.total_paused_time
+
+    def texts(self, now: Optional[float] = None) -> Dict[str, str]:
+        app = self.app
+        session = format_duration(self.session_seconds(now))
+        return {
+            'fish': f'Total Fish Caught\n{app.fish_count}',
+            'fruits': f'Devil Fruits Found\n{len(getattr(app, "devil_fruits_caught", []))}',
+            'session': f'Session Time\n{session}',
+            'bait': f'Bait Purchased\n{getattr(app, "bait_purchased", 0)}'
+        }
+
+
+class StatsView:
+    """Applies view-model texts to bound labels, skipping labels whose text is unchanged"""
+
+    def __init__(self):
+        self._labels: Dict[str, object] = {}
+        self._shown: Dict[str, str] = {}
+        self.stats = {'refreshes': 0, 'label_updates': 0, 'skipped': 0}
+
+    def bind(self, key: str, label, initial: Optional[str] = None):
+        """Attach a label; initial is the text it was created with"""
+        self._labels[key] = label
+        if initial is None:
+            self._shown.pop(key, None)
+        else:
+            self._shown[key] = initial
+
+    def render(self, texts: Dict[str, str]) -> int:
+        """
+        Update bound labels whose text changed (Tk thread only)
+
+        Returns:
+            Number of labels reconfigured
+        """
+        self.stats['refreshes'] += 1
+        updated = 0
+        for key, label in self._labels.items():
+            text = texts.get(key)
+            if text is None or self._shown.get(key) == text:
+                self.stats['skipped'] += 1
+                continue
+            try:
+                label.config(text=text)
+            except Exception:
+                continue
+            self._shown[key] = text
+            updated += 1
+        self.stats['label_updates'] += updated
+        return updated
@@ -0,0 +1,304 @@
+"""
+Telemetry - per-cast and per-OCR records in an append-only columnar format
+Each record type has a fixed schema. Records are buffered in memory and written
+as chunk files (<session>_<type>_<chunk>.parquet via pyarrow when installed,
+otherwise .npz) by a background thread, so the fishing loop never waits on disk.
+
+Summarize a directory of session files:
+    python src/telemetry.py summarize [telemetry] [--days 7]
+"""
+
+import argparse
+import datetime
+import glob
+import os
+import queue
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from typing import Dict, List, Optional
+
+try:
+    from src.lazy_import import lazy_module, module_available
+    from src.profiling import percentile
+except ImportError:
+    from lazy_import import lazy_module, module_available
+    from profiling import percentile
+
+DEFAULT_TELEMETRY_DIR = "telemetry"
+
+
+SCHEMAS = {
+    'cast': (
+        ('ts', 'f8'), ('session_id', 'i8'), ('outcome', 'U'),
+        ('cast_to_bite_s', 'f4'), ('control_s', 'f4'), ('detect_ratio', 'f4'),
+        ('pd_steps', 'i4'), ('pd_mean_abs_error', 'f4'), ('pd_max_abs_error', 'f4'),
+        ('pd_mean_output', 'f4'), ('kp', 'f4'), ('kd', 'f4'),
+    ),
+    'ocr': (
+        ('ts', 'f8'), ('session_id', 'i8'), ('engine', 'U'), ('latency_ms', 'f4'),
+        ('chars', 'i4'), ('confidence', 'f4'),
+    ),
+}
+OUTCOMES = ('catch', 'no_bite', 'fish_control', 'no_bar')
+
+_DEFAULTS = {'f': float('nan'), 'i': 0, 'U': ''}
+_ARROW_TYPES = {'f8': 'float64', 'f4': 'float32', 'i8': 'int64', 'i4': 'int32', 'U': 'string'}
+
+
+def available_format() -> Optional[str]:
+    """'parquet' with pyarrow, 'npz' with numpy, otherwise None (telemetry disabled)"""
+    if module_available('pyarrow'):
+        return 'parquet'
+    if module_available('numpy'):
+        return 'npz'
+    return None
+
+
+def write_chunk(path: str, kind: str, columns: Dict[str, list], fmt: str):
+    """Write one chunk of columns atomically (temp file + os.replace)"""
+    schema = SCHEMAS[kind]
+    temp_path = f"{path}.tmp"
+    if fmt == 'parquet':
+        pa = lazy_module('pyarrow')
+        pq = lazy_module('pyarrow.parquet')
+        table = pa.table({name: pa.array(columns[name], type=getattr(pa, _ARROW_TYPES[dtype])())
+                          for name, dtype in schema})
+        pq.write_table(table, temp_path, compression='zstd')
+    else:
+        np = lazy_module('numpy')
+        with open(temp_path, 'wb') as f:
+            np.savez_compressed(f, **{name: np.asarray(columns[name], dtype=dtype if dtype != 'U' else str)
+                                      for name, dtype in schema})
+    os.replace(temp_path, path)
+
+
+def read_chunk(path: str, columns: Optional[List[str]] = None) -> Dict[str, list]:
+    """Read the requested columns of a chunk file as lists"""
+    if path.endswith('.parquet'):
+        pq = lazy_module('pyarrow.parquet')
+        return pq.read_table(path, columns=columns).to_pydict()
+    np = lazy_module('numpy')
+    with np.load(path) as data:
+        names = columns or list(data.files)
+        return {name: data[name].tolist() for name in names if name in data.files}
+
+
+def chunk_kind(path: str) -> Optional[str]:
+    """Record type from a <session>_<type>_<chunk>.<ext> file name"""
+    parts = os.path.basename(path).split('.')[0].split('_')
+    return parts[1] if len(parts) == 3 and parts[1] in SCHEMAS else None
+
+
+class CastTracker:
+    """Accumulates timings and PD statistics for one cast"""
+
+    def __init__(self, cast_time: Optional[float] = None):
+        self.cast_time = cast_time or time.time()
+        self.bite_time = None
+        self.bar_frames = 0
+        self.pd_steps = 0
+        self.abs_error_sum = 0.0
+        self.max_abs_error = 0.0
+        self.output_sum = 0.0
+
+    def bar_frame(self, now: Optional[float] = None):
+        """The fishing bar was visible in a frame (the first one is the bite)"""
+        if self.bite_time is None:
+            self.bite_time = now or time.time()
+        self.bar_frames += 1
+
+    def pd_step(self, error: float, output: float):
+        self.pd_steps += 1
+        self.abs_error_sum += abs(error)
+        self.max_abs_error = max(self.max_abs_error, abs(error))
+        self.output_sum += output
+
+    def to_record(self, outcome: str, kp: float, kd: float, now: Optional[float] = None) -> dict:
+        now = now or time.time()
+        steps = self.pd_steps
+        return {
+            'ts': self.cast_time,
+            'outcome': outcome,
+            'cast_to_bite_s': self.bite_time - self.cast_time if self.bite_time else float('nan'),
+            'control_s': now - self.bite_time if self.bite_time else float('nan'),
+            'detect_ratio': min(1.0, steps / self.bar_frames) if self.bar_frames else float('nan'),
+            'pd_steps': steps,
+            'pd_mean_abs_error': self.abs_error_sum / steps if steps else float('nan'),
+            'pd_max_abs_error': self.max_abs_error if steps else float('nan'),
+            'pd_mean_output': self.output_sum / steps if steps else float('nan'),
+            'kp': kp,
+            'kd': kd
+        }
+
+
+class TelemetryWriter:
+    """Buffers telemetry records per type and writes full chunks from a background thread"""
+
+    def __init__(self, directory: str = DEFAULT_TELEMETRY_DIR, chunk_rows: int = 256, fmt: Optional[str] = None):
+        """
+        Args:
+            directory: Where chunk files are written
+            chunk_rows: Records per chunk file (partial chunks are written on session end)
+            fmt: 'parquet' or 'npz' (None picks the best available)
+        """
+        self.directory = directory
+        self.chunk_rows = chunk_rows
+        self.format = fmt or available_format()
+        self.enabled = self.format is not None
+        self.session_id = int(time.time() * 1000)
+
+        self._buffers: Dict[str, List[dict]] = defaultdict(list)
+        self._chunk_numbers: Counter = Counter()
+        self._lock = threading.Lock()
+        self._queue = queue.Queue()
+        self._thread = None
+        self.stats = {'records': 0, 'chunks': 0, 'errors': 0, 'last_write_ms': 0.0}
+
+    def start_session(self, session_id: Optional[int] = None):
+        """Write out the previous session's partial chunks and start a new file series"""
+        self.flush()
+        with self._lock:
+            self.session_id = session_id or int(time.time() * 1000)
+            self._chunk_numbers.clear()
+
+    def record(self, kind: str, **values):
+        """Buffer one record; unknown fields are dropped and missing ones get the schema default"""
+        if not self.enabled:
+            return
+        values.setdefault('ts', time.time())
+        with self._lock:
+            values['session_id'] = self.session_id
+            buffer = self._buffers[kind]
+            buffer.append(values)
+            self.stats['records'] += 1
+            if len(buffer) >= self.chunk_rows:
+                self._hand_off(kind)
+
+    def flush(self):
+        """Hand every non-empty buffer to the writer"""
+        with self._lock:
+            for kind in list(self._buffers):
+                if self._buffers[kind]:
+                    self._hand_off(kind)
+
+    def _hand_off(self, kind: str):
+        rows, self._buffers[kind] = self._buffers[kind], []
+        self._chunk_numbers[(self.session_id, kind)] += 1
+        name = f"{self.session_id}_{kind}_{self._chunk_numbers[(self.session_id, kind)]:05d}.{self.format}"
+        self._queue.put((os.path.join(self.directory, name), kind, rows))
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="telemetry-writer", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            path, kind, rows = item
+            start = time.perf_counter()
+            try:
+                os.makedirs(self.directory, exist_ok=True)
+                columns = {name: [row.get(name, _DEFAULTS[dtype[0]]) for row in rows]
+                           for name, dtype in SCHEMAS[kind]}
+                write_chunk(path, kind, columns, self.format)
+                self.stats['chunks'] += 1
+                self.stats['last_write_ms'] = (time.perf_counter() - start) * 1000
+            except Exception as e:
+                self.stats['errors'] += 1
+                print(f"❌ Telemetry write failed ({os.path.basename(path)}): {e}")
+
+    def close(self):
+        """Write partial chunks and stop the writer thread"""
+        self.flush()
+        with self._lock:
+            thread = self._thread
+        if thread is not None and thread.is_alive():
+            self._queue.put(None)
+            thread.join(timeout=5)
+
+
+def summarize(directory: str, days: Optional[float] = None) -> int:
+    """Print cast timing, success rate by hour and OCR latency for a telemetry directory"""
+    paths = sorted(glob.glob(os.path.join(directory, '*.parquet')) + glob.glob(os.path.join(directory, '*.npz')))
+    if not paths:
+        print(f"❌ No telemetry files in {directory}")
+        return 1
+
+    since = time.time() - days * 86400 if days else None
+    cast_columns = ['ts', 'session_id', 'outcome', 'cast_to_bite_s', 'control_s']
+    ocr_columns = ['ts', 'engine', 'latency_ms']
+    casts = defaultdict(list)
+    ocr = defaultdict(list)
+    for path in paths:
+        kind = chunk_kind(path)
+        if kind == 'cast':
+            target, columns = casts, cast_columns
+        elif kind == 'ocr':
+            target, columns = ocr, ocr_columns
+        else:
+            continue
+        try:
+            chunk = read_chunk(path, columns)
+        except Exception as e:
+            print(f"⚠️ Skipping {os.path.basename(path)}: {e}")
+            continue
+        keep = [i for i, ts in enumerate(chunk['ts']) if since is None or ts >= since]
+        for name in columns:
+            target[name].extend(chunk[name][i] for i in keep)
+
+    def valid(values):
+        return [v for v in values if v == v]
+
+    total = len(casts['ts'])
+    print(f"📊 Telemetry: {len(paths)} files, {len(set(casts['session_id']))} sessions, {total} casts")
+    if total:
+        first = datetime.datetime.fromtimestamp(min(casts['ts'])).strftime('%Y-%m-%d %H:%M')
+        last = datetime.datetime.fromtimestamp(max(casts['ts'])).strftime('%Y-%m-%d %H:%M')
+        outcomes = Counter(casts['outcome'])
+        print(f"   {first} → {last} | success rate {outcomes['catch'] / total * 100:.1f}% | "
+              + ", ".join(f"{name} {count}" for name, count in outcomes.most_common()))
+        bite = valid(casts['cast_to_bite_s'])
+        control = valid([c for c, o in zip(casts['control_s'], casts['outcome']) if o == 'catch'])
+        if bite:
+            print(f"   Cast to bite: p50 {percentile(bite, 50):.1f}s, p95 {percentile(bite, 95):.1f}s")
+        if control:
+            print(f"   Control (catches): p50 {percentile(control, 50):.1f}s, p95 {percentile(control, 95):.1f}s")
+
+        by_hour = defaultdict(Counter)
+        for ts, outcome in zip(casts['ts'], casts['outcome']):
+            counts = by_hour[datetime.datetime.fromtimestamp(ts).hour]
+            counts['casts'] += 1
+            counts['catches'] += outcome == 'catch'
+        print("   Hour | casts | success")
+        for hour in sorted(by_hour):
+            counts = by_hour[hour]
+            print(f"   {hour:02d}:00 | {counts['casts']:5d} | {counts['catches'] / counts['casts'] * 100:6.1f}%")
+
+    if ocr['ts']:
+        latencies = defaultdict(list)
+        for engine, latency in zip(ocr['engine'], ocr['latency_ms']):
+            latencies[engine].append(latency)
+        print(f"🔍 OCR: {len(ocr['ts'])} reads")
+        for engine, values in sorted(latencies.items()):
+            values = valid(values)
+            if values:
+                print(f"   {engine}: {len(values)} reads, p50 {percentile(values, 50):.0f}ms, "
+                      f"p95 {percentile(values, 95):.0f}ms")
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Summarize fishing telemetry files")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    summary = subparsers.add_parser('summarize', help="summarize a directory of session files")
+    summary.add_argument('directory', nargs='?', default=DEFAULT_TELEMETRY_DIR)
+    summary.add_argument('--days', type=float, default=None, help="only records from the last N days")
+    args = parser.parse_args(argv)
+    return summarize(args.directory, args.days)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,155 @@
+"""
+Theme Styles - compiled ttk style tables with incremental application
+A theme's colors are compiled once into a table of {style: {'configure': {...}, 'map': {...}}}.
+StyleApplier remembers what it last pushed to ttk and only re-configures the
+style options whose values differ, so switching themes touches a fraction of
+the options a full re-style would.
+"""
+
+import time
+from typing import Dict, Optional
+
+FONT = 'Segoe UI'
+DARK_BG = '#0d1117'
+
+
+def compile_style_table(colors: dict) -> Dict[str, dict]:
+    """
+    Build the ttk style table for a theme's color palette
+
+    Args:
+        colors: Theme "colors" dict (bg, fg, accent, success, error, button_bg, ...)
+
+    Returns:
+        {style_name: {'configure': {option: value}, 'map': {option: [(state, value), ...]}}}
+    """
+    is_dark = colors["bg"] == DARK_BG
+    table = {}
+
+    def style(name, map_options=None, **configure):
+        table[name] = {'configure': configure, 'map': map_options or {}}
+
+    style('TFrame', background=colors["bg"], relief='flat', borderwidth=0)
+    style('TLabel', background=colors["bg"], foreground=colors["fg"], font=(FONT, 9))
+    style('TButton',
+          {'background': [('active', colors["button_hover"]), ('pressed', colors["button_hover"])],
+           'bordercolor': [('active', colors["accent"]), ('pressed', colors["accent"])]},
+          background=colors["button_bg"], foreground=colors["fg"], borderwidth=1, focuscolor='none',
+          font=(FONT, 9), relief='flat')
+
+    if is_dark:
+        style('Accent.TButton', {'background': [('active', '#2ea043'), ('pressed', '#1a7f37')]},
+              background='#238636', foreground='#ffffff', borderwidth=0, font=(FONT, 9, 'bold'))
+        style('Status.TButton', {'background': [('active', '#388bfd'), ('pressed', '#0969da')]},
+              background='#1f6feb', foreground='#ffffff', borderwidth=0, font=(FONT, 9))
+    else:
+        style('Accent.TButton', {'background': [('active', '#2c974b'), ('pressed', '#298e46')]},
+              background='#2da44e', foreground='#ffffff', borderwidth=0, font=(FONT, 9, 'bold'))
+        style('Status.TButton', {'background': [('active', '#0860ca'), ('pressed', '#0757ba')]},
+              background='#0969da', foreground='#ffffff', borderwidth=0, font=(FONT, 9))
+
+    style('TCheckbutton', {'background': [('active', colors["bg"]), ('selected', colors["bg"])]},
+          background=colors["bg"], foreground=colors["fg"], focuscolor='none', font=(FONT, 9))
+    style('TSpinbox',
+          {'fieldbackground': [('focus', colors["button_hover"])], 'bordercolor': [('focus', colors["accent"])]},
+          fieldbackground=colors["button_bg"], background=colors["button_bg"], foreground=colors["fg"],
+          bordercolor=colors["accent"], arrowcolor=colors["fg"], insertcolor=colors["fg"],
+          selectbackground=colors["accent"], selectforeground=colors["bg"], font=(FONT, 9))
+
+    if not is_dark:
+        style('TEntry', fieldbackground='#f6f8fa', background='#e1e4e8', foreground='#24292f',
+              bordercolor='#d0d7de', font=(FONT, 9))
+
+    style('Vertical.TScrollbar',
+          {'background': [('active', colors["scrollbar_active"]), ('pressed', colors["scrollbar_pressed"])]},
+          background=colors["scrollbar_bg"], troughcolor=colors["scrollbar_trough"],
+          bordercolor=colors["scrollbar_active"], arrowcolor=colors["fg"], darkcolor=colors["scrollbar_bg"],
+          lightcolor=colors["scrollbar_active"])
+
+    style('Title.TLabel', background=colors["bg"], foreground=colors["accent"], font=(FONT, 18, 'bold'))
+    style('Subtitle.TLabel', background=colors["bg"], foreground=colors["fg"], font=(FONT, 8))
+    style('SectionTitle.TLabel', background=colors["bg"], foreground=colors["accent"], font=(FONT, 11, 'bold'))
+    style('StatusOn.TLabel', background=colors["bg"], foreground=colors["success"], font=(FONT, 10, 'bold'))
+    style('StatusOff.TLabel', background=colors["bg"], foreground=colors["error"], font=(FONT, 10))
+    style('StatusInfo.TLabel', background=colors["bg"], foreground=colors["accent"], font=(FONT, 10, 'bold'))
+    style('Counter.TLabel', background=colors["bg"], foreground=colors["fg"], font=(FONT, 11, 'bold'))
+
+    style('Badge.TLabel', background='#238636', foreground='#ffffff', font=(FONT, 9, 'bold'), padding=(8, 2))
+    style('StatCard.TLabel', background=colors["button_bg"], foreground=colors["fg"], font=(FONT, 11),
+          padding=15, relief='flat')
+    style('Description.TLabel', background=colors["bg"], foreground=colors["fg"], font=(FONT, 9))
+    style('Status.TLabel', background=colors["bg"], foreground=colors["accent"], font=(FONT, 9, 'italic'))
+    style('TLabelframe', background=colors["bg"], foreground=colors["fg"], borderwidth=1,
+          bordercolor=colors["button_bg"], relief='solid')
+    style('TLabelframe.Label', background=colors["bg"], foreground=colors["accent"], font=(FONT, 10, 'bold'))
+
+    style('Tab.TButton',
+          {'background': [('active', colors["button_hover"])], 'foreground': [('active', colors["fg"])]},
+          background=colors["button_bg"], foreground=colors["fg"], borderwidth=0, relief='flat',
+          padding=[10, 15], font=(FONT, 11))
+    style('TabActive.TButton',
+          {'background': [('active', colors["accent"])], 'foreground': [('active', '#ffffff')]},
+          background=colors["accent"], foreground='#ffffff', borderwidth=0, relief='flat',
+          padding=[10, 15], font=(FONT, 11, 'bold'))
+    return table
+
+
+def diff_style_tables(old: Optional[Dict[str, dict]], new: Dict[str, dict]) -> Dict[str, dict]:
+    """Subset of new whose configure/map options differ from old (all of new if old is None)"""
+    if old is None:
+        return new
+    changes = {}
+    for name, entry in new.items():
+        previous = old.get(name, {'configure': {}, 'map': {}})
+        configure = {k: v for k, v in entry['configure'].items() if previous['configure'].get(k) != v}
+        map_options = {k: v for k, v in entry['map'].items() if previous['map'].get(k) != v}
+        if configure or map_options:
+            changes[name] = {'configure': configure, 'map': map_options}
+    return changes
+
+
+class StyleApplier:
+    """Pushes style tables to ttk, applying only the options that changed since the last apply"""
+
+    def __init__(self):
+        self._style = None
+        self._applied: Optional[Dict[str, dict]] = None
+        self.stats = {'applies': 0, 'last_options': 0, 'last_total_options': 0, 'last_apply_ms': 0.0}
+
+    def apply(self, table: Dict[str, dict]) -> int:
+        """
+        Apply a compiled style table
+
+        Returns:
+            Number of style options that were (re)configured
+        """
+        from tkinter import ttk
+
+        start = time.perf_counter()
+        if self._style is None:
+            self._style = ttk.Style()
+            self._style.theme_use('clam')
+
+        changes = diff_style_tables(self._applied, table)
+        options = 0
+        for name, entry in changes.items():
+            if entry['configure']:
+                self._style.configure(name, **entry['configure'])
+            if entry['map']:
+                self._style.map(name, **entry['map'])
+            options += len(entry['configure']) + len(entry['map'])
+
+        # Styles missing from the new table keep their old values, as a full re-style would
+        merged = dict(self._applied or {})
+        merged.update(table)
+        self._applied = merged
+
+        self.stats['applies'] += 1
+        self.stats['last_options'] = options
+        self.stats['last_total_options'] = sum(len(e['configure']) + len(e['map']) for e in table.values())
+        self.stats['last_apply_ms'] = (time.perf_counter() - start) * 1000
+        return options
+
+    def reset(self):
+        """Forget what was applied so the next apply re-configures everything"""
+        self._applied = None
@@ -1,8 +1,17 @@
 import tkinter as tk
 from tkinter import ttk
-from PIL import Image, ImageTk
 import os
 
+try:
+    from src.lazy_import import lazy_module
+    from src.theme_styles import StyleApplier, compile_style_table
+except ImportError:
+    from lazy_import import lazy_module
+    from theme_styles import StyleApplier, compile_style_table
+
+Image = lazy_module('PIL.Image')
+ImageTk = lazy_module('PIL.ImageTk')
+
 class ThemeManager:
     def __init__(self, app):
         self.app = app
@@ -228,6 +237,21 @@ class ThemeManager:
                 }
             }
         }
+        self.style_tables = {}
+        self.style_applier = StyleApplier()
+        self.logo_cache = {}
+    
+    def get_style_table(self, theme_key):
+        """Compiled ttk style table for a theme (compiled once, then cached)"""
+        table = self.style_tables.get(theme_key)
+        if table is None:
+            table = compile_style_table(self.themes[theme_key]["colors"])
+            self.style_tables[theme_key] = table
+        return table
+    
+    def apply_styles(self, theme_key):
+        """Apply a theme's ttk styles, re-configuring only options that differ from the current theme"""
+        return self.style_applier.apply(self.get_style_table(theme_key))
     
     def open_theme_window(self):
         """Open the modern theme selection window"""
@@ -455,9 +479,11 @@ class ThemeManager:
             self.app.theme_window.destroy()
             self.app.theme_window = None
     
-    def load_logo_for_theme(self, theme_key):
-        """Load the logo for the theme - always use icon.webp"""
+    def load_logo_for_theme(self, theme_key, size=64):
+        """Load the logo for the theme - always use icon.webp (decoded once per size, then cached)"""
         import sys
+        if size in self.logo_cache:
+            return self.logo_cache[size]
         try:
                                                                           
             if hasattr(sys, '_MEIPASS'):
@@ -469,8 +495,9 @@ class ThemeManager:
             
             if os.path.exists(logo_path):
                 image = Image.open(logo_path)
-                image = image.resize((64, 64), Image.Resampling.LANCZOS)
-                return ImageTk.PhotoImage(image)
+                image = image.resize((size, size), Image.Resampling.LANCZOS)
+                self.logo_cache[size] = ImageTk.PhotoImage(image)
+                return self.logo_cache[size]
             else:
                 print(f"Logo not found at: {logo_path}")
         except Exception as e:
@@ -0,0 +1,104 @@
+"""
+UI Bus - thread-safe hand-off of UI updates to the Tk thread
+Worker threads post typed events; the Tk thread drains them on a fixed cadence.
+Coalescing event kinds keep only their latest payload, so a burst of stats
+updates costs one redraw instead of one after(0) callback each.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Tuple
+
+DEFAULT_DRAIN_INTERVAL_MS = 50
+
+
+class UIBus:
+    """Event queue drained on the Tk thread"""
+
+    def __init__(self, root, interval_ms: int = DEFAULT_DRAIN_INTERVAL_MS):
+        """
+        Args:
+            root: Tk root used to schedule the drain loop
+            interval_ms: Drain cadence in milliseconds
+        """
+        self.root = root
+        self.interval_ms = interval_ms
+        self._handlers: Dict[str, Tuple[Callable, bool]] = {}
+        self._pending = OrderedDict()
+        self._lock = threading.Lock()
+        self._sequence = 0
+        self._running = False
+        self.stats = {'posted': 0, 'applied': 0, 'coalesced': 0, 'errors': 0, 'max_batch': 0, 'drain_ms': 0.0}
+
+    def register(self, kind: str, handler: Callable, coalesce: bool = True):
+        """
+        Register the Tk-thread handler for an event kind
+
+        Args:
+            kind: Event name
+            handler: Called with the payload (or no arguments if the payload is None)
+            coalesce: Keep only the latest pending event of this kind
+        """
+        self._handlers[kind] = (handler, coalesce)
+
+    def post(self, kind: str, payload=None):
+        """Queue an event from any thread"""
+        handler = self._handlers.get(kind)
+        if handler is None:
+            raise KeyError(f"No UI handler registered for '{kind}'")
+        with self._lock:
+            self.stats['posted'] += 1
+            if handler[1]:
+                if kind in self._pending:
+                    self.stats['coalesced'] += 1
+                self._pending[kind] = (kind, payload)
+            else:
+                self._sequence += 1
+                self._pending[(kind, self._sequence)] = (kind, payload)
+
+    def start(self):
+        """Start draining on the Tk thread (call from the Tk thread)"""
+        if self._running:
+            return
+        self._running = True
+        self.root.after(self.interval_ms, self._drain_loop)
+
+    def stop(self):
+        self._running = False
+
+    def _drain_loop(self):
+        if not self._running:
+            return
+        try:
+            self.drain()
+        finally:
+            self.root.after(self.interval_ms, self._drain_loop)
+
+    def drain(self) -> int:
+        """Apply all pending events now (Tk thread only)"""
+        with self._lock:
+            if not self._pending:
+                return 0
+            batch, self._pending = list(self._pending.values()), OrderedDict()
+
+        start = time.perf_counter()
+        for kind, payload in batch:
+            handler = self._handlers[kind][0]
+            try:
+                if payload is None:
+                    handler()
+                else:
+                    handler(payload)
+                self.stats['applied'] += 1
+            except Exception as e:
+                self.stats['errors'] += 1
+                print(f"⚠️ UI update '{kind}' failed: {e}")
+        self.stats['drain_ms'] += (time.perf_counter() - start) * 1000
+        self.stats['max_batch'] = max(self.stats['max_batch'], len(batch))
+        return len(batch)
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            pending = len(self._pending)
+        return dict(self.stats, pending=pending)
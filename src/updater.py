@@ -5,12 +5,18 @@ import json
 import threading
 import tkinter as tk
 from tkinter import ttk, messagebox
-import requests
 import zipfile
 import tempfile
 import shutil
 from datetime import datetime
 
+try:
+    from src.lazy_import import lazy_module
+except ImportError:
+    from lazy_import import lazy_module
+
+requests = lazy_module('requests')
+
 class UpdateManager:
     def __init__(self, app):
         self.app = app
@@ -1,9 +1,122 @@
 from datetime import datetime
 
+import os
+import threading
+
+try:
+    from src.webhook_dispatcher import WebhookDispatcher
+    from src.webhook_digest import WebhookDigest
+    from src.webhook_attachments import AttachmentEncoder
+except ImportError:
+    from webhook_dispatcher import WebhookDispatcher
+    from webhook_digest import WebhookDigest
+    from webhook_attachments import AttachmentEncoder
+
 class WebhookManager:
     def __init__(self, app):
         self.app = app
         self.devil_fruit_count = 0                             
+        self.dispatcher = WebhookDispatcher()
+        self.digest = WebhookDigest()
+        self.attachments = AttachmentEncoder()
+        self._digest_timer = None
+        self._digest_lock = threading.Lock()
+    
+    def digest_enabled(self):
+        return bool(getattr(self.app, 'webhook_digest_enabled', False))
+    
+    def _dispatch(self, payload, kind, success_message, coalesce_key=None, priority="normal", frame=None):
+        """
+        Queue a payload for background delivery so callers never wait on Discord
+        
+        Args:
+            priority: "normal" events are buffered in digest mode, "high" events flush the
+                      digest immediately, "immediate" events always bypass the digest
+            frame: Optional screenshot shown in the first embed when attachments are enabled;
+                   it is encoded on a worker thread before the payload is queued (buffered
+                   events carry it into the digest message)
+        """
+        if frame is not None and getattr(self.app, 'webhook_attachments_enabled', False):
+            max_bytes = int(getattr(self.app, 'webhook_attachment_max_kb', 256)) * 1024
+            quality = int(getattr(self.app, 'webhook_attachment_quality', 80))
+            self.attachments.submit(
+                frame, kind,
+                lambda attachment: self._route(payload, kind, success_message, coalesce_key, priority, attachment),
+                max_bytes, quality)
+            return
+        self._route(payload, kind, success_message, coalesce_key, priority)
+    
+    def _route(self, payload, kind, success_message, coalesce_key=None, priority="normal", attachment=None):
+        """Send a payload now, or buffer it in the digest"""
+        files = []
+        if attachment:
+            payload["embeds"][0]["image"] = {"url": f"attachment://{attachment['filename']}"}
+            files = [attachment]
+        
+        if self.digest_enabled() and priority != "immediate":
+            if priority == "high":
+                self.flush_digest(urgent=payload["embeds"], success_message=success_message, files=files)
+            else:
+                for i, embed in enumerate(payload["embeds"]):
+                    dropped = self.digest.add(kind, embed, files if i == 0 else None)
+                    if dropped:
+                        print(f"⚠️ {kind.capitalize()} screenshot dropped - digest is full")
+                        self._discard(dropped)
+                self._schedule_digest()
+                print(f"📥 {kind.capitalize()} event added to webhook digest")
+            return
+        self.dispatcher.enqueue(self.app.webhook_url, payload, kind, success_message, coalesce_key, files)
+    
+    def _schedule_digest(self):
+        """Start the window timer if none is running"""
+        self.digest.start_window(self.app.fish_count)
+        with self._digest_lock:
+            if self._digest_timer is not None:
+                return
+            self.digest.window = max(60.0, float(getattr(self.app, 'webhook_digest_minutes', 5)) * 60.0)
+            self._digest_timer = threading.Timer(self.digest.window, self.flush_digest)
+            self._digest_timer.daemon = True
+            self._digest_timer.start()
+    
+    def flush_digest(self, urgent=None, success_message=None, files=None):
+        """Send everything buffered in the digest (plus any urgent embeds) now"""
+        with self._digest_lock:
+            if self._digest_timer is not None:
+                self._digest_timer.cancel()
+                self._digest_timer = None
+        
+        if not self.app.webhook_url:
+            return
+        try:
+            payloads = self.digest.build(self.app.fish_count, "GPO Autofish Bot", urgent, urgent_files=files)
+            for i, (payload, payload_files) in enumerate(payloads):
+                message = success_message if urgent and i == 0 else f"📊 Webhook digest sent ({len(payload['embeds'])} embeds)"
+                self.dispatcher.enqueue(self.app.webhook_url, payload, "digest", message, files=payload_files)
+        except Exception as e:
+            print(f"❌ Webhook digest error: {e}")
+    
+    @staticmethod
+    def _discard(files):
+        for attachment in files:
+            try:
+                os.remove(attachment['path'])
+            except OSError:
+                pass
+    
+    def close(self):
+        """Send any pending digest and stop the dispatcher; undelivered events stay in the outbox for the next run"""
+        self.attachments.close()
+        if not self.digest.is_empty():
+            self.flush_digest()
+        else:
+            with self._digest_lock:
+                if self._digest_timer is not None:
+                    self._digest_timer.cancel()
+                    self._digest_timer = None
+        self.dispatcher.close()
+    
+    def get_stats(self):
+        return dict(self.dispatcher.get_stats(), digest=self.digest.get_stats(), attachments=self.attachments.get_stats())
     
     def send_fishing_progress(self):
         if not self.app.webhook_url or not self.app.webhook_enabled:
@@ -12,10 +125,12 @@ class WebhookManager:
                                                           
         if not getattr(self.app, 'fish_progress_webhook_enabled', True):
             return
+        
+        if self.digest_enabled():
+            self._schedule_digest()
+            return
             
         try:
-            import requests
-            
             embed = {
                 "title": "🎣 GPO Autofish Progress",
                 "description": f"Successfully caught **{self.app.webhook_interval}** fish!",
@@ -29,17 +144,12 @@ class WebhookManager:
             }
             
             payload = {"embeds": [embed], "username": "GPO Autofish Bot"}
-            response = requests.post(self.app.webhook_url, json=payload, timeout=10)
-            
-            if response.status_code == 204:
-                print(f"✅ Webhook sent: {self.app.webhook_interval} fish caught!")
-            else:
-                print(f"❌ Webhook failed: {response.status_code}")
-                
+            self._dispatch(payload, "progress", f"✅ Webhook sent: {self.app.webhook_interval} fish caught!",
+                           coalesce_key="progress")
         except Exception as e:
             print(f"❌ Webhook error: {e}")
 
-    def send_fruit_spawn(self, fruit_name):
+    def send_fruit_spawn(self, fruit_name, frame=None):
         """Send webhook notification for devil fruit spawns"""
         if not self.app.webhook_url or not self.app.webhook_enabled:
             return
@@ -49,8 +159,6 @@ class WebhookManager:
             return
             
         try:
-            import requests
-            
             embed = {
                 "title": "🌟 Devil Fruit Spawned!",
                 "description": f"A **{fruit_name}** devil fruit has spawned in the world!",
@@ -64,13 +172,8 @@ class WebhookManager:
             }
             
             payload = {"embeds": [embed], "username": "GPO Autofish Bot"}
-            response = requests.post(self.app.webhook_url, json=payload, timeout=10)
-            
-            if response.status_code == 204:
-                print(f"🌟 Fruit spawn webhook sent: {fruit_name}")
-            else:
-                print(f"❌ Fruit spawn webhook failed: {response.status_code}")
-                
+            self._dispatch(payload, "fruit spawn", f"🌟 Fruit spawn webhook sent: {fruit_name}", priority="high",
+                           frame=frame)
         except Exception as e:
             print(f"❌ Fruit spawn webhook error: {e}")
     
@@ -87,8 +190,6 @@ class WebhookManager:
         self.devil_fruit_count += 1
             
         try:
-            import requests
-            
                                                           
             description = "Devil fruit detected and stored!"
             if drop_info and drop_info.get('ocr_text'):
@@ -118,13 +219,9 @@ class WebhookManager:
                 })
             
             payload = {"embeds": [embed], "username": "GPO Autofish Bot"}
-            response = requests.post(self.app.webhook_url, json=payload, timeout=10)
-            
-            if response.status_code == 204:
-                print(f"🍎 Devil fruit webhook sent! Total: {self.devil_fruit_count}")
-            else:
-                print(f"❌ Devil fruit webhook failed: {response.status_code}")
-                
+            priority = "high" if drop_info and drop_info.get('is_legendary') else "normal"
+            self._dispatch(payload, "devil fruit", f"🍎 Devil fruit webhook sent! Total: {self.devil_fruit_count}",
+                           priority=priority, frame=drop_info.get('frame') if drop_info else None)
         except Exception as e:
             print(f"❌ Devil fruit webhook error: {e}")
     
@@ -139,8 +236,6 @@ class WebhookManager:
             return
             
         try:
-            import requests
-            
             embed = {
                 "title": "🛒 GPO Autofish - Auto Purchase",
                 "description": f"Successfully purchased **{amount}** bait!",
@@ -155,13 +250,7 @@ class WebhookManager:
             }
             
             payload = {"embeds": [embed], "username": "GPO Autofish Bot"}
-            response = requests.post(self.app.webhook_url, json=payload, timeout=10)
-            
-            if response.status_code == 204:
-                print(f"✅ Purchase webhook sent: Bought {amount} bait!")
-            else:
-                print(f"❌ Purchase webhook failed: {response.status_code}")
-                
+            self._dispatch(payload, "purchase", f"✅ Purchase webhook sent: Bought {amount} bait!")
         except Exception as e:
             print(f"❌ Purchase webhook error: {e}")
     
@@ -175,8 +264,6 @@ class WebhookManager:
             return
             
         try:
-            import requests
-            
                                        
             qty_display = []
             for bait, qty in remaining_quantities.items():
@@ -196,13 +283,7 @@ class WebhookManager:
             }
             
             payload = {"embeds": [embed], "username": "GPO Autofish Bot"}
-            response = requests.post(self.app.webhook_url, json=payload, timeout=10)
-            
-            if response.status_code == 204:
-                print(f"🎣 Bait depletion webhook sent: {bait_type} bait depleted!")
-            else:
-                print(f"❌ Bait depletion webhook failed: {response.status_code}")
-                
+            self._dispatch(payload, "bait depletion", f"🎣 Bait depletion webhook sent: {bait_type} bait depleted!")
         except Exception as e:
             print(f"❌ Bait depletion webhook error: {e}")
     
@@ -216,8 +297,6 @@ class WebhookManager:
             return
             
         try:
-            import requests
-            
             embed = {
                 "title": "🛒 Auto Purchase Triggered",
                 "description": f"Auto purchase activated: {reason}",
@@ -233,13 +312,7 @@ class WebhookManager:
             }
             
             payload = {"embeds": [embed], "username": "GPO Autofish Bot"}
-            response = requests.post(self.app.webhook_url, json=payload, timeout=10)
-            
-            if response.status_code == 204:
-                print(f"🛒 Auto purchase trigger webhook sent: {reason}")
-            else:
-                print(f"❌ Auto purchase trigger webhook failed: {response.status_code}")
-                
+            self._dispatch(payload, "auto purchase trigger", f"🛒 Auto purchase trigger webhook sent: {reason}")
         except Exception as e:
             print(f"❌ Auto purchase trigger webhook error: {e}")
 
@@ -252,8 +325,6 @@ class WebhookManager:
             return
             
         try:
-            import requests
-            
             if recovery_info["recovery_number"] == 1:
                 color = 0xffff00
             elif recovery_info["recovery_number"] <= 3:
@@ -284,13 +355,9 @@ class WebhookManager:
                 })
             
             payload = {"embeds": [embed], "username": "GPO Autofish Recovery Bot"}
-            response = requests.post(self.app.webhook_url, json=payload, timeout=10)
-            
-            if response.status_code == 204:
-                print(f"✅ Recovery webhook sent: Recovery #{recovery_info['recovery_number']}")
-            else:
-                print(f"❌ Recovery webhook failed: {response.status_code}")
-                
+            priority = "high" if recovery_info["recovery_number"] > 3 else "normal"
+            self._dispatch(payload, "recovery", f"✅ Recovery webhook sent: Recovery #{recovery_info['recovery_number']}",
+                           priority=priority)
         except Exception as e:
             print(f"❌ Recovery webhook error: {e}")
     
@@ -300,8 +367,6 @@ class WebhookManager:
             return
             
         try:
-            import requests
-            
             embed = {
                 "title": "🧪 GPO Autofish Test",
                 "description": "Webhook test successful! ✅",
@@ -312,12 +377,6 @@ class WebhookManager:
             }
             
             payload = {"embeds": [embed], "username": "GPO Autofish Bot"}
-            response = requests.post(self.app.webhook_url, json=payload, timeout=10)
-            
-            if response.status_code == 204:
-                print("✅ Test webhook sent successfully!")
-            else:
-                print(f"❌ Test webhook failed: {response.status_code}")
-                
+            self._dispatch(payload, "test", "✅ Test webhook sent successfully!", priority="immediate")
         except Exception as e:
             print(f"❌ Test webhook error: {e}")
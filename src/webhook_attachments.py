@@ -0,0 +1,166 @@
+"""
+Webhook Attachments for fruit screenshots
+Encodes drop/spawn frames to WebP (PNG fallback) within a byte budget on a worker
+thread and stores them next to the webhook outbox until they are uploaded.
+"""
+
+import os
+import threading
+import time
+import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
+
+DEFAULT_ATTACHMENT_DIR = "webhook_attachments"
+MIN_ATTACHMENT_WIDTH = 160
+
+
+def encode_frame(frame, max_bytes: int = 256 * 1024, quality: int = 80, max_width: int = 1280) -> Optional[dict]:
+    """
+    Encode a frame to the smallest acceptable image within a byte budget
+    WebP quality is lowered first, then the image is downscaled; PNG is used when
+    OpenCV was built without WebP support.
+
+    Args:
+        frame: BGRA/BGR/gray numpy array
+        max_bytes: Byte budget for the encoded image
+        quality: Starting WebP quality (1-100)
+        max_width: Frames wider than this are downscaled before encoding
+
+    Returns:
+        Dict with data, format, width, height, bytes and encode_ms, or None if the
+        frame cannot be brought under the budget
+    """
+    import cv2
+
+    start = time.perf_counter()
+    if frame is None or frame.size == 0:
+        return None
+    if frame.ndim == 3 and frame.shape[2] == 4:
+        frame = cv2.cvtColor(frame, cv2.COLOR_BGRA2BGR)
+    if frame.shape[1] > max_width:
+        scale = max_width / frame.shape[1]
+        frame = cv2.resize(frame, (max_width, max(1, int(frame.shape[0] * scale))), interpolation=cv2.INTER_AREA)
+
+    def encode(ext, params):
+        try:
+            ok, buffer = cv2.imencode(ext, frame, params)
+        except cv2.error:
+            return None
+        return buffer.tobytes() if ok else None
+
+    qualities = sorted({quality, min(quality, 60), min(quality, 40)}, reverse=True)
+    webp_supported = True
+    while True:
+        candidates = []
+        if webp_supported:
+            for q in qualities:
+                data = encode('.webp', [cv2.IMWRITE_WEBP_QUALITY, q])
+                if data is None:
+                    webp_supported = False
+                    break
+                candidates.append(('webp', data))
+                if len(data) <= max_bytes:
+                    break
+        if not webp_supported:
+            data = encode('.png', [cv2.IMWRITE_PNG_COMPRESSION, 9])
+            if data is not None:
+                candidates.append(('png', data))
+
+        if candidates and len(candidates[-1][1]) <= max_bytes:
+            fmt, data = candidates[-1]
+            return {
+                'data': data,
+                'format': fmt,
+                'width': frame.shape[1],
+                'height': frame.shape[0],
+                'bytes': len(data),
+                'encode_ms': (time.perf_counter() - start) * 1000
+            }
+        if not candidates or frame.shape[1] * 3 // 4 < MIN_ATTACHMENT_WIDTH:
+            return None
+        frame = cv2.resize(frame, (frame.shape[1] * 3 // 4, max(1, frame.shape[0] * 3 // 4)), interpolation=cv2.INTER_AREA)
+
+
+class AttachmentEncoder:
+    """Single worker thread that encodes screenshots and writes them for upload"""
+
+    def __init__(self, directory: str = DEFAULT_ATTACHMENT_DIR, history: int = 100):
+        self.directory = directory
+        self._executor = None
+        self._lock = threading.Lock()
+        self.records = deque(maxlen=history)
+        self.stats = {'encoded': 0, 'over_budget': 0, 'errors': 0, 'bytes': 0, 'encode_ms': 0.0}
+
+    def submit(self, frame, kind: str, callback: Callable[[Optional[dict]], None], max_bytes: int = 256 * 1024,
+               quality: int = 80):
+        """
+        Encode a frame in the background
+
+        Args:
+            frame: numpy array (copied, so the caller may reuse its buffer)
+            kind: Event label recorded with the encode statistics
+            callback: Called on the worker with a file dict (path, filename, content_type)
+                      or None when encoding failed or went over budget
+        """
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="webhook-encode")
+            executor = self._executor
+        executor.submit(self._encode, frame.copy(), kind, callback, max_bytes, quality)
+
+    def _encode(self, frame, kind, callback, max_bytes, quality):
+        attachment = None
+        try:
+            result = encode_frame(frame, max_bytes, quality)
+            if result is None:
+                self.stats['over_budget'] += 1
+                print(f"⚠️ {kind.capitalize()} screenshot could not fit in {max_bytes // 1024} KB - sending without it")
+            else:
+                os.makedirs(self.directory, exist_ok=True)
+                filename = f"{kind.replace(' ', '_')}_{uuid.uuid4().hex[:8]}.{result['format']}"
+                path = os.path.join(self.directory, filename)
+                with open(path, 'wb') as f:
+                    f.write(result['data'])
+
+                self.stats['encoded'] += 1
+                self.stats['bytes'] += result['bytes']
+                self.stats['encode_ms'] += result['encode_ms']
+                self.records.append({
+                    'kind': kind,
+                    'format': result['format'],
+                    'width': result['width'],
+                    'height': result['height'],
+                    'bytes': result['bytes'],
+                    'encode_ms': result['encode_ms'],
+                    'time': time.time()
+                })
+                print(f"🖼️ {kind.capitalize()} screenshot: {result['bytes'] / 1024:.1f} KB {result['format'].upper()} "
+                      f"{result['width']}x{result['height']} in {result['encode_ms']:.1f}ms")
+                attachment = {'path': path, 'filename': filename, 'content_type': f"image/{result['format']}"}
+        except Exception as e:
+            self.stats['errors'] += 1
+            print(f"⚠️ {kind.capitalize()} screenshot encode error: {e}")
+
+        try:
+            callback(attachment)
+        except Exception as e:
+            print(f"❌ {kind.capitalize()} webhook error: {e}")
+
+    def close(self):
+        """Finish pending encodes and stop the worker"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def get_stats(self) -> dict:
+        """Encode totals and averages"""
+        encoded = self.stats['encoded']
+        return dict(
+            self.stats,
+            avg_bytes=self.stats['bytes'] / encoded if encoded else 0,
+            avg_encode_ms=self.stats['encode_ms'] / encoded if encoded else 0.0,
+            last=self.records[-1] if self.records else None
+        )
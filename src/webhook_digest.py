@@ -0,0 +1,179 @@
+"""
+Webhook Digest for batching notifications into periodic summary messages
+Routine events are buffered for a time window and sent as one message: a summary
+embed with totals and rates followed by the notable event embeds, packed up to
+Discord's 10 embeds (and 6000 characters) per message. Screenshots attached to
+buffered events travel with their embed into whichever message it lands in.
+"""
+
+import threading
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+MAX_EMBEDS_PER_MESSAGE = 10
+MAX_EMBED_CHARS_PER_MESSAGE = 6000
+
+
+def embed_size(embed: dict) -> int:
+    """Characters Discord counts towards the per-message embed limit"""
+    size = len(embed.get('title', '')) + len(embed.get('description', ''))
+    size += len(embed.get('footer', {}).get('text', '')) + len(embed.get('author', {}).get('name', ''))
+    for field in embed.get('fields', []):
+        size += len(field.get('name', '')) + len(field.get('value', ''))
+    return size
+
+
+def attachment_name(embed: dict) -> Optional[str]:
+    """Filename an embed's image refers to, if it is an uploaded attachment"""
+    url = embed.get('image', {}).get('url', '')
+    return url[len('attachment://'):] if url.startswith('attachment://') else None
+
+
+def pack_embeds(embeds: List[dict], username: str) -> List[dict]:
+    """
+    Split embeds into as few webhook payloads as Discord's limits allow
+
+    Returns:
+        List of payloads, each with at most MAX_EMBEDS_PER_MESSAGE embeds
+    """
+    payloads = []
+    current, current_size = [], 0
+    for embed in embeds:
+        size = embed_size(embed)
+        if current and (len(current) >= MAX_EMBEDS_PER_MESSAGE or current_size + size > MAX_EMBED_CHARS_PER_MESSAGE):
+            payloads.append({"embeds": current, "username": username})
+            current, current_size = [], 0
+        current.append(embed)
+        current_size += size
+    if current:
+        payloads.append({"embeds": current, "username": username})
+    return payloads
+
+
+class WebhookDigest:
+    """Buffers webhook events for one window and builds the digest messages"""
+
+    def __init__(self, window: float = 300.0, max_notable: int = 27):
+        """
+        Args:
+            window: Seconds between digests
+            max_notable: Event embeds kept per window; extra events are only counted
+        """
+        self.window = window
+        self.max_notable = max_notable
+        self._lock = threading.Lock()
+        self._reset(None, time.time())
+        self.stats = {'digests': 0, 'events': 0, 'messages': 0, 'urgent_flushes': 0,
+                      'attachments': 0, 'attachments_dropped': 0}
+
+    def _reset(self, fish_count: Optional[int], now: float):
+        self.window_start = now
+        self.fish_at_start = fish_count
+        self.counts = {}
+        self.notable = []
+        self.files: Dict[str, dict] = {}
+        self.suppressed = 0
+
+    def start_window(self, fish_count: int):
+        """Anchor the fish counter for rate calculations if this window has no anchor yet"""
+        with self._lock:
+            if self.fish_at_start is None:
+                self.fish_at_start = fish_count
+
+    def add(self, kind: str, embed: Optional[dict] = None, files: Optional[List[dict]] = None) -> List[dict]:
+        """
+        Buffer an event
+
+        Args:
+            kind: Event label used for the per-kind totals
+            embed: Embed shown in the digest (None to only count the event)
+            files: Attachments the embed refers to (attachment://<filename>)
+
+        Returns:
+            Attachments that were not kept because the embed was suppressed; the caller owns them
+        """
+        files = list(files or [])
+        with self._lock:
+            self.counts[kind] = self.counts.get(kind, 0) + 1
+            self.stats['events'] += 1
+            if embed is None:
+                return files
+            if len(self.notable) < self.max_notable:
+                self.notable.append(embed)
+                self.files.update((attachment['filename'], attachment) for attachment in files)
+                self.stats['attachments'] += len(files)
+                return []
+            self.suppressed += 1
+            self.stats['attachments_dropped'] += len(files)
+            return files
+
+    def is_empty(self) -> bool:
+        with self._lock:
+            return not self.counts
+
+    def build(self, fish_count: int, username: str, urgent: Optional[List[dict]] = None,
+              now: Optional[float] = None, urgent_files: Optional[List[dict]] = None) -> List[Tuple[dict, List[dict]]]:
+        """
+        Build the digest payloads and start a new window
+
+        Args:
+            fish_count: Current total fish caught
+            username: Webhook username
+            urgent: High-priority embeds that triggered an early flush (placed first)
+            urgent_files: Attachments the urgent embeds refer to
+
+        Returns:
+            List of (webhook payload, attachments its embeds refer to) pairs (empty if there
+            is nothing to report)
+        """
+        now = time.time() if now is None else now
+        urgent = list(urgent or [])
+        with self._lock:
+            counts, notable, suppressed, files = self.counts, self.notable, self.suppressed, self.files
+            fish_at_start, window_start = self.fish_at_start, self.window_start
+            self._reset(fish_count, now)
+
+        fish_in_window = max(0, fish_count - fish_at_start) if fish_at_start is not None else 0
+        if not counts and not urgent and not fish_in_window:
+            return []
+
+        elapsed = max(1.0, now - window_start)
+        summary_fields = [
+            {"name": "🐟 Fish This Window", "value": str(fish_in_window), "inline": True},
+            {"name": "📈 Fish/Hour", "value": f"{fish_in_window * 3600.0 / elapsed:.0f}", "inline": True},
+            {"name": "🐟 Total Fish Caught", "value": str(fish_count), "inline": True}
+        ]
+        if counts:
+            summary_fields.append({
+                "name": "📋 Events",
+                "value": "\n".join(f"{kind.title()}: {count}" for kind, count in sorted(counts.items())),
+                "inline": False
+            })
+        if suppressed:
+            summary_fields.append({"name": "➕ Not Shown", "value": f"{suppressed} more event(s)", "inline": False})
+
+        summary = {
+            "title": "📊 GPO Autofish Digest",
+            "description": f"Summary of the last **{elapsed / 60:.0f} min**",
+            "color": 0x00bcd4,
+            "fields": summary_fields,
+            "footer": {"text": "GPO Autofish - Digest"},
+            "timestamp": datetime.utcnow().isoformat()
+        }
+
+        embeds = urgent + ([summary] if counts or fish_in_window else []) + notable
+        payloads = pack_embeds(embeds, username)
+        self.stats['digests'] += 1
+        self.stats['messages'] += len(payloads)
+        if urgent:
+            self.stats['urgent_flushes'] += 1
+
+        files = dict(files, **{attachment['filename']: attachment for attachment in urgent_files or []})
+        return [(payload, [files[name] for name in map(attachment_name, payload['embeds']) if name in files])
+                for payload in payloads]
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            buffered = sum(self.counts.values())
+        return dict(self.stats, buffered=buffered, window=self.window)
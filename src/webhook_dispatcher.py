@@ -0,0 +1,398 @@
+"""
+Webhook Dispatcher for non-blocking Discord delivery
+Events are queued by the fishing/GUI threads and posted by one background thread
+over a keep-alive requests.Session. Undelivered events are kept in an append-only
+outbox file so they are replayed after a restart.
+
+Discord rate limits are tracked per webhook from the X-RateLimit-Remaining and
+X-RateLimit-Reset-After headers, so sends are delayed until the bucket resets
+instead of being answered with 429s.
+"""
+
+import json
+import os
+import random
+import threading
+import time
+import uuid
+from collections import deque
+from typing import Optional
+
+DEFAULT_OUTBOX_FILE = "webhook_outbox.jsonl"
+
+
+class WebhookDispatcher:
+    """Background webhook sender with a bounded queue, coalescing and a persistent outbox"""
+
+    def __init__(self, outbox_path: str = DEFAULT_OUTBOX_FILE, max_queue: int = 100,
+                 max_attempts: int = 5, max_age: float = 24 * 3600, timeout: float = 10.0):
+        """
+        Args:
+            outbox_path: JSONL file holding undelivered events (None disables persistence)
+            max_queue: Maximum queued events; the oldest coalescable event is dropped first when full
+            max_attempts: Delivery attempts before an event is given up
+            max_age: Replayed events older than this many seconds are discarded
+            timeout: HTTP timeout per request
+        """
+        self.outbox_path = outbox_path
+        self.max_queue = max_queue
+        self.max_attempts = max_attempts
+        self.max_age = max_age
+        self.timeout = timeout
+
+        self._queue = deque()
+        self._condition = threading.Condition()
+        self._outbox_lock = threading.Lock()
+        self._outbox_records = 0
+        self._running = False
+        self._current = None
+        self._thread = None
+        self._session = None
+        self._buckets = {}
+        self._global_reset_at = 0.0
+
+        self.stats = {'queued': 0, 'sent': 0, 'failed': 0, 'coalesced': 0, 'dropped': 0, 'replayed': 0,
+                      'rate_limited': 0, 'uploaded_bytes': 0}
+
+        self._replay_outbox()
+
+    def start(self):
+        """Start the delivery thread (idempotent)"""
+        with self._condition:
+            if self._running:
+                return
+            self._running = True
+        self._thread = threading.Thread(target=self._run, name="webhook-dispatcher", daemon=True)
+        self._thread.start()
+
+    def enqueue(self, url: str, payload: dict, kind: str = "event", success_message: str = "",
+                coalesce_key: Optional[str] = None, files: Optional[list] = None) -> str:
+        """
+        Queue a webhook payload for background delivery
+
+        Args:
+            url: Discord webhook URL
+            payload: JSON payload
+            kind: Short label used in log messages
+            success_message: Printed after successful delivery
+            coalesce_key: Queued events with the same key are replaced instead of duplicated
+            files: Attachments as dicts with path, filename and content_type; the files are
+                   uploaded as multipart and deleted once the event is finished
+
+        Returns:
+            Event id
+        """
+        event = {
+            'id': uuid.uuid4().hex,
+            'url': url,
+            'payload': payload,
+            'kind': kind,
+            'message': success_message,
+            'coalesce_key': coalesce_key,
+            'files': list(files or []),
+            'created_at': time.time(),
+            'attempts': 0,
+            'not_before': 0.0
+        }
+
+        with self._condition:
+            if coalesce_key:
+                for queued in self._queue:
+                    if queued.get('coalesce_key') == coalesce_key and queued['url'] == url:
+                        self._discard_files(queued)
+                        queued.update(payload=payload, message=success_message, created_at=event['created_at'],
+                                      files=event['files'])
+                        self.stats['coalesced'] += 1
+                        self._append_outbox({'op': 'add', 'event': queued})
+                        return queued['id']
+
+            if len(self._queue) >= self.max_queue:
+                self._drop_one()
+            self._queue.append(event)
+            self.stats['queued'] += 1
+            self._append_outbox({'op': 'add', 'event': event})
+            self._condition.notify()
+
+        self.start()
+        return event['id']
+
+    def _drop_one(self):
+        victim = next((e for e in self._queue if e.get('coalesce_key')), self._queue[0])
+        self._queue.remove(victim)
+        self.stats['dropped'] += 1
+        self._finish(victim)
+        print(f"⚠️ Webhook queue full - dropped queued {victim['kind']} event")
+
+    def pending(self) -> int:
+        """Number of events waiting for delivery"""
+        with self._condition:
+            return len(self._queue) + (1 if self._current is not None else 0)
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Wait until the queue is empty or the timeout expires"""
+        deadline = time.time() + timeout
+        while self.pending() and time.time() < deadline:
+            time.sleep(0.05)
+        return not self.pending()
+
+    def close(self, timeout: float = 3.0):
+        """Give queued events a moment to send, then stop; anything left stays in the outbox"""
+        self.flush(timeout)
+        with self._condition:
+            self._running = False
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout=self.timeout)
+        if self._session is not None:
+            self._session.close()
+
+    def _ready_at(self, event: dict) -> float:
+        """Earliest time an event may be sent, given its backoff and its webhook's bucket"""
+        ready_at = max(event['not_before'], self._global_reset_at)
+        bucket = self._buckets.get(event['url'])
+        if bucket and bucket['remaining'] <= 0:
+            ready_at = max(ready_at, bucket['reset_at'])
+        return ready_at
+
+    def _next_event(self) -> Optional[dict]:
+        with self._condition:
+            while self._running:
+                now = time.time()
+                ready = next((e for e in self._queue if self._ready_at(e) <= now), None)
+                if ready is not None:
+                    self._queue.remove(ready)
+                    self._current = ready
+                    bucket = self._buckets.get(ready['url'])
+                    if bucket and bucket['reset_at'] > now:
+                        bucket['remaining'] -= 1
+                    return ready
+                wait = min((self._ready_at(e) for e in self._queue), default=now + 1.0) - now
+                self._condition.wait(timeout=max(0.05, min(wait, 1.0)))
+        return None
+
+    def _update_bucket(self, url: str, headers, now: float):
+        """Record the rate limit bucket state Discord reported for a webhook"""
+        try:
+            remaining = headers.get('X-RateLimit-Remaining')
+            reset_after = headers.get('X-RateLimit-Reset-After')
+            if remaining is None or reset_after is None:
+                return
+            with self._condition:
+                self._buckets[url] = {'remaining': int(remaining), 'reset_at': now + float(reset_after)}
+        except (TypeError, ValueError):
+            pass
+
+    def _handle_rate_limit(self, event: dict, response, now: float) -> float:
+        """
+        Apply a 429 response to the bucket (or the global limit)
+
+        Returns:
+            Seconds to wait before retrying
+        """
+        body = {}
+        try:
+            body = response.json() or {}
+        except Exception:
+            pass
+        try:
+            retry_after = float(body.get('retry_after') or response.headers.get('Retry-After') or 1.0)
+        except (TypeError, ValueError):
+            retry_after = 1.0
+        retry_after = max(0.05, retry_after)
+
+        is_global = bool(body.get('global')) or response.headers.get('X-RateLimit-Global', '').lower() == 'true'
+        with self._condition:
+            if is_global:
+                self._global_reset_at = max(self._global_reset_at, now + retry_after)
+            else:
+                self._buckets[event['url']] = {'remaining': 0, 'reset_at': now + retry_after}
+        self.stats['rate_limited'] += 1
+        return retry_after
+
+    @staticmethod
+    def _backoff(attempts: int) -> float:
+        """Exponential backoff with jitter so retries from a burst don't land together"""
+        delay = min(60.0, 2.0 ** attempts)
+        return random.uniform(delay / 2, delay)
+
+    def _run(self):
+        try:
+            while True:
+                event = self._next_event()
+                if event is None:
+                    return
+                try:
+                    self._deliver(event)
+                except Exception as e:
+                    print(f"❌ {event['kind'].capitalize()} webhook delivery error: {e}")
+                    self._retry_or_fail(event)
+                finally:
+                    with self._condition:
+                        self._current = None
+        finally:
+            # Let start() bring up a new thread if this one ever exits unexpectedly
+            with self._condition:
+                self._running = False
+
+    def _retry_or_fail(self, event: dict):
+        """Requeue an event whose delivery raised, or give it up after max_attempts"""
+        event['attempts'] = event.get('attempts', 0) + 1
+        if event['attempts'] < self.max_attempts:
+            event['not_before'] = time.time() + self._backoff(event['attempts'])
+            with self._condition:
+                self._queue.appendleft(event)
+                self._condition.notify()
+            return
+        self.stats['failed'] += 1
+        try:
+            self._finish(event)
+        except Exception as e:
+            print(f"❌ Could not update webhook outbox: {e}")
+
+    def _deliver(self, event: dict):
+        if self._session is None:
+            import requests
+            self._session = requests.Session()
+
+        status = None
+        try:
+            response = self._post(event)
+            status = response.status_code
+            self._update_bucket(event['url'], response.headers, time.time())
+        except Exception as e:
+            print(f"❌ {event['kind'].capitalize()} webhook error: {e}")
+
+        if status == 429 and time.time() - event['created_at'] < self.max_age:
+            retry_after = self._handle_rate_limit(event, response, time.time())
+            event['not_before'] = time.time() + retry_after
+            with self._condition:
+                self._queue.appendleft(event)
+                self._condition.notify()
+            print(f"⏳ {event['kind'].capitalize()} webhook rate limited - retrying in {retry_after:.1f}s")
+            return
+
+        event['attempts'] += 1
+        if status is not None and 200 <= status < 300:
+            self.stats['sent'] += 1
+            self._finish(event)
+            if event['message']:
+                print(event['message'])
+            return
+
+        retryable = status is None or status >= 500
+        if retryable and event['attempts'] < self.max_attempts:
+            event['not_before'] = time.time() + self._backoff(event['attempts'])
+            with self._condition:
+                self._queue.appendleft(event)
+                self._condition.notify()
+            if status is not None:
+                print(f"⚠️ {event['kind'].capitalize()} webhook got {status} - retry {event['attempts']}/{self.max_attempts - 1}")
+            return
+
+        self.stats['failed'] += 1
+        self._finish(event)
+        print(f"❌ {event['kind'].capitalize()} webhook failed: {status if status is not None else 'no response'}")
+
+    def _post(self, event: dict):
+        """POST an event, as JSON or as multipart when it carries attachments"""
+        files = [f for f in event.get('files', []) if os.path.exists(f['path'])]
+        if not files:
+            payload = event['payload']
+            if event.get('files'):
+                payload = dict(payload, embeds=[{k: v for k, v in embed.items() if k != 'image'}
+                                                for embed in payload.get('embeds', [])])
+            return self._session.post(event['url'], json=payload, timeout=self.timeout)
+
+        uploads = {}
+        try:
+            for i, attachment in enumerate(files):
+                uploads[f"files[{i}]"] = (attachment['filename'], open(attachment['path'], 'rb'),
+                                          attachment['content_type'])
+            self.stats['uploaded_bytes'] += sum(os.path.getsize(f['path']) for f in files)
+            return self._session.post(event['url'], data={'payload_json': json.dumps(event['payload'])},
+                                      files=uploads, timeout=self.timeout)
+        finally:
+            for _, handle, _ in uploads.values():
+                handle.close()
+
+    def _finish(self, event: dict):
+        """Mark an event done in the outbox and delete its attachments"""
+        self._append_outbox({'op': 'done', 'id': event['id']})
+        self._discard_files(event)
+
+    @staticmethod
+    def _discard_files(event: dict):
+        for attachment in event.get('files', []):
+            try:
+                os.remove(attachment['path'])
+            except OSError:
+                pass
+
+    def _append_outbox(self, record: dict):
+        if not self.outbox_path:
+            return
+        try:
+            with self._outbox_lock:
+                with open(self.outbox_path, 'a', encoding='utf-8') as f:
+                    f.write(json.dumps(record) + "\n")
+                self._outbox_records += 1
+            if record['op'] == 'done' and self._outbox_records > 4 * self.max_queue:
+                self._compact_outbox(exclude_id=record['id'])
+        except Exception as e:
+            print(f"⚠️ Could not write webhook outbox: {e}")
+
+    def _compact_outbox(self, exclude_id: Optional[str] = None):
+        """Rewrite the outbox with only the events still queued or in flight"""
+        with self._condition, self._outbox_lock:
+            pending = ([self._current] if self._current is not None else []) + list(self._queue)
+            pending = [event for event in pending if event['id'] != exclude_id]
+            temp_path = self.outbox_path + ".tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                for event in pending:
+                    f.write(json.dumps({'op': 'add', 'event': event}) + "\n")
+            os.replace(temp_path, self.outbox_path)
+            self._outbox_records = len(pending)
+
+    def _replay_outbox(self):
+        """Load undelivered events left by a previous run"""
+        if not self.outbox_path or not os.path.exists(self.outbox_path):
+            return
+        events = {}
+        try:
+            with open(self.outbox_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue
+                    if record.get('op') == 'add':
+                        events[record['event']['id']] = record['event']
+                    elif record.get('op') == 'done':
+                        events.pop(record.get('id'), None)
+        except Exception as e:
+            print(f"⚠️ Could not read webhook outbox: {e}")
+            return
+
+        cutoff = time.time() - self.max_age
+        fresh = sorted((e for e in events.values() if e.get('created_at', 0) >= cutoff), key=lambda e: e['created_at'])
+        kept = fresh[-self.max_queue:]
+        kept_ids = {event['id'] for event in kept}
+        for event in events.values():
+            if event['id'] not in kept_ids:
+                self._discard_files(event)
+        for event in kept:
+            event['not_before'] = 0.0
+            self._queue.append(event)
+        self.stats['replayed'] = len(self._queue)
+        self._compact_outbox()
+        if self._queue:
+            print(f"📬 Replaying {len(self._queue)} undelivered webhook(s) from {self.outbox_path}")
+            self.start()
+
+    def get_stats(self) -> dict:
+        """Delivery counters, queue depth and rate limit state"""
+        now = time.time()
+        with self._condition:
+            limited = sum(1 for b in self._buckets.values() if b['remaining'] <= 0 and b['reset_at'] > now)
+            global_wait = max(0.0, self._global_reset_at - now)
+        return dict(self.stats, pending=self.pending(), limited_buckets=limited, global_wait=global_wait)
@@ -0,0 +1,225 @@
+"""
+Webhook Stub - local stand-in for a Discord webhook endpoint
+Enforces a fixed-window rate limit with Discord's X-RateLimit headers, answers
+429 with a retry_after body and can add latency, so webhook delivery can be
+exercised without hitting Discord.
+
+Usage:
+    python src/webhook_stub.py [--events 30] [--limit 5] [--window 2] [--delay 0.2] [--slow-every 4]
+"""
+
+import argparse
+import email.parser
+import email.policy
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    server_version = "WebhookStub/1.0"
+
+    def do_POST(self):
+        stub = self.server.stub
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length)
+        status, headers, reply = stub.handle(self.path, body, self.headers.get('Content-Type', ''))
+
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        data = json.dumps(reply).encode('utf-8') if reply is not None else b""
+        if data:
+            self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        if data:
+            self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StubWebhookServer:
+    """Threaded HTTP server that behaves like a rate-limited Discord webhook"""
+
+    def __init__(self, limit: int = 5, window: float = 2.0, delay: float = 0.0, slow_every: int = 0,
+                 global_every: int = 0, port: int = 0):
+        """
+        Args:
+            limit: Requests accepted per window
+            window: Bucket window length in seconds
+            delay: Seconds to sleep before answering a slow request
+            slow_every: Every Nth request is slow (0 = every request when delay is set)
+            global_every: Every Nth request gets a global 429 (0 disables)
+            port: TCP port on localhost (0 picks a free one)
+        """
+        self.limit = limit
+        self.window = window
+        self.delay = delay
+        self.slow_every = slow_every
+        self.global_every = global_every
+
+        self._lock = threading.Lock()
+        self._window_start = time.time()
+        self._used = 0
+        self.payloads = []
+        self.stats = {'requests': 0, 'accepted': 0, 'rate_limited': 0, 'global_limited': 0, 'bad_requests': 0,
+                      'files': 0, 'file_bytes': 0}
+
+        self._httpd = ThreadingHTTPServer(('127.0.0.1', port), _StubHandler)
+        self._httpd.daemon_threads = True
+        self._httpd.stub = self
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/api/webhooks/0/stub"
+
+    def start(self) -> 'StubWebhookServer':
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="webhook-stub", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def handle(self, path: str, body: bytes, content_type: str = "application/json"):
+        """
+        Decide the response for one request
+
+        Returns:
+            Tuple of (status, headers dict, JSON reply or None)
+        """
+        with self._lock:
+            self.stats['requests'] += 1
+            number = self.stats['requests']
+            now = time.time()
+            if now - self._window_start >= self.window:
+                self._window_start = now
+                self._used = 0
+            reset_after = max(0.0, self.window - (now - self._window_start))
+
+            if self.global_every and number % self.global_every == 0:
+                self.stats['global_limited'] += 1
+                return 429, {'X-RateLimit-Global': 'true', 'Retry-After': f"{reset_after:.3f}"}, \
+                    {'message': "You are being rate limited.", 'retry_after': reset_after, 'global': True}
+
+            if self._used >= self.limit:
+                self.stats['rate_limited'] += 1
+                headers = self._bucket_headers(0, reset_after)
+                headers['Retry-After'] = f"{reset_after:.3f}"
+                return 429, headers, {'message': "You are being rate limited.", 'retry_after': reset_after,
+                                      'global': False}
+
+            self._used += 1
+            remaining = self.limit - self._used
+            slow = self.delay and (not self.slow_every or number % self.slow_every == 0)
+
+        if slow:
+            time.sleep(self.delay)
+
+        try:
+            payload, files = self._parse_body(body, content_type)
+        except ValueError:
+            with self._lock:
+                self.stats['bad_requests'] += 1
+            return 400, {}, {'message': "Cannot send an empty message", 'code': 50006}
+
+        with self._lock:
+            self.stats['accepted'] += 1
+            self.payloads.append(payload)
+            self.stats['files'] += len(files)
+            self.stats['file_bytes'] += sum(files.values())
+        return 204, self._bucket_headers(remaining, reset_after), None
+
+    @staticmethod
+    def _parse_body(body: bytes, content_type: str):
+        """
+        Decode a JSON or multipart (payload_json + files[n]) webhook body
+
+        Returns:
+            Tuple of (payload dict, {filename: size})
+        """
+        if not content_type.startswith('multipart/'):
+            return json.loads(body or b"{}"), {}
+
+        message = email.parser.BytesParser(policy=email.policy.HTTP).parsebytes(
+            f"Content-Type: {content_type}\r\n\r\n".encode('latin-1') + body)
+        payload, files = None, {}
+        for part in message.iter_parts():
+            name = part.get_param('name', header='content-disposition')
+            data = part.get_payload(decode=True) or b""
+            if name == 'payload_json':
+                payload = json.loads(data)
+            elif name and name.startswith('files['):
+                files[part.get_filename() or name] = len(data)
+        if payload is None:
+            raise ValueError("multipart body without payload_json")
+        return payload, files
+
+    def _bucket_headers(self, remaining: int, reset_after: float) -> dict:
+        return {
+            'X-RateLimit-Limit': str(self.limit),
+            'X-RateLimit-Remaining': str(remaining),
+            'X-RateLimit-Reset-After': f"{reset_after:.3f}",
+            'X-RateLimit-Bucket': "stub"
+        }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run a burst of webhooks against a local rate-limited stub")
+    parser.add_argument('--events', type=int, default=30, help="webhooks to send")
+    parser.add_argument('--limit', type=int, default=5, help="requests per window")
+    parser.add_argument('--window', type=float, default=2.0, help="window length in seconds")
+    parser.add_argument('--delay', type=float, default=0.0, help="response delay for slow requests")
+    parser.add_argument('--slow-every', type=int, default=0, help="every Nth request is slow")
+    parser.add_argument('--global-every', type=int, default=0, help="every Nth request gets a global 429")
+    parser.add_argument('--serve', action='store_true', help="only run the stub until interrupted")
+    args = parser.parse_args(argv)
+
+    stub = StubWebhookServer(args.limit, args.window, args.delay, args.slow_every, args.global_every)
+    with stub:
+        if args.serve:
+            print(f"🧪 Stub webhook listening on {stub.url}")
+            try:
+                while True:
+                    time.sleep(1)
+            except KeyboardInterrupt:
+                return 0
+
+        try:
+            from src.webhook_dispatcher import WebhookDispatcher
+        except ImportError:
+            from webhook_dispatcher import WebhookDispatcher
+
+        dispatcher = WebhookDispatcher(outbox_path=None, max_queue=max(100, args.events))
+        start = time.time()
+        for i in range(args.events):
+            dispatcher.enqueue(stub.url, {'content': f"event {i}"}, kind="stub")
+        windows = -(-args.events // max(1, args.limit)) - 1
+        dispatcher.flush(timeout=windows * args.window + args.events * args.delay + 30)
+        elapsed = time.time() - start
+        dispatcher.close(timeout=0)
+
+    stats = dispatcher.get_stats()
+    print(f"📊 Delivered {stub.stats['accepted']}/{args.events} in {elapsed:.1f}s "
+          f"(minimum ~{windows * args.window:.1f}s for {args.limit}/{args.window:g}s)")
+    print(f"   Stub: {stub.stats['requests']} requests, {stub.stats['rate_limited']} bucket 429s, "
+          f"{stub.stats['global_limited']} global 429s")
+    print(f"   Dispatcher: sent={stats['sent']} failed={stats['failed']} rate_limited={stats['rate_limited']}")
+    return 0 if stub.stats['accepted'] == args.events else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -36,6 +36,8 @@ class ZoomController:
                                              
         if self.app:
             self.load_settings_from_app()
+            if hasattr(self.app, 'settings_model'):
+                self.app.settings_model.subscribe(self._on_settings_changed, fields=('zoom_settings',))
         
     def is_available(self) -> bool:
         """Check if zoom control is available"""
@@ -48,10 +50,10 @@ class ZoomController:
             
         try:
                                              
-            if hasattr(self.app, 'zoom_out_var'):
-                self.zoom_settings["zoom_out_steps"] = self.app.zoom_out_var.get()
-            if hasattr(self.app, 'zoom_in_var'):
-                self.zoom_settings["zoom_in_steps"] = self.app.zoom_in_var.get()
+            if hasattr(self.app, 'settings_model'):
+                zoom_config = self.app.settings_model.snapshot().zoom_settings
+                self.zoom_settings["zoom_out_steps"] = zoom_config.get("zoom_out_steps", 5)
+                self.zoom_settings["zoom_in_steps"] = zoom_config.get("zoom_in_steps", 3)
                 
                                                
             if hasattr(self.app, 'settings') and 'zoom_settings' in self.app.settings:
@@ -66,6 +68,14 @@ class ZoomController:
         except Exception as e:
             logging.error(f"Failed to load zoom settings: {e}")
     
+    def _on_settings_changed(self, changes: dict, snapshot):
+        """Settings model subscriber: pick up zoom step changes without reading Tk variables"""
+        zoom_config = snapshot.zoom_settings
+        self.update_settings({
+            "zoom_out_steps": zoom_config.get("zoom_out_steps", self.zoom_settings["zoom_out_steps"]),
+            "zoom_in_steps": zoom_config.get("zoom_in_steps", self.zoom_settings["zoom_in_steps"])
+        })
+    
     def update_settings(self, settings: dict):
         """Update zoom settings"""
         self.zoom_settings.update(settings)